@@ -0,0 +1,163 @@
+import threading
+from collections import deque
+
+# Kebijakan saat antrian blok penuh
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+
+class BlockQueue:
+    """Antrian blok audio berkapasitas tetap dengan kebijakan overflow.
+
+    Setiap blok diberi nomor urut, sehingga konsumen bisa mengetahui
+    adanya celah (blok yang dibuang) di antara dua blok yang diterimanya.
+    """
+
+    def __init__(self, maxsize, policy="drop_oldest", block_timeout=0.05):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Kebijakan overflow tidak dikenal: {policy}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self._items = deque()
+        self._seq = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+        # Counter
+        self.enqueued_blocks = 0
+        self.dropped_blocks = 0
+
+    def put(self, block):
+        """Memasukkan blok; mengembalikan False jika blok ini yang dibuang"""
+        with self._lock:
+            if self._closed:
+                # Konsumen sudah berhenti; jangan menumpuk blok yang tak akan dibaca
+                self.dropped_blocks += 1
+                return False
+            seq = self._seq
+            self._seq += 1
+
+            if len(self._items) >= self.maxsize:
+                if self.policy == "drop_newest":
+                    self.dropped_blocks += 1
+                    return False
+                if self.policy == "drop_oldest":
+                    self._items.popleft()
+                    self.dropped_blocks += 1
+                else:
+                    # Blokir sebentar; jangan tahan callback audio tanpa batas
+                    self._not_full.wait_for(
+                        lambda: len(self._items) < self.maxsize or self._closed,
+                        timeout=self.block_timeout
+                    )
+                    if len(self._items) >= self.maxsize:
+                        self.dropped_blocks += 1
+                        return False
+
+            self._items.append((seq, block))
+            self.enqueued_blocks += 1
+            self._not_empty.notify()
+            return True
+
+    def get(self, timeout=None):
+        """Mengambil (nomor_urut, blok) atau None jika antrian ditutup/timeout"""
+        with self._lock:
+            if not self._not_empty.wait_for(
+                lambda: self._items or self._closed, timeout=timeout
+            ):
+                return None
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._not_full.notify()
+            return item
+
+    def close(self):
+        """Menutup antrian dan membangunkan semua thread yang menunggu"""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+
+class AnalysisWorker:
+    """Thread analisis yang mengonsumsi blok mentah dari BlockQueue.
+
+    on_gap(jumlah_blok_hilang) dipanggil sebelum blok pertama setelah celah.
+    Jika analyze melempar exception, worker berhenti, antrian ditutup (agar
+    produsen yang menunggu ikut bangun), lalu on_error(exception) dipanggil.
+    """
+
+    def __init__(self, block_queue, analyze, on_gap=None, on_error=None):
+        self.block_queue = block_queue
+        self.analyze = analyze
+        self.on_gap = on_gap
+        self.on_error = on_error
+        self.error = None
+        self.processed_blocks = 0
+        self.gaps = 0
+        self._expected_seq = None
+        self._thread = None
+
+    def start(self):
+        """Mulai thread analisis"""
+        self._thread = threading.Thread(target=self._run, name="analysis-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Hentikan thread analisis setelah blok yang tersisa di antrian diproses.
+
+        Mengembalikan True jika thread sudah benar-benar berhenti, False jika
+        timeout habis atau dipanggil dari thread worker itu sendiri.
+        """
+        self.block_queue.close()
+        if self._thread is None:
+            return True
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self):
+        try:
+            self._consume()
+        except Exception as e:
+            self.error = e
+            self.block_queue.close()
+            if self.on_error:
+                self.on_error(e)
+            else:
+                print(f"Analysis worker error: {e}")
+
+    def _consume(self):
+        while True:
+            item = self.block_queue.get()
+            if item is None:
+                break
+
+            seq, block = item
+            if self._expected_seq is not None and seq != self._expected_seq:
+                # Ada blok yang dibuang: jangan sambung jendela melewati celah
+                self.gaps += 1
+                if self.on_gap:
+                    self.on_gap(seq - self._expected_seq)
+            self._expected_seq = seq + 1
+
+            self.analyze(block)
+            self.processed_blocks += 1
+
+    def get_stats(self):
+        """Statistik pipeline analisis"""
+        return {
+            "enqueued_blocks": self.block_queue.enqueued_blocks,
+            "dropped_blocks": self.block_queue.dropped_blocks,
+            "processed_blocks": self.processed_blocks,
+            "queued_blocks": len(self.block_queue),
+            "gaps": self.gaps,
+            "error": repr(self.error) if self.error else None,
+        }
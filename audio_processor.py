@@ -1,10 +1,11 @@
-import numpy as np
-import pyaudio
 import threading
-import time
-import queue
-from collections import deque
-import sys
+from analysis_worker import AnalysisWorker, BlockQueue
+from audio_source import PortAudioSource
+from ring_buffer import RingBuffer
+from short_time import HOP_LENGTH, WINDOW_FUNCTION, WINDOW_LENGTH, ShortTimeTracker
+from telemetry import TelemetryChannel
+from tone_detector import create_detector
+from tone_plan import DEFAULT_TONE_PLAN, TONE_PLAN_FILE, load_tone_plan, tone_alphabet
 
 # Konfigurasi Audio
 SAMPLE_RATE = 44100
@@ -13,60 +14,182 @@ NUM_SECONDS = 0.1
 AMPLITUDE_THRESHOLD = 0.005
 SILENCE_TIMEOUT = 1.5  # detik
 
-# Frekuensi nada (disesuaikan dengan kode C++ asli)
-NOTE_FREQUENCIES = {
-    "1": 2000.00,
-    "2": 2050.00,
-    "3": 2100.00,
-    "4": 2150.01,
-    "5": 2200.00,
-    "6": 2250.00,
-    "7": 2300.00
-}
+# Rencana nada: file "simbol=frekuensi" (lihat tone_plan.py, 1-64 nada),
+# dimuat sekali saat start; tanpa file dipakai tujuh nada bawaan
+NOTE_FREQUENCIES = load_tone_plan(TONE_PLAN_FILE, DEFAULT_TONE_PLAN)
+NOTE_ALPHABET = tone_alphabet(NOTE_FREQUENCIES)
 TOLERANCE = 15.0
 
-class AudioProcessor:
-    def __init__(self):
-        self.audio = pyaudio.PyAudio()
-        self.stream = None
-        self.is_running = False
+# Engine detektor nada: "goertzel" (default) atau "fft" (fallback)
+DETECTOR_ENGINE = "goertzel"
+
+# Window deteksi mode block: panjang (sampel, juga ukuran blok callback),
+# fungsi window, dan interpolasi puncak sub-bin (engine fft). Dengan
+# "hann" + "gaussian", engine fft tetap akurat pada window 256-512 sampel.
+DETECTION_WINDOW = FRAMES_PER_BUFFER
+DETECTOR_WINDOW = "rect"
+PEAK_INTERPOLATION = "none"
+
+# Mode analisis: "block" (satu window per blok, nada sama berturut-turut
+# digabung) atau "stft" (frame overlap + onset/offset, lihat short_time.py)
+ANALYSIS_MODES = ("block", "stft")
+ANALYSIS_MODE = "block"
+
+# Antrian blok antara callback audio dan worker analisis
+ANALYSIS_QUEUE_SIZE = 32  # ~0.75 detik audio
+OVERFLOW_POLICY = "drop_oldest"  # "drop_oldest", "drop_newest" atau "block"
+
+# Telemetri frekuensi/amplitudo untuk meter UI (di luar antrian event)
+TELEMETRY_RATE = 20.0  # publikasi per detik
+TELEMETRY_HISTORY = 64
+
+# Seberapa sering thread start_listening memeriksa apakah stream masih aktif
+STREAM_CHECK_INTERVAL = 0.5  # detik
+
+class NoteTracker:
+    """State nada dan akhir transmisi yang dihitung dari jumlah sampel.
+
+    Dipakai untuk audio live maupun rekaman: waktu diukur dalam sampel yang
+    sudah diproses, bukan jam dinding, sehingga akhir transmisi jatuh tepat
+    di batas blok dan rekaman memberi hasil yang sama berapa pun kecepatannya.
+    """
+    
+    def __init__(self, sample_rate=SAMPLE_RATE, silence_timeout=SILENCE_TIMEOUT,
+                 amplitude_threshold=AMPLITUDE_THRESHOLD):
+        self.silence_samples = int(round(silence_timeout * sample_rate))
+        self.amplitude_threshold = amplitude_threshold
+        self.reset()
+    
+    def reset(self):
+        """Reset state tracker"""
+        self.position = 0
+        self.last_signal_position = 0
         self.last_detected_note = ""
-        self.last_signal_time = time.time()
+        self.pending_notes = False
         self.silence_detected = False
+    
+    def update(self, detection, n_samples):
+        """Memproses hasil deteksi satu blok; mengembalikan daftar (tipe, data, posisi_sampel)"""
+        events = []
+        self.position += n_samples
+        
+        if detection.amplitude > self.amplitude_threshold:
+            self.last_signal_position = self.position
+            self.silence_detected = False
+            
+            note = detection.note
+            if note and note != self.last_detected_note:
+                self.last_detected_note = note
+                self.pending_notes = True
+                events.append(("note_detected", note, self.position))
+        else:
+            self.last_detected_note = ""
+            
+            if (self.pending_notes and not self.silence_detected and
+                    self.position - self.last_signal_position > self.silence_samples):
+                self.silence_detected = True
+                self.pending_notes = False
+                events.append(("end_of_transmission", None, self.position))
+        
+        return events
+    
+    def advance(self, n_samples):
+        """Memajukan waktu tanpa hasil deteksi (mis. blok yang dibuang antrian)"""
+        self.position += n_samples
+    
+    def flush(self):
+        """Menutup transmisi yang masih terbuka (misalnya di akhir rekaman)"""
+        if not self.pending_notes:
+            return []
+        self.pending_notes = False
+        self.last_detected_note = ""
+        return [("end_of_transmission", None, self.position)]
+
+def create_tracker(analysis_mode, sample_rate=SAMPLE_RATE, **stft_options):
+    """Membuat tracker nada sesuai mode analisis"""
+    if analysis_mode == "block":
+        return NoteTracker(sample_rate=sample_rate)
+    if analysis_mode == "stft":
+        return ShortTimeTracker(
+            NOTE_FREQUENCIES, sample_rate, AMPLITUDE_THRESHOLD, SILENCE_TIMEOUT, **stft_options
+        )
+    raise ValueError(f"Mode analisis tidak dikenal: {analysis_mode}")
+
+class AudioProcessor:
+    def __init__(self, detector_engine=DETECTOR_ENGINE,
+                 queue_size=ANALYSIS_QUEUE_SIZE, overflow_policy=OVERFLOW_POLICY,
+                 telemetry_rate=TELEMETRY_RATE, analysis_mode=ANALYSIS_MODE,
+                 window_length=WINDOW_LENGTH, hop=HOP_LENGTH, window=WINDOW_FUNCTION,
+                 detection_window=DETECTION_WINDOW, detector_window=DETECTOR_WINDOW,
+                 peak_interpolation=PEAK_INTERPOLATION, source=None):
+        # Sumber audio (lihat audio_source.py); default mikrofon lewat PortAudio
+        self.source = source
+        self.detector = create_detector(
+            detector_engine, NOTE_FREQUENCIES, SAMPLE_RATE, TOLERANCE,
+            detector_window, peak_interpolation
+        )
+        self.detection_window = detection_window
+        self.active_source = None
+        self.is_running = False
+        # Hanya disentuh oleh thread worker analisis (dan setelah worker berhenti)
+        self.analysis_mode = analysis_mode
+        self.tracker = create_tracker(
+            analysis_mode, SAMPLE_RATE, window_length=window_length, hop=hop, window=window
+        )
+        self._stop_event = threading.Event()
+        self._stop_lock = threading.Lock()
         
         # Buffer untuk analisis
-        self.audio_buffer = deque(maxlen=int(SAMPLE_RATE * NUM_SECONDS))
+        self.audio_buffer = RingBuffer(int(SAMPLE_RATE * NUM_SECONDS))
+        
+        # Pipeline: callback -> antrian blok -> worker analisis
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.worker = None
         
-    def start_listening(self, message_queue):
-        """Mulai mendengarkan audio dan mengirim pesan ke queue"""
+        # Frekuensi dan amplitudo dibaca UI dari slot ini; message_queue hanya
+        # membawa event diskrit (note_detected, end_of_transmission, error)
+        self.telemetry = TelemetryChannel(telemetry_rate, TELEMETRY_HISTORY)
+        
+    def start_listening(self, message_queue, source=None):
+        """Mulai mendengarkan audio dan mengirim pesan ke queue.
+        
+        source menggantikan self.source untuk sesi ini. Sumber non-live
+        (file, array, sintetis) ditahan saat antrian penuh alih-alih membuang
+        blok, sehingga bisa berjalan lebih cepat dari real-time tanpa celah.
+        """
         self.is_running = True
         self.message_queue = message_queue
+        self.audio_buffer.clear()
+        self.tracker.reset()
+        self._stop_event.clear()
+        
+        source = source or self.source or PortAudioSource(SAMPLE_RATE)
+        if source.live:
+            block_queue = BlockQueue(self.queue_size, self.overflow_policy)
+        else:
+            block_queue = BlockQueue(self.queue_size, "block", block_timeout=None)
+        
+        self.worker = AnalysisWorker(
+            block_queue, self.analyze_block, on_gap=self.handle_gap, on_error=self.handle_worker_error
+        )
+        self.worker.start()
         
         try:
-            # Open audio stream
-            self.stream = self.audio.open(
-                format=pyaudio.paFloat32,
-                channels=1,
-                rate=SAMPLE_RATE,
-                input=True,
-                frames_per_buffer=FRAMES_PER_BUFFER,
-                stream_callback=self.audio_callback
-            )
+            if source.sample_rate != SAMPLE_RATE or source.channels != 1:
+                raise ValueError(
+                    f"Sumber harus mono {SAMPLE_RATE} Hz "
+                    f"(didapat {source.channels} kanal, {source.sample_rate} Hz)"
+                )
             
-            self.stream.start_stream()
+            self.active_source = source
+            source.start(self.audio_callback, self.detection_window)
             
-            # Main processing loop
-            while self.is_running and self.stream.is_active():
-                time.sleep(0.01)  # Small sleep to prevent CPU overuse
-                
-                # Check for silence timeout
-                current_time = time.time()
-                if (current_time - self.last_signal_time > SILENCE_TIMEOUT and 
-                    not self.silence_detected and self.last_detected_note):
-                    
-                    self.silence_detected = True
-                    message_queue.put(("end_of_transmission", None))
-                    self.last_detected_note = ""
+            # Akhir transmisi dideteksi di worker analisis dari aliran sampel;
+            # thread ini cukup menunggu sampai stop_listening atau sumber habis
+            while not self._stop_event.is_set():
+                if source.wait(STREAM_CHECK_INTERVAL):
+                    break
                     
         except Exception as e:
             message_queue.put(("error", f"Audio error: {str(e)}"))
@@ -75,73 +198,74 @@ class AudioProcessor:
     
     def stop_listening(self):
         """Stop listening to audio"""
-        self.is_running = False
-        if self.stream:
-            self.stream.stop_stream()
-            self.stream.close()
+        with self._stop_lock:
+            self.is_running = False
+            self._stop_event.set()
+            if self.active_source:
+                self.active_source.stop()
+                self.active_source = None
+            if self.worker:
+                stopped = self.worker.stop()
+                failed = self.worker.error is not None
+                self.worker = None
+                # Tutup transmisi yang masih terbuka hanya jika worker sudah
+                # berhenti (tracker tidak lagi disentuh thread lain) dan tidak
+                # mati karena error (state tracker tidak bisa dipercaya)
+                if stopped and not failed:
+                    self._publish_events(self.tracker.flush())
     
-    def audio_callback(self, in_data, frame_count, time_info, status):
-        """Callback untuk pemrosesan audio"""
-        if status:
-            print(f"Audio status: {status}")
-        
-        # Convert bytes to numpy array
-        audio_data = np.frombuffer(in_data, dtype=np.float32)
-        
-        # Add to buffer
-        self.audio_buffer.extend(audio_data)
+    def audio_callback(self, audio_data):
+        """Dipanggil sumber audio untuk setiap blok; serahkan ke worker analisis"""
+        self.worker.block_queue.put(audio_data)
+    
+    def analyze_block(self, audio_data):
+        """Dijalankan di thread worker analisis untuk setiap blok mentah"""
+        if self.analysis_mode == "stft":
+            # Tracker short-time membingkai sendiri sampelnya
+            self._publish_events(self.tracker.update(audio_data))
+            self.telemetry.publish(self.tracker.last_frequency, self.tracker.last_amplitude)
+            return
         
-        if len(self.audio_buffer) >= FRAMES_PER_BUFFER:
-            # Process the audio
-            self.process_audio(np.array(self.audio_buffer)[-FRAMES_PER_BUFFER:])
+        self.audio_buffer.write(audio_data)
         
-        return (None, pyaudio.paContinue)
+        if len(self.audio_buffer) >= self.detection_window:
+            # Process the audio (view kontigu, tanpa salinan)
+            self.process_audio(self.audio_buffer.latest(self.detection_window), len(audio_data))
+        else:
+            self.tracker.advance(len(audio_data))
+    
+    def handle_gap(self, missing_blocks):
+        """Blok dibuang antrian: jangan sambung jendela, tapi waktu tetap berjalan"""
+        self.audio_buffer.clear()
+        self.tracker.advance(missing_blocks * self.detection_window)
     
-    def process_audio(self, audio_data):
-        """Proses data audio untuk deteksi frekuensi"""
-        # Calculate amplitude
-        amplitude = np.max(np.abs(audio_data))
+    def handle_worker_error(self, error):
+        """Worker analisis mati karena exception: laporkan lalu akhiri sesi mendengarkan"""
+        self.message_queue.put(("error", f"Analysis error: {error}"))
+        self._stop_event.set()
+    
+    def get_stats(self):
+        """Statistik antrian dan worker analisis"""
+        return self.worker.get_stats() if self.worker else {}
+    
+    def process_audio(self, audio_data, n_samples=None):
+        """Proses data audio untuk deteksi frekuensi.
         
-        # Update last signal time
-        if amplitude > AMPLITUDE_THRESHOLD:
-            self.last_signal_time = time.time()
-            self.silence_detected = False
+        n_samples adalah jumlah sampel baru sejak panggilan sebelumnya
+        (default: panjang audio_data); dipakai tracker untuk menghitung silence.
+        """
+        detection = self.detector.detect(audio_data)
         
-        # Perform FFT
-        fft_data = np.fft.rfft(audio_data)
-        frequencies = np.fft.rfftfreq(len(audio_data), 1.0/SAMPLE_RATE)
-        magnitudes = np.abs(fft_data)
+        # Publish frequency data for the UI meters (rate-limited, latest value wins)
+        self.telemetry.publish(detection.frequency, detection.amplitude)
         
-        # Find peak frequency
-        if len(magnitudes) > 0:
-            peak_index = np.argmax(magnitudes[1:]) + 1  # Skip DC component
-            peak_frequency = frequencies[peak_index]
-            peak_magnitude = magnitudes[peak_index]
-            
-            # Send frequency data to UI
-            self.message_queue.put((
-                "frequency_detected", 
-                (float(peak_frequency), float(amplitude))
-            ))
-            
-            # Check if above threshold
-            if amplitude > AMPLITUDE_THRESHOLD:
-                # Find matching note
-                detected_note = None
-                for note, freq in NOTE_FREQUENCIES.items():
-                    if abs(peak_frequency - freq) <= TOLERANCE:
-                        detected_note = note
-                        break
-                
-                if detected_note and detected_note != self.last_detected_note:
-                    self.last_detected_note = detected_note
-                    self.message_queue.put(("note_detected", detected_note))
-            else:
-                self.last_detected_note = ""
-        else:
-            self.last_detected_note = ""
+        n_samples = len(audio_data) if n_samples is None else n_samples
+        self._publish_events(self.tracker.update(detection, n_samples))
+    
+    def _publish_events(self, events):
+        for msg_type, data, position in events:
+            self.message_queue.put((msg_type, data))
     
     def __del__(self):
         """Cleanup"""
-        self.stop_listening()
-        self.audio.terminate()
\ No newline at end of file
+        self.stop_listening()
\ No newline at end of file
@@ -0,0 +1,287 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from wav_file import WavFile
+
+
+class AudioSource(ABC):
+    """Sumber blok audio float32 yang mendorong setiap blok ke callback(block).
+
+    start(callback, frames_per_buffer) memulai pengiriman di thread milik
+    sumber; is_active() menjadi False saat sumber habis atau dihentikan.
+    Sumber live (perangkat) tidak bisa ditahan, jadi konsumen harus
+    membuang blok jika tertinggal; sumber lain boleh menunggu konsumen.
+    """
+
+    live = False
+
+    def __init__(self, sample_rate, channels=1):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._finished = threading.Event()
+        self._finished.set()
+
+    @abstractmethod
+    def start(self, callback, frames_per_buffer):
+        """Mulai mengirim blok ke callback(block) dari thread milik sumber"""
+
+    @abstractmethod
+    def stop(self):
+        """Menghentikan pengiriman blok"""
+
+    def is_active(self):
+        return not self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """Menunggu sampai sumber habis/berhenti; True jika sudah tidak aktif"""
+        self._finished.wait(timeout)
+        return not self.is_active()
+
+    def close(self):
+        """Melepas resource sumber"""
+        self.stop()
+
+
+class PortAudioSource(AudioSource):
+    """Input perangkat lewat PortAudio (pyaudio diimpor saat start, bukan saat import modul)"""
+
+    live = True
+
+    def __init__(self, sample_rate, channels=1, device_index=None):
+        super().__init__(sample_rate, channels)
+        self.device_index = device_index
+        self._pyaudio = None
+        self._audio = None
+        self._stream = None
+
+    def start(self, callback, frames_per_buffer):
+        try:
+            import pyaudio
+        except ImportError:
+            raise RuntimeError("pyaudio tidak terpasang") from None
+
+        def stream_callback(in_data, frame_count, time_info, status):
+            if status:
+                print(f"Audio status: {status}")
+            # View tanpa salinan; buffer PortAudio tidak dipakai ulang setelah callback
+            callback(np.frombuffer(in_data, dtype=np.float32))
+            return (None, pyaudio.paContinue)
+
+        self._pyaudio = pyaudio
+        self._audio = pyaudio.PyAudio()
+        self._stream = self._audio.open(
+            format=pyaudio.paFloat32,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            input_device_index=self.device_index,
+            frames_per_buffer=frames_per_buffer,
+            stream_callback=stream_callback
+        )
+        self._finished.clear()
+        self._stream.start_stream()
+
+    def is_active(self):
+        return self._stream is not None and self._stream.is_active()
+
+    def stop(self):
+        if self._stream:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        if self._audio:
+            self._audio.terminate()
+            self._audio = None
+        self._finished.set()
+
+
+class BlockSource(AudioSource):
+    """Sumber non-live yang membaca blok dari data; dikirim secepat mungkin atau dengan tempo.
+
+    speed=None mengirim blok secepat konsumen menerimanya; speed=1.0 meniru
+    perangkat real-time, speed=10.0 sepuluh kali lebih cepat. Blok juga bisa
+    ditarik langsung lewat blocks() tanpa thread.
+    """
+
+    def __init__(self, sample_rate, channels=1, speed=None):
+        super().__init__(sample_rate, channels)
+        self.speed = speed
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    @property
+    @abstractmethod
+    def frames(self):
+        """Jumlah frame total sumber"""
+
+    @property
+    def duration(self):
+        return self.frames / self.sample_rate
+
+    @abstractmethod
+    def read(self, start, stop):
+        """Sampel [start, stop) sebagai float32 (interleaved untuk multi-kanal)"""
+
+    def blocks(self, frames_per_buffer):
+        """Generator blok berurutan; blok terakhir bisa lebih pendek"""
+        for start in range(0, self.frames, frames_per_buffer):
+            yield self.read(start, min(start + frames_per_buffer, self.frames))
+
+    def start(self, callback, frames_per_buffer):
+        self._stop_event.clear()
+        self._finished.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(callback, frames_per_buffer), name="audio-source", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, callback, frames_per_buffer):
+        try:
+            started = time.monotonic()
+            sent = 0
+            for block in self.blocks(frames_per_buffer):
+                if self.speed:
+                    # Tempo dijaga terhadap jam awal, jadi keterlambatan tidak menumpuk
+                    delay = started + sent / (self.sample_rate * self.speed) - time.monotonic()
+                    if delay > 0 and self._stop_event.wait(delay):
+                        break
+                if self._stop_event.is_set():
+                    break
+                callback(block)
+                sent += len(block) // self.channels
+        finally:
+            self._finished.set()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self._finished.set()
+
+
+class ArraySource(BlockSource):
+    """Sampel di memori: array 1-D (mono) atau (frame, kanal)"""
+
+    def __init__(self, samples, sample_rate, speed=None):
+        samples = np.asarray(samples, dtype=np.float32)
+        channels = 1 if samples.ndim == 1 else samples.shape[1]
+        super().__init__(sample_rate, channels, speed)
+        self.samples = samples
+
+    @property
+    def frames(self):
+        return len(self.samples)
+
+    def read(self, start, stop):
+        return self.samples[start:stop].reshape(-1)
+
+
+class WavSource(BlockSource):
+    """Satu kanal file WAV (dipetakan ke memori lewat WavFile)"""
+
+    def __init__(self, path, channel=0, speed=None):
+        self.wav = WavFile(path)
+        if not 0 <= channel < self.wav.channels:
+            raise ValueError(f"{path} hanya punya {self.wav.channels} kanal")
+        super().__init__(self.wav.sample_rate, 1, speed)
+        self.channel = channel
+
+    @property
+    def frames(self):
+        return self.wav.frames
+
+    def read(self, start, stop):
+        return self.wav.read(start, stop, self.channel)
+
+
+def render_tones(transmissions, tone_plan, sample_rate, note_seconds=0.1, gap_seconds=0.03,
+                 silence_seconds=2.0, amplitude=0.5, noise=0.0, jitter=0.0, drift=0.0, rng=None):
+    """Merender daftar transmisi (rangkaian simbol) menjadi sinyal float32.
+
+    Setiap nada berlangsung note_seconds, dipisah jeda gap_seconds, dan
+    setiap transmisi diakhiri silence_seconds hening. jitter adalah deviasi
+    relatif durasi nada/jeda (0.1 = +-10%), drift deviasi frekuensi dalam Hz,
+    dan noise deviasi standar noise gaussian di seluruh sinyal.
+    """
+    rng = rng or np.random.default_rng(0)
+
+    def samples(seconds):
+        if jitter:
+            seconds *= max(0.0, 1.0 + rng.normal(0, jitter))
+        return int(round(seconds * sample_rate))
+
+    parts = []
+    for transmission in transmissions:
+        for symbol in transmission:
+            t = np.arange(samples(note_seconds)) / sample_rate
+            frequency = tone_plan[symbol] + (rng.normal(0, drift) if drift else 0.0)
+            parts.append(amplitude * np.sin(2 * np.pi * frequency * t + rng.uniform(0, 2 * np.pi)))
+            parts.append(np.zeros(samples(gap_seconds)))
+        parts.append(np.zeros(int(round(silence_seconds * sample_rate))))
+
+    signal = np.concatenate(parts) if parts else np.zeros(0)
+    if noise:
+        signal += rng.normal(0, noise, len(signal))
+    return signal.astype(np.float32)
+
+
+class SyntheticSource(ArraySource):
+    """Transmisi nada sintetis (lihat render_tones) untuk uji tanpa perangkat"""
+
+    def __init__(self, transmissions, tone_plan, sample_rate, speed=None, seed=0, **render_options):
+        if isinstance(transmissions, str):
+            transmissions = [transmissions]
+        self.transmissions = list(transmissions)
+        signal = render_tones(
+            self.transmissions, tone_plan, sample_rate, rng=np.random.default_rng(seed), **render_options
+        )
+        super().__init__(signal, sample_rate, speed)
+
+
+class LoopbackSource(AudioSource):
+    """Sumber yang diisi kode lain lewat write() (mis. generator atau pemutar di proses yang sama).
+
+    Blok diteruskan ke callback dengan ukuran sesuai write(); close_input()
+    menandai akhir data sehingga sumber menjadi tidak aktif setelah kosong.
+    """
+
+    def __init__(self, sample_rate, channels=1, maxsize=64):
+        super().__init__(sample_rate, channels)
+        self._blocks = queue.Queue(maxsize)
+        self._thread = None
+
+    def write(self, block, timeout=None):
+        """Memasukkan satu blok; menunggu jika antrian penuh"""
+        self._blocks.put(np.asarray(block, dtype=np.float32), timeout=timeout)
+
+    def close_input(self):
+        """Menandai akhir data"""
+        self._blocks.put(None)
+
+    def start(self, callback, frames_per_buffer):
+        self._finished.clear()
+        self._thread = threading.Thread(target=self._run, args=(callback,), name="audio-loopback", daemon=True)
+        self._thread.start()
+
+    def _run(self, callback):
+        try:
+            while True:
+                block = self._blocks.get()
+                if block is None:
+                    break
+                callback(block)
+        finally:
+            self._finished.set()
+
+    def stop(self):
+        if self._thread and self._thread.is_alive():
+            self._blocks.put(None)
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+        self._thread = None
+        self._finished.set()
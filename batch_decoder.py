@@ -0,0 +1,171 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from audio_processor import (
+    ANALYSIS_MODE, DETECTION_WINDOW, DETECTOR_ENGINE, DETECTOR_WINDOW, NOTE_ALPHABET, NOTE_FREQUENCIES,
+    PEAK_INTERPOLATION, SILENCE_TIMEOUT, TOLERANCE, create_tracker
+)
+from penerjemah import Penerjemah
+from tone_detector import PEAK_INTERPOLATIONS, WINDOW_FUNCTIONS, create_detector
+from wav_file import WavFile
+
+# Panjang segmen untuk file panjang dan overlap pemanasan antar segmen
+SEGMENT_SECONDS = 600.0
+OVERLAP_SECONDS = 2 * SILENCE_TIMEOUT
+
+
+def decode_segment(path, start, stop, warmup_start, engine=DETECTOR_ENGINE, channel=0,
+                   analysis_mode=ANALYSIS_MODE, detection_window=DETECTION_WINDOW,
+                   detector_window=DETECTOR_WINDOW, peak_interpolation=PEAK_INTERPOLATION):
+    """Mendekode sampel [start, stop) dari file WAV menjadi daftar event.
+
+    Blok [warmup_start, start) hanya dipakai untuk memanaskan state tracker
+    (nada terakhir, posisi sinyal terakhir) dan event-nya dibuang, sehingga
+    segmen yang berdekatan tidak menghasilkan event ganda. Seperti
+    AudioProcessor, mode block mendeteksi satu window detection_window
+    sampel per blok dengan fungsi window dan interpolasi puncak detektor.
+    """
+    wav = WavFile(path)
+    detector = create_detector(
+        engine, NOTE_FREQUENCIES, wav.sample_rate, TOLERANCE, detector_window, peak_interpolation
+    )
+    tracker = create_tracker(analysis_mode, wav.sample_rate)
+    tracker.position = warmup_start
+    tracker.last_signal_position = warmup_start
+
+    events = []
+    stop = min(stop, wav.frames)
+    for block_start in range(warmup_start, stop, detection_window):
+        block = wav.read(block_start, min(block_start + detection_window, stop), channel)
+        if analysis_mode == "stft":
+            block_events = tracker.update(block)
+        else:
+            block_events = tracker.update(detector.detect(block), len(block))
+        if block_start >= start:
+            events.extend(block_events)
+
+    if stop == wav.frames:
+        events.extend(tracker.flush())
+    return events
+
+
+def plan_segments(path, segment_seconds=SEGMENT_SECONDS, overlap_seconds=OVERLAP_SECONDS,
+                  block=DETECTION_WINDOW):
+    """Membagi file menjadi segmen (start, stop, warmup_start) yang rata ke batas blok"""
+    wav = WavFile(path)
+    segment = max(1, int(segment_seconds * wav.sample_rate) // block) * block
+    overlap = -(-int(overlap_seconds * wav.sample_rate) // block) * block
+
+    segments = []
+    for start in range(0, max(wav.frames, 1), segment):
+        segments.append((start, start + segment, max(0, start - overlap)))
+    return segments, wav.sample_rate
+
+
+def translate_events(events, penerjemah, sample_rate):
+    """Meneruskan event ke Penerjemah; mengembalikan daftar (detik, kalimat)"""
+    transcript = []
+    for msg_type, data, position in events:
+        if msg_type == "note_detected":
+            penerjemah.proses_input(data)
+        elif msg_type == "end_of_transmission":
+            kalimat = penerjemah.get_kalimat()
+            if kalimat:
+                transcript.append((position / sample_rate, kalimat))
+            penerjemah.reset()
+    return transcript
+
+
+def write_transcript(filename, transcript):
+    """Menulis satu baris per transmisi: [HH:MM:SS.mmm] kalimat"""
+    with open(filename, 'w', encoding='utf-8') as file:
+        for seconds, kalimat in transcript:
+            jam, sisa = divmod(seconds, 3600)
+            menit, detik = divmod(sisa, 60)
+            file.write(f"[{int(jam):02d}:{int(menit):02d}:{detik:06.3f}] {kalimat}\n")
+
+
+def _decode_task(args):
+    return decode_segment(*args)
+
+
+def decode_files(paths, output_dir, kamus_file="kamus.txt", processes=None,
+                 engine=DETECTOR_ENGINE, channel=0,
+                 segment_seconds=SEGMENT_SECONDS, overlap_seconds=OVERLAP_SECONDS,
+                 analysis_mode=ANALYSIS_MODE, detection_window=DETECTION_WINDOW,
+                 detector_window=DETECTOR_WINDOW, peak_interpolation=PEAK_INTERPOLATION):
+    """Mendekode banyak file WAV paralel dan menulis satu transkrip per file"""
+    os.makedirs(output_dir, exist_ok=True)
+    penerjemah = Penerjemah(kamus_file, alfabet=NOTE_ALPHABET)
+
+    tasks = []
+    plans = []
+    for path in paths:
+        segments, sample_rate = plan_segments(path, segment_seconds, overlap_seconds, detection_window)
+        plans.append((path, sample_rate, len(segments)))
+        for start, stop, warmup_start in segments:
+            tasks.append((path, start, stop, warmup_start, engine, channel, analysis_mode,
+                          detection_window, detector_window, peak_interpolation))
+
+    if processes == 1:
+        results = map(_decode_task, tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=processes)
+        results = executor.map(_decode_task, tasks)
+
+    outputs = []
+    try:
+        for path, sample_rate, count in plans:
+            events = []
+            for _ in range(count):
+                events.extend(next(results))
+
+            penerjemah.reset()
+            transcript = translate_events(events, penerjemah, sample_rate)
+
+            stem = os.path.splitext(os.path.basename(path))[0]
+            output = os.path.join(output_dir, f"{stem}.txt")
+            write_transcript(output, transcript)
+            outputs.append(output)
+    finally:
+        if executor:
+            executor.shutdown()
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dekode offline rekaman WAV menjadi transkrip")
+    parser.add_argument("files", nargs="+", help="File WAV")
+    parser.add_argument("-o", "--output", default="transkrip", help="Direktori transkrip")
+    parser.add_argument("--kamus", default="kamus.txt", help="File kamus")
+    parser.add_argument("-j", "--proses", type=int, default=None, help="Jumlah proses (default: semua CPU)")
+    parser.add_argument("--engine", default=DETECTOR_ENGINE, help="Engine detektor nada")
+    parser.add_argument("--kanal", type=int, default=0, help="Kanal yang didekode")
+    parser.add_argument("--analisis", default=ANALYSIS_MODE, help="Mode analisis: block atau stft")
+    parser.add_argument("--jendela", type=int, default=DETECTION_WINDOW,
+                        help="Panjang window deteksi mode block (sampel)")
+    parser.add_argument("--window", default=DETECTOR_WINDOW, choices=sorted(WINDOW_FUNCTIONS),
+                        help="Fungsi window detektor")
+    parser.add_argument("--interpolasi", default=PEAK_INTERPOLATION, choices=PEAK_INTERPOLATIONS,
+                        help="Interpolasi puncak sub-bin (engine fft)")
+    parser.add_argument("--segmen", type=float, default=SEGMENT_SECONDS, help="Panjang segmen (detik)")
+    parser.add_argument("--overlap", type=float, default=OVERLAP_SECONDS, help="Overlap segmen (detik)")
+    args = parser.parse_args()
+
+    mulai = time.perf_counter()
+    outputs = decode_files(
+        args.files, args.output, args.kamus, args.proses, args.engine, args.kanal,
+        args.segmen, args.overlap, args.analisis, args.jendela, args.window, args.interpolasi
+    )
+    durasi = time.perf_counter() - mulai
+
+    audio = sum(WavFile(path).duration for path in args.files)
+    print(f"{len(outputs)} transkrip ditulis ke {args.output} "
+          f"({audio:.1f} detik audio dalam {durasi:.1f} detik, {audio / max(durasi, 1e-9):.0f}x real-time)")
+
+
+if __name__ == "__main__":
+    main()
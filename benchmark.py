@@ -0,0 +1,809 @@
+import argparse
+import json
+import platform
+import queue
+import sys
+import time
+
+import numpy as np
+
+from audio_processor import FRAMES_PER_BUFFER, NOTE_FREQUENCIES, SAMPLE_RATE, TOLERANCE
+from tone_detector import DETECTOR_ENGINES, create_detector
+from tone_plan import generate_tone_plan
+
+
+def buat_blok_nada(frekuensi, jumlah=FRAMES_PER_BUFFER, amplitudo=0.5, noise=0.0, rng=None):
+    """Membuat satu blok sinyal nada sinus (float32) dengan noise opsional"""
+    rng = rng or np.random.default_rng(0)
+    t = np.arange(jumlah) / SAMPLE_RATE
+    fase = rng.uniform(0, 2 * np.pi)
+    blok = amplitudo * np.sin(2 * np.pi * frekuensi * t + fase)
+    if noise:
+        blok += rng.normal(0, noise, jumlah)
+    return blok.astype(np.float32)
+
+
+def bench_detektor(jumlah_blok=2000, noise=0.05):
+    """Membandingkan biaya per blok dan akurasi engine detektor"""
+    rng = np.random.default_rng(42)
+    catatan = list(NOTE_FREQUENCIES.keys())
+    label = rng.choice(catatan, jumlah_blok)
+    blok = [buat_blok_nada(NOTE_FREQUENCIES[n], noise=noise, rng=rng) for n in label]
+
+    hasil = {}
+    for engine in DETECTOR_ENGINES:
+        detektor = create_detector(engine, NOTE_FREQUENCIES, SAMPLE_RATE, TOLERANCE)
+        detektor.detect(blok[0])  # warm-up cache koefisien
+
+        mulai = time.perf_counter()
+        deteksi = [detektor.detect(b).note for b in blok]
+        durasi = time.perf_counter() - mulai
+
+        benar = sum(1 for d, n in zip(deteksi, label) if d == n)
+        hasil[engine] = {
+            "us_per_blok": durasi / jumlah_blok * 1e6,
+            "akurasi": benar / jumlah_blok,
+        }
+    return hasil
+
+
+def bench_rencana_nada(jumlah_nada=(7, 16, 32, 64), jumlah_blok=2000, noise=0.05):
+    """Biaya per blok dan akurasi tiap engine untuk rencana nada 7-64 nada (jarak 50 Hz)"""
+    rng = np.random.default_rng(23)
+    hasil = {}
+    for jumlah in jumlah_nada:
+        rencana = generate_tone_plan(jumlah)
+        label = rng.choice(list(rencana), jumlah_blok)
+        blok = np.stack([buat_blok_nada(rencana[n], noise=noise, rng=rng) for n in label])
+
+        for engine in DETECTOR_ENGINES:
+            detektor = create_detector(engine, rencana, SAMPLE_RATE, TOLERANCE)
+            detektor.detect_batch(blok[:1])  # warm-up cache koefisien/tabel bin
+
+            mulai = time.perf_counter()
+            deteksi = [d.note for d in detektor.detect_batch(blok)]
+            durasi = time.perf_counter() - mulai
+
+            benar = sum(1 for d, n in zip(deteksi, label) if d == n)
+            hasil[(jumlah, engine)] = {
+                "us_per_blok": durasi / jumlah_blok * 1e6,
+                "akurasi": benar / jumlah_blok,
+            }
+    return hasil
+
+
+KONFIGURASI_JENDELA = (
+    ("fft", "rect", "none"),
+    ("fft", "hann", "quadratic"),
+    ("fft", "hann", "gaussian"),
+    ("goertzel", "rect", "none"),
+)
+
+
+def _lini_masa_nada(transmisi, note_seconds, gap_seconds, silence_seconds):
+    """Posisi (awal, akhir, nada) tiap nada dan awal tiap transmisi, sesuai render_tones tanpa jitter"""
+    nada_sampel = int(round(note_seconds * SAMPLE_RATE))
+    jeda_sampel = int(round(gap_seconds * SAMPLE_RATE))
+    hening_sampel = int(round(silence_seconds * SAMPLE_RATE))
+    nada, awal_transmisi, posisi = [], [], 0
+    for rangkaian in transmisi:
+        awal_transmisi.append(posisi)
+        for simbol in rangkaian:
+            nada.append((posisi, posisi + nada_sampel, simbol))
+            posisi += nada_sampel + jeda_sampel
+        posisi += hening_sampel
+    return nada, awal_transmisi
+
+
+def bench_jendela(kamus_file="kamus.txt", ukuran=(256, 512, 1024, 2048), jumlah_transmisi=20,
+                  noise=0.001, note_seconds=0.1, gap_seconds=0.03):
+    """Kesalahan dan latensi dekode transmisi utuh per panjang window dan engine/window/interpolasi.
+
+    Transmisi dari kosakata kamus dirender dengan render_tones (termasuk
+    tepi nada dan jeda), dipotong per blok sepanjang window, lalu dialirkan
+    ke detektor dan NoteTracker mode block seperti di AudioProcessor.
+    Setiap note_detected dicocokkan dengan nada yang sedang berbunyi di
+    bloknya: cocok pertama kali dihitung benar (latensi = akhir blok - awal
+    nada + waktu proses), selebihnya deteksi palsu. Kesalahan nada dan
+    kata adalah jarak edit per transmisi dibagi jumlah nada/kata yang dikirim.
+    """
+    from audio_processor import SILENCE_TIMEOUT, NoteTracker
+    from audio_source import render_tones
+    from penerjemah import Kamus
+
+    rng = np.random.default_rng(22)
+    transmisi = buat_transmisi(kamus_file, jumlah_transmisi, rng=rng)
+    hening = SILENCE_TIMEOUT + 0.5
+    sinyal = render_tones(transmisi, NOTE_FREQUENCIES, SAMPLE_RATE, note_seconds, gap_seconds,
+                          hening, noise=noise, rng=rng)
+    lini_nada, awal_transmisi = _lini_masa_nada(transmisi, note_seconds, gap_seconds, hening)
+    awal_nada = np.array([awal for awal, _, _ in lini_nada])
+
+    kamus = Kamus(kamus_file)
+    kata_referensi = [kamus.segmentasi(r) for r in transmisi]
+    jumlah_nada = sum(len(r) for r in transmisi)
+    jumlah_kata = sum(len(k) for k in kata_referensi)
+
+    hasil = {}
+    for n in ukuran:
+        blok = sinyal[:len(sinyal) // n * n].reshape(-1, n)
+        for engine, window, interpolasi in KONFIGURASI_JENDELA:
+            detektor = create_detector(engine, NOTE_FREQUENCIES, SAMPLE_RATE, TOLERANCE, window, interpolasi)
+            detektor.detect_batch(blok[:1])  # warm-up cache
+
+            mulai = time.perf_counter()
+            deteksi = detektor.detect_batch(blok)
+            per_blok = (time.perf_counter() - mulai) / len(blok)
+
+            tracker = NoteTracker(SAMPLE_RATE)
+            event = []
+            for d in deteksi:
+                event.extend(tracker.update(d, n))
+            event.extend(tracker.flush())
+
+            keluaran = [''] * len(transmisi)
+            terdeteksi = set()
+            latensi, palsu = [], 0
+            for tipe, nada, posisi in event:
+                if tipe != "note_detected":
+                    continue
+                keluaran[int(np.searchsorted(awal_transmisi, posisi - 1, side="right")) - 1] += nada
+                # Nada yang berbunyi di dalam blok [posisi - n, posisi)
+                cocok = None
+                for i in range(int(np.searchsorted(awal_nada, posisi, side="left")) - 1, -1, -1):
+                    awal, akhir, simbol = lini_nada[i]
+                    if akhir <= posisi - n:
+                        break
+                    if simbol == nada and i not in terdeteksi:
+                        cocok = i
+                        break
+                if cocok is None:
+                    palsu += 1
+                else:
+                    terdeteksi.add(cocok)
+                    latensi.append((posisi - lini_nada[cocok][0]) / SAMPLE_RATE + per_blok)
+
+            kesalahan_nada = sum(_jarak_edit(a, b) for a, b in zip(keluaran, transmisi))
+            kesalahan_kata = sum(_jarak_edit(kamus.segmentasi(a), b) for a, b in zip(keluaran, kata_referensi))
+            hasil[(n, f"{engine}/{window}/{interpolasi}")] = {
+                "kesalahan_nada": kesalahan_nada / jumlah_nada,
+                "kesalahan_kata": kesalahan_kata / jumlah_kata,
+                "deteksi_palsu": palsu,
+                "terlewat": jumlah_nada - len(terdeteksi),
+                "latensi_ms": float(np.median(latensi)) * 1e3 if latensi else float("nan"),
+                "us_per_blok": per_blok * 1e6,
+            }
+    return hasil
+
+
+def bench_multi_stream(jumlah_stream=16, detik=10.0):
+    """Faktor real-time dekode banyak stream dengan DSP 2-D per blok"""
+    from multi_stream import MultiStreamDecoder
+
+    rng = np.random.default_rng(7)
+    catatan = list(NOTE_FREQUENCIES.keys())
+    jumlah_blok = int(detik * SAMPLE_RATE) // FRAMES_PER_BUFFER
+    nada_per_blok = [rng.choice(catatan, jumlah_stream) for _ in range(8)]
+    blok = [
+        np.stack([buat_blok_nada(NOTE_FREQUENCIES[n], noise=0.01, rng=rng) for n in nada])
+        for nada in nada_per_blok
+    ]
+
+    decoder = MultiStreamDecoder(jumlah_stream)
+    for i in range(jumlah_blok):
+        decoder.process_block(blok[i % len(blok)])
+    decoder.flush()
+    stats = decoder.get_stats()
+    return {
+        "stream": jumlah_stream,
+        "faktor_real_time": stats["realtime_factor"],
+        "us_per_blok": stats["processing_seconds"] / stats["blocks"] * 1e6,
+    }
+
+
+def buat_sinyal_simbol(rangkaian, durasi, jeda, noise=0.05, rng=None):
+    """Sinyal transmisi: satu burst nada per simbol diikuti jeda, lalu hening penutup"""
+    from audio_processor import SILENCE_TIMEOUT
+
+    rng = rng or np.random.default_rng(0)
+    bagian = [np.zeros(int(0.1 * SAMPLE_RATE))]
+    t = np.arange(int(durasi * SAMPLE_RATE)) / SAMPLE_RATE
+    for nada in rangkaian:
+        fase = rng.uniform(0, 2 * np.pi)
+        bagian.append(0.5 * np.sin(2 * np.pi * NOTE_FREQUENCIES[nada] * t + fase))
+        bagian.append(np.zeros(int(jeda * SAMPLE_RATE)))
+    bagian.append(np.zeros(int((SILENCE_TIMEOUT + 0.5) * SAMPLE_RATE)))
+    sinyal = np.concatenate(bagian)
+    if noise:
+        sinyal += rng.normal(0, noise, len(sinyal))
+    return sinyal.astype(np.float32)
+
+
+def dekode_sinyal(sinyal, mode):
+    """Rangkaian nada hasil dekode sinyal dengan mode analisis tertentu"""
+    from audio_processor import DETECTOR_ENGINE, create_tracker
+
+    tracker = create_tracker(mode, SAMPLE_RATE)
+    detektor = create_detector(DETECTOR_ENGINE, NOTE_FREQUENCIES, SAMPLE_RATE, TOLERANCE)
+    event = []
+    for mulai in range(0, len(sinyal) - FRAMES_PER_BUFFER + 1, FRAMES_PER_BUFFER):
+        blok = sinyal[mulai:mulai + FRAMES_PER_BUFFER]
+        if mode == "stft":
+            event.extend(tracker.update(blok))
+        else:
+            event.extend(tracker.update(detektor.detect(blok), len(blok)))
+    event.extend(tracker.flush())
+    return ''.join(data for tipe, data, _ in event if tipe == "note_detected")
+
+
+def bench_analisis(jumlah_simbol=100, noise=0.05, durasi=(0.2, 0.1, 0.05, 0.03, 0.02, 0.015, 0.01)):
+    """Laju simbol vs tingkat kesalahan mode analisis block dan stft (jeda = 1/3 durasi simbol)"""
+    from audio_processor import ANALYSIS_MODES
+
+    rng = np.random.default_rng(21)
+    hasil = []
+    for d in durasi:
+        rangkaian = ''.join(rng.choice(list(NOTE_FREQUENCIES), jumlah_simbol))
+        sinyal = buat_sinyal_simbol(rangkaian, d, d / 3, noise, rng)
+        baris = {"durasi_ms": d * 1e3, "simbol_per_detik": 1 / (d + d / 3)}
+        for mode in ANALYSIS_MODES:
+            mulai = time.perf_counter()
+            keluaran = dekode_sinyal(sinyal, mode)
+            waktu = time.perf_counter() - mulai
+            baris[mode] = {
+                "kesalahan": _jarak_edit(keluaran, rangkaian) / len(rangkaian),
+                "real_time": len(sinyal) / SAMPLE_RATE / waktu,
+            }
+        hasil.append(baris)
+    return hasil
+
+
+def buat_kamus_acak(jumlah, panjang_maks=8, alfabet="1234567", rng=None):
+    """Kamus acak {kode: kata} untuk benchmark trie dan segmentasi"""
+    rng = rng or np.random.default_rng(0)
+    kamus = {}
+    while len(kamus) < jumlah:
+        panjang = int(rng.integers(1, panjang_maks + 1))
+        kode = ''.join(rng.choice(list(alfabet), panjang))
+        kamus[kode] = f"w{len(kamus)}"
+    return kamus
+
+
+def _segmentasi_referensi(kamus, rangkaian, panjang_maks):
+    """Referensi greedy naif berbasis slicing untuk verifikasi"""
+    hasil = []
+    i = 0
+    while i < len(rangkaian):
+        for panjang in range(min(panjang_maks, len(rangkaian) - i), 0, -1):
+            if rangkaian[i:i + panjang] in kamus:
+                hasil.append(kamus[rangkaian[i:i + panjang]])
+                i += panjang
+                break
+        else:
+            hasil.append(rangkaian[i])
+            i += 1
+    return hasil
+
+
+def _tidak_dikenal_minimum(kamus, rangkaian, panjang_maks):
+    """Jumlah minimum kode tidak dikenal (DP naif) untuk verifikasi mode optimal"""
+    n = len(rangkaian)
+    terbaik = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        terbaik[i] = terbaik[i + 1] + 1
+        for panjang in range(1, min(panjang_maks, n - i) + 1):
+            if rangkaian[i:i + panjang] in kamus:
+                terbaik[i] = min(terbaik[i], terbaik[i + panjang])
+    return terbaik[0]
+
+
+def bench_segmentasi(jumlah_kata=50000, panjang_input=20000, panjang_maks=8):
+    """Kecepatan dan kebenaran segmentasi greedy/optimal pada kamus dan input acak"""
+    from segmentasi import segmentasi
+    from trie import Trie
+
+    rng = np.random.default_rng(11)
+    kamus = buat_kamus_acak(jumlah_kata, panjang_maks, rng=rng)
+    trie = Trie()
+    for kode, kata in kamus.items():
+        trie.tambah(kode, kata)
+    rangkaian = ''.join(rng.choice(list("1234567"), panjang_input))
+
+    hasil = {}
+    for mode in ("greedy", "optimal"):
+        mulai = time.perf_counter()
+        token = segmentasi(trie, rangkaian, mode)
+        durasi = time.perf_counter() - mulai
+        hasil[mode] = {"us_per_kode": durasi / panjang_input * 1e6, "token": len(token)}
+
+    referensi = _segmentasi_referensi(kamus, rangkaian, panjang_maks)
+    hasil["greedy"]["benar"] = segmentasi(trie, rangkaian, "greedy") == referensi
+
+    optimal = segmentasi(trie, rangkaian, "optimal")
+    tidak_dikenal = sum(1 for t in optimal if not t.startswith("w"))
+    hasil["optimal"]["benar"] = tidak_dikenal == _tidak_dikenal_minimum(kamus, rangkaian, panjang_maks)
+    return hasil
+
+
+def _jarak_edit(a, b):
+    """Jarak Levenshtein antar daftar kata"""
+    baris = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        sebelumnya, baris[0] = baris[0], i
+        for j, y in enumerate(b, 1):
+            sebelumnya, baris[j] = baris[j], min(baris[j] + 1, baris[j - 1] + 1, sebelumnya + (x != y))
+    return baris[-1]
+
+
+def rusak_rangkaian(rangkaian, laju, alfabet="1234567", rng=None):
+    """Menyisipkan, menghapus, atau mengganti nada secara acak dengan peluang laju per nada"""
+    rng = rng or np.random.default_rng(0)
+    hasil = []
+    for nada in rangkaian:
+        r = rng.random()
+        if r < laju / 3:
+            continue
+        if r < 2 * laju / 3:
+            hasil.append(str(rng.choice(list(alfabet.replace(nada, '')))))
+        elif r < laju:
+            hasil.extend((nada, str(rng.choice(list(alfabet)))))
+        else:
+            hasil.append(nada)
+    return ''.join(hasil)
+
+
+def bench_beam(jumlah_kata=300, jumlah_kalimat=200, laju=0.05, lebar=(1, 2, 4, 8, 16, 32)):
+    """Akurasi kata vs lebar beam pada rangkaian yang dirusak (sisip/hapus/ganti)"""
+    from segmentasi import segmentasi, segmentasi_beam
+    from trie import Trie
+
+    rng = np.random.default_rng(3)
+    kamus = {}
+    while len(kamus) < jumlah_kata:
+        kode = ''.join(rng.choice(list("1234567"), int(rng.integers(3, 7))))
+        kamus[kode] = f"w{len(kamus)}"
+    trie = Trie()
+    for kode, kata in kamus.items():
+        trie.tambah(kode, kata)
+
+    kode = list(kamus.keys())
+    kalimat = [[kode[i] for i in rng.integers(0, len(kode), 8)] for _ in range(jumlah_kalimat)]
+    referensi = [[kamus[k] for k in kal] for kal in kalimat]
+    rusak = [rusak_rangkaian(''.join(kal), laju, rng=rng) for kal in kalimat]
+    jumlah_nada = sum(len(r) for r in rusak)
+    total_kata = sum(len(r) for r in referensi)
+
+    def ukur(dekode):
+        mulai = time.perf_counter()
+        keluaran = [dekode(r) for r in rusak]
+        durasi = time.perf_counter() - mulai
+        salah = sum(_jarak_edit(k, r) for k, r in zip(keluaran, referensi))
+        return {"akurasi_kata": 1 - salah / total_kata, "us_per_nada": durasi / jumlah_nada * 1e6}
+
+    hasil = {"greedy": ukur(lambda r: segmentasi(trie, r, "greedy"))}
+    for n in lebar:
+        hasil[f"beam-{n}"] = ukur(lambda r: segmentasi_beam(trie, r, n, anggaran_per_nada=None).kata)
+    return hasil
+
+
+def bench_trie(jumlah_kata=100000, panjang_maks=10, jumlah_cari=50000):
+    """Waktu bangun, memori, dan throughput pencarian tiap backend trie"""
+    from trie import BACKEND_TRIE, buat_trie
+
+    rng = np.random.default_rng(5)
+    kamus = buat_kamus_acak(jumlah_kata, panjang_maks, rng=rng)
+    kode = list(kamus.keys())
+    kueri = [kode[i] for i in rng.integers(0, len(kode), jumlah_cari)]
+
+    hasil = {}
+    for backend in BACKEND_TRIE:
+        trie = buat_trie(backend)
+        mulai = time.perf_counter()
+        for k, kata in kamus.items():
+            trie.tambah(k, kata)
+        bangun = time.perf_counter() - mulai
+
+        mulai = time.perf_counter()
+        for k in kueri:
+            trie.cari(k)
+        cari = time.perf_counter() - mulai
+
+        # Saran top-5 untuk prefix pendek (dekat root), seperti preview real-time
+        mulai = time.perf_counter()
+        for k in kueri:
+            list(trie.lengkapi(k[:2], 5))
+        lengkapi = time.perf_counter() - mulai
+
+        hasil[backend] = {
+            "bangun_s": bangun,
+            "cari_per_detik": jumlah_cari / cari,
+            "lengkapi_per_detik": jumlah_cari / lengkapi,
+            "memori_mb": trie.ukuran_memori() / 1e6,
+        }
+    return hasil
+
+
+def _persentil(nilai, p):
+    return float(np.percentile(nilai, p)) if len(nilai) else 0.0
+
+
+def buat_transmisi(kamus_file="kamus.txt", jumlah=20, kata_per_transmisi=(1, 4), rng=None):
+    """Daftar rangkaian kode transmisi acak dari kosakata kamus.txt"""
+    from kamus_biner import baca_kamus_teks
+
+    rng = rng or np.random.default_rng(0)
+    kode = [k for k, _ in baca_kamus_teks(kamus_file) if all(c in NOTE_FREQUENCIES for c in k)]
+    transmisi = []
+    for _ in range(jumlah):
+        jumlah_kata = int(rng.integers(kata_per_transmisi[0], kata_per_transmisi[1] + 1))
+        transmisi.append(''.join(kode[i] for i in rng.integers(0, len(kode), jumlah_kata)))
+    return transmisi
+
+
+def bench_end_to_end(kamus_file="kamus.txt", jumlah_transmisi=20, noise=0.001, jitter=0.1):
+    """Audio sintetis -> AudioProcessor -> Penerjemah untuk tiap mode analisis.
+
+    Transmisi dirender dari kosakata kamus pada frekuensi NOTE_FREQUENCIES
+    dan dialirkan lewat SyntheticSource secepat mungkin. Kalimat dianggap
+    benar jika sama dengan terjemahan rangkaian kode yang dikirim.
+    Latensi nada -> teks adalah waktu proses_input + preview per nada;
+    latensi kalimat adalah waktu get_kalimat di akhir transmisi.
+    """
+    from audio_processor import ANALYSIS_MODES, AudioProcessor, SILENCE_TIMEOUT
+    from audio_source import SyntheticSource
+    from penerjemah import Penerjemah
+
+    rng = np.random.default_rng(25)
+    transmisi = buat_transmisi(kamus_file, jumlah_transmisi, rng=rng)
+    sumber = SyntheticSource(
+        transmisi, NOTE_FREQUENCIES, SAMPLE_RATE, noise=noise, jitter=jitter,
+        silence_seconds=SILENCE_TIMEOUT + 0.5
+    )
+    penerjemah = Penerjemah(kamus_file)
+    referensi = [' '.join(penerjemah.kamus.segmentasi(r)) for r in transmisi]
+
+    hasil = {}
+    for mode in ANALYSIS_MODES:
+        pesan = queue.Queue()
+        prosesor = AudioProcessor(analysis_mode=mode, source=sumber)
+        mulai = time.perf_counter()
+        prosesor.start_listening(pesan)
+        durasi = time.perf_counter() - mulai
+
+        nada, kalimat, latensi_nada, latensi_kalimat = [], [], [], []
+        rangkaian = []
+        while not pesan.empty():
+            tipe, data = pesan.get()
+            if tipe == "note_detected":
+                t0 = time.perf_counter()
+                penerjemah.proses_input(data)
+                penerjemah.get_kalimat_sementara()
+                latensi_nada.append(time.perf_counter() - t0)
+                rangkaian.append(data)
+            elif tipe == "end_of_transmission":
+                t0 = time.perf_counter()
+                kalimat.append(penerjemah.get_kalimat())
+                latensi_kalimat.append(time.perf_counter() - t0)
+                penerjemah.reset()
+                nada.append(''.join(rangkaian))
+                rangkaian = []
+
+        kesalahan_nada = sum(_jarak_edit(a, b) for a, b in zip(nada, transmisi))
+        kesalahan_nada += sum(len(t) for t in transmisi[len(nada):])
+        hasil[mode] = {
+            "faktor_real_time": sumber.duration / durasi,
+            "kesalahan_nada": kesalahan_nada / sum(len(t) for t in transmisi),
+            "akurasi_kalimat": sum(a == b for a, b in zip(kalimat, referensi)) / len(referensi),
+            "latensi_nada_p50_us": _persentil(latensi_nada, 50) * 1e6,
+            "latensi_nada_p99_us": _persentil(latensi_nada, 99) * 1e6,
+            "latensi_kalimat_p50_us": _persentil(latensi_kalimat, 50) * 1e6,
+            "latensi_kalimat_p99_us": _persentil(latensi_kalimat, 99) * 1e6,
+        }
+    return hasil
+
+
+def bench_process_audio(jumlah_blok=2000, noise=0.05):
+    """Biaya AudioProcessor.process_audio per blok (deteksi + telemetri + tracker) per engine.
+
+    Setiap blok diukur terpisah; median dilaporkan agar gangguan penjadwal
+    tidak menggeser angka, p99 menunjukkan ekornya.
+    """
+    from audio_processor import AudioProcessor
+
+    rng = np.random.default_rng(24)
+    catatan = list(NOTE_FREQUENCIES.keys())
+    blok = [buat_blok_nada(NOTE_FREQUENCIES[n], noise=noise, rng=rng)
+            for n in rng.choice(catatan, jumlah_blok)]
+
+    hasil = {}
+    for engine in DETECTOR_ENGINES:
+        prosesor = AudioProcessor(detector_engine=engine)
+        prosesor.message_queue = queue.Queue()
+        prosesor.process_audio(blok[0])  # warm-up cache koefisien
+
+        durasi = []
+        for b in blok:
+            mulai = time.perf_counter()
+            prosesor.process_audio(b)
+            durasi.append(time.perf_counter() - mulai)
+        hasil[engine] = {
+            "us_per_blok": _persentil(durasi, 50) * 1e6,
+            "p99_us": _persentil(durasi, 99) * 1e6,
+        }
+    return hasil
+
+
+def _kode_unik(jumlah, alfabet="1234567", panjang_maks=8, rng=None):
+    """jumlah kode berbeda (panjang 1..panjang_maks) tanpa sampling ulang"""
+    rng = rng or np.random.default_rng(0)
+    basis = len(alfabet)
+    batas = np.cumsum([basis ** p for p in range(1, panjang_maks + 1)])
+    if jumlah > batas[-1]:
+        raise ValueError(f"Hanya ada {batas[-1]} kode dengan panjang <= {panjang_maks}")
+
+    # Indeks global -> (panjang, nilai basis-n) -> string
+    indeks = rng.choice(batas[-1], jumlah, replace=False)
+    panjang = np.searchsorted(batas, indeks, side="right") + 1
+    nilai = indeks - np.concatenate(([0], batas[:-1]))[panjang - 1]
+    simbol = np.array(list(alfabet))
+
+    kode = []
+    for p in range(1, panjang_maks + 1):
+        digit = (nilai[panjang == p][:, None] // basis ** np.arange(p - 1, -1, -1)) % basis
+        kode.extend(np.ascontiguousarray(simbol[digit]).view(f"<U{p}").ravel().tolist())
+    return [kode[i] for i in rng.permutation(len(kode))]
+
+
+def bench_skala_trie(ukuran=(10, 100, 1000, 10000, 100000, 1000000), jumlah_kueri=20000):
+    """Bangun, cari, dan cari_prefix tiap backend trie untuk kamus 10 s.d. 1 juta entri"""
+    from trie import BACKEND_TRIE, buat_trie
+
+    rng = np.random.default_rng(6)
+    hasil = {}
+    for jumlah in ukuran:
+        kode = _kode_unik(jumlah, rng=rng)
+        kueri = [kode[i] for i in rng.integers(0, jumlah, jumlah_kueri)]
+        # Prefix satu simbol lebih pendek: subtree kecil di semua ukuran kamus
+        prefix = [k[:-1] or k for k in kueri]
+
+        for backend in BACKEND_TRIE:
+            trie = buat_trie(backend)
+            mulai = time.perf_counter()
+            for i, k in enumerate(kode):
+                trie.tambah(k, f"w{i}")
+            bangun = time.perf_counter() - mulai
+
+            mulai = time.perf_counter()
+            for k in kueri:
+                trie.cari(k)
+            cari = time.perf_counter() - mulai
+
+            mulai = time.perf_counter()
+            for k in prefix:
+                trie.cari_prefix(k)
+            cari_prefix = time.perf_counter() - mulai
+
+            hasil[(jumlah, backend)] = {
+                "bangun_per_detik": jumlah / bangun,
+                "cari_per_detik": jumlah_kueri / cari,
+                "cari_prefix_per_detik": jumlah_kueri / cari_prefix,
+                "memori_mb": trie.ukuran_memori() / 1e6,
+            }
+            del trie
+    return hasil
+
+
+# Arah metrik untuk perbandingan baseline: +1 lebih besar lebih baik, -1 sebaliknya
+ARAH_METRIK = (
+    ("_per_detik", 1), ("akurasi", 1), ("real_time", 1),
+    ("benar", 1), ("us_per_", -1), ("_us", -1), ("_s", -1), ("latensi", -1), ("memori_mb", -1),
+    ("kesalahan", -1), ("palsu", -1), ("terlewat", -1),
+)
+
+# Bagian benchmark yang bisa dipilih dengan --bagian
+BAGIAN = ("detektor", "process_audio", "rencana_nada", "analisis", "jendela", "end_to_end",
+          "segmentasi", "trie", "skala_trie", "beam", "multi_stream")
+
+
+def _arah_metrik(nama):
+    for pola, arah in ARAH_METRIK:
+        if pola in nama:
+            return arah
+    return 0
+
+
+def _ratakan(data, prefix=""):
+    """Dict/list bersarang -> {"bagian/kunci/metrik": angka}; kunci tuple digabung dengan '-'"""
+    hasil = {}
+    item = enumerate(data) if isinstance(data, list) else data.items()
+    for kunci, nilai in item:
+        if isinstance(kunci, tuple):
+            kunci = '-'.join(str(k) for k in kunci)
+        nama = f"{prefix}/{kunci}" if prefix else str(kunci)
+        if isinstance(nilai, (dict, list)):
+            hasil.update(_ratakan(nilai, nama))
+        elif isinstance(nilai, (bool, int, float)):
+            hasil[nama] = float(nilai)
+    return hasil
+
+
+def _gabung_terbaik(metrik, baru):
+    """Nilai terbaik tiap metrik dari beberapa putaran (mengurangi noise pengukuran waktu)"""
+    hasil = dict(metrik)
+    for nama, nilai in baru.items():
+        lama = hasil.get(nama)
+        arah = _arah_metrik(nama.rsplit('/', 1)[-1])
+        if lama is None or arah * (nilai - lama) > 0:
+            hasil[nama] = nilai
+    return hasil
+
+
+def simpan_hasil(metrik, filename, putaran=1):
+    """Menulis metrik rata ({"bagian/kunci/metrik": angka}) sebagai JSON"""
+    dokumen = {
+        "waktu": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "mesin": platform.machine(),
+        "putaran": putaran,
+        "metrik": metrik,
+    }
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump(dokumen, file, indent=2, sort_keys=True)
+
+
+def bandingkan_baseline(metrik, filename, toleransi=0.15):
+    """Daftar (metrik, baseline, sekarang, perubahan) yang memburuk lebih dari toleransi"""
+    with open(filename, 'r', encoding='utf-8') as file:
+        baseline = json.load(file)["metrik"]
+
+    regresi = []
+    for nama, sekarang in metrik.items():
+        lama = baseline.get(nama)
+        arah = _arah_metrik(nama.rsplit('/', 1)[-1])
+        if lama is None or not arah:
+            continue
+        if lama == 0:
+            # Metrik kesalahan/akurasi bisa nol; bandingkan secara absolut
+            perubahan = sekarang - lama
+        else:
+            perubahan = (sekarang - lama) / abs(lama)
+        if arah * perubahan < -toleransi:
+            regresi.append((nama, lama, sekarang, perubahan))
+    return regresi
+
+
+def jalankan_bagian(args, bagian):
+    """Menjalankan dan mencetak bagian benchmark yang dipilih; mengembalikan hasil per bagian"""
+    hasil = {}
+
+    if "detektor" in bagian:
+        print(f"Detektor nada ({args.blok} blok x {FRAMES_PER_BUFFER} sampel, noise={args.noise}):")
+        hasil["detektor"] = bench_detektor(args.blok, args.noise)
+        for engine, data in hasil["detektor"].items():
+            print(f"  {engine:<9} {data['us_per_blok']:8.1f} us/blok  akurasi {data['akurasi']:.1%}")
+
+    if "process_audio" in bagian:
+        print(f"AudioProcessor.process_audio ({args.blok} blok):")
+        hasil["process_audio"] = bench_process_audio(args.blok, args.noise)
+        for engine, data in hasil["process_audio"].items():
+            print(f"  {engine:<9} {data['us_per_blok']:8.1f} us/blok  p99 {data['p99_us']:8.1f} us")
+
+    if "rencana_nada" in bagian:
+        print(f"Rencana nada (jarak 50 Hz, {FRAMES_PER_BUFFER} sampel, noise={args.noise}):")
+        hasil["rencana_nada"] = bench_rencana_nada(noise=args.noise)
+        for (jumlah, engine), data in hasil["rencana_nada"].items():
+            print(f"  {jumlah:3d} nada {engine:<9} {data['us_per_blok']:8.1f} us/blok  akurasi {data['akurasi']:.1%}")
+
+    if "analisis" in bagian:
+        print(f"Analisis block vs stft (jeda = 1/3 simbol, noise={args.noise}):")
+        hasil["analisis"] = bench_analisis(noise=args.noise)
+        for baris in hasil["analisis"]:
+            print(f"  {baris['durasi_ms']:5.0f} ms/simbol ({baris['simbol_per_detik']:5.1f}/s)  " + "  ".join(
+                f"{mode} {baris[mode]['kesalahan']:6.1%} salah {baris[mode]['real_time']:5.0f}x"
+                for mode in ("block", "stft")
+            ))
+
+    if "jendela" in bagian:
+        print(f"Panjang window deteksi ({args.kamus}, 20 transmisi, noise=0.001):")
+        hasil["jendela"] = bench_jendela(args.kamus)
+        for (n, konfigurasi), data in hasil["jendela"].items():
+            print(f"  {n:5d} {konfigurasi:<22} nada salah {data['kesalahan_nada']:6.1%}  "
+                  f"kata salah {data['kesalahan_kata']:6.1%}  palsu {data['deteksi_palsu']:3d}  "
+                  f"terlewat {data['terlewat']:3d}  latensi {data['latensi_ms']:5.1f} ms  "
+                  f"{data['us_per_blok']:6.1f} us/blok")
+
+    if "end_to_end" in bagian:
+        print(f"End-to-end audio -> teks ({args.kamus}, 20 transmisi):")
+        hasil["end_to_end"] = bench_end_to_end(args.kamus)
+        for mode, data in hasil["end_to_end"].items():
+            print(f"  {mode:<6} {data['faktor_real_time']:6.0f}x real-time  "
+                  f"nada salah {data['kesalahan_nada']:6.1%}  kalimat benar {data['akurasi_kalimat']:6.1%}  "
+                  f"latensi nada p50/p99 {data['latensi_nada_p50_us']:.0f}/{data['latensi_nada_p99_us']:.0f} us  "
+                  f"kalimat {data['latensi_kalimat_p50_us']:.0f}/{data['latensi_kalimat_p99_us']:.0f} us")
+
+    if "segmentasi" in bagian:
+        print("Segmentasi (50000 kata, 20000 kode):")
+        hasil["segmentasi"] = bench_segmentasi()
+        for mode, data in hasil["segmentasi"].items():
+            print(f"  {mode:<9} {data['us_per_kode']:8.2f} us/kode  {data['token']} token  "
+                  f"{'OK' if data['benar'] else 'SALAH'}")
+
+    if "trie" in bagian:
+        print("Trie (100000 kata):")
+        hasil["trie"] = bench_trie()
+        for backend, data in hasil["trie"].items():
+            print(f"  {backend:<9} bangun {data['bangun_s']:.2f} s  "
+                  f"{data['cari_per_detik'] / 1e3:.0f}k cari/s  "
+                  f"{data['lengkapi_per_detik'] / 1e3:.0f}k lengkapi/s  memori {data['memori_mb']:.1f} MB")
+
+    if "skala_trie" in bagian:
+        ukuran = tuple(10 ** p for p in range(1, 7) if 10 ** p <= args.skala_maks)
+        print(f"Skala trie ({ukuran[0]} s.d. {ukuran[-1]} entri):")
+        hasil["skala_trie"] = bench_skala_trie(ukuran)
+        for (jumlah, backend), data in hasil["skala_trie"].items():
+            print(f"  {jumlah:8d} {backend:<6} {data['bangun_per_detik'] / 1e3:6.0f}k tambah/s  "
+                  f"{data['cari_per_detik'] / 1e3:5.0f}k cari/s  "
+                  f"{data['cari_prefix_per_detik'] / 1e3:5.0f}k cari_prefix/s  memori {data['memori_mb']:7.1f} MB")
+
+    if "beam" in bagian:
+        print(f"Beam search (300 kata, laju kerusakan {args.rusak:.0%} per nada):")
+        hasil["beam"] = bench_beam(laju=args.rusak)
+        for nama, data in hasil["beam"].items():
+            print(f"  {nama:<9} akurasi kata {data['akurasi_kata']:6.1%}  {data['us_per_nada']:8.1f} us/nada")
+
+    if "multi_stream" in bagian:
+        data = hasil["multi_stream"] = bench_multi_stream(args.stream)
+        print(f"Multi-stream ({data['stream']} stream): {data['us_per_blok']:.1f} us/blok, "
+              f"{data['faktor_real_time']:.0f}x real-time")
+    return hasil
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Machine Language Translator")
+    parser.add_argument("--blok", type=int, default=2000, help="Jumlah blok audio")
+    parser.add_argument("--noise", type=float, default=0.05, help="Deviasi standar noise")
+    parser.add_argument("--rusak", type=float, default=0.05, help="Laju kerusakan nada untuk benchmark beam")
+    parser.add_argument("--stream", type=int, default=16, help="Jumlah stream untuk benchmark multi-stream")
+    parser.add_argument("--kamus", default="kamus.txt", help="Kosakata transmisi end-to-end")
+    parser.add_argument("--skala-maks", type=int, default=1000000,
+                        help="Ukuran kamus terbesar untuk benchmark skala trie")
+    parser.add_argument("--bagian", default=None,
+                        help=f"Bagian yang dijalankan, dipisah koma ({', '.join(BAGIAN)})")
+    parser.add_argument("--ulang", type=int, default=1,
+                        help="Jumlah putaran; metrik menyimpan nilai terbaik dari semua putaran")
+    parser.add_argument("--json", default=None, help="Tulis hasil (metrik rata) ke file JSON")
+    parser.add_argument("--baseline", default=None, help="File JSON hasil sebelumnya untuk deteksi regresi")
+    parser.add_argument("--toleransi", type=float, default=0.15,
+                        help="Perubahan relatif terburuk yang masih diterima terhadap baseline")
+    args = parser.parse_args()
+
+    bagian = args.bagian.split(",") if args.bagian else BAGIAN
+    tidak_dikenal = set(bagian) - set(BAGIAN)
+    if tidak_dikenal:
+        parser.error(f"Bagian tidak dikenal: {', '.join(sorted(tidak_dikenal))}")
+
+    metrik = {}
+    for putaran in range(args.ulang):
+        if args.ulang > 1:
+            print(f"== Putaran {putaran + 1}/{args.ulang} ==")
+        metrik = _gabung_terbaik(metrik, _ratakan(jalankan_bagian(args, bagian)))
+
+    if args.json:
+        simpan_hasil(metrik, args.json, args.ulang)
+        print(f"Hasil ditulis ke {args.json}")
+
+    if args.baseline:
+        regresi = bandingkan_baseline(metrik, args.baseline, args.toleransi)
+        if not regresi:
+            print(f"Tidak ada regresi terhadap {args.baseline} (toleransi {args.toleransi:.0%})")
+            return 0
+        print(f"Regresi terhadap {args.baseline} (toleransi {args.toleransi:.0%}):")
+        for nama, lama, sekarang, perubahan in regresi:
+            print(f"  {nama:<50} {lama:12.4g} -> {sekarang:12.4g}  ({perubahan:+.1%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
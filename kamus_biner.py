@@ -0,0 +1,187 @@
+import argparse
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from tone_plan import configured_alphabet
+from trie import ALFABET_DEFAULT, TrieArray
+
+# Format image biner kamus (little-endian):
+#   header  : magic, versi, panjang alfabet (byte), jumlah node, jumlah kata,
+#             jumlah kode, ukuran blob kata
+#   alfabet : UTF-8, dipadding ke kelipatan 4 byte
+#   anak    : int32[jumlah node x ukuran alfabet]
+#   kata    : int32[jumlah node] (indeks tabel kata, -1 jika bukan akhir kata)
+#   offset  : uint32[jumlah kata + 1] (posisi kata di blob)
+#   blob    : kata-kata UTF-8 berurutan
+MAGIC = b"RLKAMUS\0"
+VERSI = 1
+HEADER = struct.Struct("<8sIIIIII")
+
+
+def urai_kamus(baris, alfabet=None, sumber="kamus", mulai=1):
+    """Pasangan (kode, kata) dari baris-baris kamus teks.
+
+    Jika alfabet diberikan, baris yang kodenya kosong atau memuat simbol di
+    luar alfabet (mis. salah ketik) dilewati dengan peringatan, bukan
+    dimasukkan ke trie.
+    """
+    simbol = set(alfabet) if alfabet is not None else None
+    for nomor, line in enumerate(baris, mulai):
+        line = line.strip()
+        if line and '=' in line:
+            kode, kata = line.split('=', 1)
+            kode = kode.strip()
+            if simbol is not None and (not kode or not simbol.issuperset(kode)):
+                print(f"{sumber}:{nomor}: kode {kode!r} di luar alfabet {alfabet!r}, dilewati")
+                continue
+            yield kode, kata.strip()
+
+
+def baca_kamus_teks(filename, alfabet=None):
+    """Membaca pasangan (kode, kata) dari file kamus teks (lihat urai_kamus)"""
+    with open(filename, 'r', encoding='utf-8') as file:
+        yield from urai_kamus(file, alfabet, filename)
+
+
+def path_biner(kamus_file):
+    """Lokasi image biner untuk file kamus teks (kamus.txt -> kamus.bin)"""
+    return os.path.splitext(kamus_file)[0] + ".bin"
+
+
+def _padding(n, kelipatan=4):
+    return -n % kelipatan
+
+
+class TabelKata:
+    """Tabel kata read-only di atas buffer mmap; kata di-decode saat diakses"""
+
+    def __init__(self, offset, blob):
+        self._offset = offset
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offset) - 1
+
+    def __getitem__(self, indeks):
+        return str(self._blob[self._offset[indeks]:self._offset[indeks + 1]], 'utf-8')
+
+    def __iter__(self):
+        for indeks in range(len(self)):
+            yield self[indeks]
+
+    def ukuran_memori(self):
+        return self._offset.nbytes + self._blob.nbytes
+
+
+def kompilasi(kamus_file, output=None, alfabet=ALFABET_DEFAULT):
+    """Mengompilasi kamus teks menjadi image biner trie; mengembalikan path output"""
+    output = output or path_biner(kamus_file)
+    trie = TrieArray(alfabet)
+    for kode, kata in baca_kamus_teks(kamus_file, alfabet):
+        trie.tambah(kode, kata)
+
+    anak, kata_node, tabel_kata = trie.ekspor()
+    blob_kata = [kata.encode('utf-8') for kata in tabel_kata]
+    offset = np.zeros(len(blob_kata) + 1, dtype='<u4')
+    offset[1:] = np.cumsum([len(b) for b in blob_kata])
+    blob = b''.join(blob_kata)
+    alfabet = trie.alfabet.encode('utf-8')
+
+    # Tulis ke file sementara lalu ganti secara atomik, agar proses lain
+    # yang sedang memetakan image lama tidak melihat file setengah jadi
+    folder = os.path.dirname(os.path.abspath(output))
+    fd, sementara = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(HEADER.pack(
+                MAGIC, VERSI, len(alfabet), len(kata_node), len(blob_kata), len(trie), len(blob)
+            ))
+            file.write(alfabet + b'\0' * _padding(len(alfabet)))
+            file.write(anak.astype('<i4').tobytes())
+            file.write(kata_node.astype('<i4').tobytes())
+            file.write(offset.tobytes())
+            file.write(blob)
+        os.replace(sementara, output)
+    except BaseException:
+        os.unlink(sementara)
+        raise
+    return output
+
+
+def muat(filename):
+    """Memetakan image biner ke memori dan mengembalikan TrieArray tanpa parsing"""
+    with open(filename, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"{filename}: image kamus terpotong")
+    magic, versi, panjang_alfabet, jumlah_node, jumlah_kata, jumlah_kode, ukuran_blob = \
+        HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{filename} bukan image kamus")
+    if versi != VERSI:
+        raise ValueError(f"{filename}: versi image {versi} tidak didukung")
+
+    posisi = HEADER.size
+    alfabet = bytes(buffer[posisi:posisi + panjang_alfabet]).decode('utf-8')
+    posisi += panjang_alfabet + _padding(panjang_alfabet)
+
+    anak = np.frombuffer(buffer, dtype='<i4', count=jumlah_node * len(alfabet), offset=posisi)
+    posisi += anak.nbytes
+    kata_node = np.frombuffer(buffer, dtype='<i4', count=jumlah_node, offset=posisi)
+    posisi += kata_node.nbytes
+    offset = np.frombuffer(buffer, dtype='<u4', count=jumlah_kata + 1, offset=posisi)
+    posisi += offset.nbytes
+    blob = memoryview(buffer)[posisi:posisi + ukuran_blob]
+
+    tabel_kata = TabelKata(memoryview(offset), blob)
+    return TrieArray.dari_array(alfabet, anak, kata_node, tabel_kata, jumlah_kode)
+
+
+def perlu_kompilasi(kamus_file, biner=None):
+    """True jika image biner belum ada atau lebih lama dari file teks"""
+    biner = biner or path_biner(kamus_file)
+    try:
+        return os.path.getmtime(biner) < os.path.getmtime(kamus_file)
+    except OSError:
+        return True
+
+
+def muat_atau_kompilasi(kamus_file, biner=None, alfabet=ALFABET_DEFAULT):
+    """Memuat image biner, mengompilasi ulang dulu jika file teks lebih baru"""
+    biner = biner or path_biner(kamus_file)
+    if perlu_kompilasi(kamus_file, biner):
+        kompilasi(kamus_file, biner, alfabet)
+    try:
+        trie = muat(biner)
+    except ValueError:
+        # Image rusak atau versi lama: kompilasi ulang sekali
+        kompilasi(kamus_file, biner, alfabet)
+        return muat(biner)
+
+    if not set(alfabet) <= set(trie.alfabet):
+        # Image dikompilasi untuk alfabet lebih kecil; tambah_kata akan gagal
+        kompilasi(kamus_file, biner, alfabet)
+        return muat(biner)
+    return trie
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kompilasi kamus teks menjadi image biner trie")
+    parser.add_argument("kamus", nargs="?", default="kamus.txt", help="File kamus teks")
+    parser.add_argument("-o", "--output", default=None, help="File image biner")
+    parser.add_argument("--alfabet", default=None,
+                        help="Alfabet kode (simbol rencana nada, berurutan); default dari nada.txt")
+    args = parser.parse_args()
+
+    output = kompilasi(args.kamus, args.output, args.alfabet or configured_alphabet())
+    trie = muat(output)
+    print(f"{output}: {len(trie)} entri, {os.path.getsize(output)} byte")
+
+
+if __name__ == "__main__":
+    main()
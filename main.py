@@ -2,12 +2,82 @@ import customtkinter as ctk
 import threading
 import queue
 import json
+import time
 from datetime import datetime
+from collections import deque
 import os
 from tkinter import filedialog, messagebox
 import numpy as np
-from audio_processor import AudioProcessor
+from audio_processor import NOTE_ALPHABET, AudioProcessor
 from penerjemah import Penerjemah
+from pengawas_kamus import PengawasKamus
+from transkrip import Transkrip
+
+# Jurnal append-only untuk transkrip yang sudah keluar dari jendela memori
+JURNAL_TRANSKRIP = "transkrip_jurnal.jsonl"
+
+# Jumlah saran kata di preview
+JUMLAH_SARAN = 3
+
+# Batas baris panel; baris terlama dibuang agar UI tidak tumbuh tanpa batas
+MAX_NOTE_LINES = 500
+MAX_HISTORY_LINES = 50
+
+# Poll interval adapts between these bounds (ms): short while messages flow,
+# backing off exponentially while idle
+POLL_MIN_MS = 10
+POLL_MAX_MS = 100
+# Time budget (seconds) for draining the queue in one frame
+FRAME_BUDGET = 0.008
+
+class BoundedTextPanel:
+    """Read-only panel backed by a bounded deque of lines and a single text widget.
+    
+    Appending never creates widgets; once max_lines is reached the oldest
+    line is dropped from both the model and the widget, so memory and
+    redraw cost stay flat no matter how long the session runs.
+    """
+    
+    def __init__(self, master, max_lines, **textbox_kwargs):
+        self.lines = deque(maxlen=max_lines)
+        # Lines pushed out of the panel since the last clear
+        self.dropped = 0
+        self.textbox = ctk.CTkTextbox(master, wrap="word", **textbox_kwargs)
+        self.textbox.configure(state="disabled")
+    
+    def pack(self, **kwargs):
+        self.textbox.pack(**kwargs)
+    
+    def tag_config(self, tag, **kwargs):
+        self.textbox.tag_config(tag, **kwargs)
+    
+    def append(self, line, tag=None):
+        self.extend([(line, tag)])
+    
+    def extend(self, entries):
+        """Append (line, tag) pairs with a single widget update"""
+        entries = list(entries)
+        if not entries:
+            return
+        self.dropped += max(0, len(self.lines) + len(entries) - self.lines.maxlen)
+        entries = entries[-self.lines.maxlen:]
+        drop = max(0, len(self.lines) + len(entries) - self.lines.maxlen)
+        self.lines.extend(line for line, _ in entries)
+        
+        self.textbox.configure(state="normal")
+        if drop:
+            self.textbox.delete("1.0", f"{drop + 1}.0")
+        for line, tag in entries:
+            self.textbox.insert("end", line + "\n", tag)
+        self.textbox.configure(state="disabled")
+        self.textbox.see("end")
+    
+    def clear(self):
+        self.lines.clear()
+        self.dropped = 0
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.configure(state="disabled")
 
 class MachineLanguageTranslator:
     def __init__(self):
@@ -26,8 +96,28 @@ class MachineLanguageTranslator:
         self.current_amplitude = 0.0
         self.rangkaian_nada = ""
         
+        # Widget updates collected while draining the queue, applied once per frame
+        self.poll_interval = POLL_MAX_MS
+        self.telemetry_seq = 0
+        self.pending_note_lines = []
+        self.pending_history = []
+        self.pending_note_text = None
+        self.pending_frequency = None
+        self.pending_level = None
+        self.pending_result = None
+        self.pending_preview = None
+        self.preview_dirty = False
+        self.stats_dirty = False
+        
         # Initialize components
-        self.mesin_penerjemah = Penerjemah("kamus.txt")
+        transkrip = Transkrip(jurnal=JURNAL_TRANSKRIP)
+        # Saving covers this session only, not earlier runs in the same journal
+        self.journal_offset = transkrip.ukuran_jurnal()
+        self.mesin_penerjemah = Penerjemah(
+            "kamus.txt", trie_backend="mmap", transkrip=transkrip, alfabet=NOTE_ALPHABET
+        )
+        self.pengawas_kamus = PengawasKamus(self.mesin_penerjemah)
+        self.pengawas_kamus.start()
         self.audio_processor = AudioProcessor()
         self.message_queue = queue.Queue()
         
@@ -86,8 +176,11 @@ class MachineLanguageTranslator:
         note_label = ctk.CTkLabel(left_frame, text="Note Sequence", font=("Arial", 16, "bold"))
         note_label.pack(pady=5)
         
-        self.note_sequence_list = ctk.CTkScrollableFrame(left_frame, width=250)
+        self.note_sequence_list = BoundedTextPanel(
+            left_frame, MAX_NOTE_LINES, width=250, font=("Courier New", 12)
+        )
         self.note_sequence_list.pack(fill="both", expand=True, padx=5, pady=5)
+        self.note_sequence_list.tag_config("end_marker", foreground="gray")
         
         # === CENTER PANEL: Status & Text Areas ===
         center_frame = ctk.CTkFrame(self.root)
@@ -180,7 +273,7 @@ class MachineLanguageTranslator:
         history_label = ctk.CTkLabel(right_frame, text="Translation History", font=("Arial", 16, "bold"))
         history_label.pack(pady=5)
         
-        self.history_list = ctk.CTkScrollableFrame(right_frame, width=250)
+        self.history_list = BoundedTextPanel(right_frame, MAX_HISTORY_LINES, width=250, font=("Arial", 11))
         self.history_list.pack(fill="both", expand=True, padx=5, pady=5)
         
         # === BOTTOM: Info Bar ===
@@ -242,12 +335,19 @@ class MachineLanguageTranslator:
         self.preview_text.configure(state="disabled")
         
         # Clear note sequence list
-        for widget in self.note_sequence_list.winfo_children():
-            widget.destroy()
+        self.note_sequence_list.clear()
         
         self.mesin_penerjemah.reset()
         self.word_count = 0
         self.note_count = 0
+        self.pending_note_lines.clear()
+        self.pending_history.clear()
+        self.pending_note_text = None
+        self.pending_frequency = None
+        self.pending_level = None
+        self.pending_result = None
+        self.pending_preview = None
+        self.preview_dirty = False
         self.update_stats()
         self.rangkaian_nada = ""
     
@@ -260,20 +360,24 @@ class MachineLanguageTranslator:
         
         if filename:
             try:
+                # Full transcript of this session: journal plus the in-memory window
+                transcript = self.mesin_penerjemah.kalimat_final.semua(self.journal_offset)
                 with open(filename, 'w', encoding='utf-8') as file:
                     file.write("=== Machine Language Translation ===\n")
                     file.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
                     file.write("Result:\n")
                     file.write(self.result_text.get("1.0", "end-1c") + "\n\n")
-                    file.write("Note Sequence:\n")
-                    
-                    # Get note sequence from list
-                    notes = []
-                    for widget in self.note_sequence_list.winfo_children():
-                        if hasattr(widget, 'cget'):
-                            notes.append(widget.cget("text"))
+                    file.write("Transcript:\n")
+                    for waktu, teks in transcript:
+                        file.write(f"{datetime.fromtimestamp(waktu).strftime('%H:%M:%S')} - {teks}\n")
+                    file.write("\n")
                     
-                    for note in notes:
+                    file.write("Note Sequence:\n")
+                    dropped = self.note_sequence_list.dropped
+                    if dropped:
+                        file.write(f"({dropped} earlier lines not kept; "
+                                   f"showing the last {len(self.note_sequence_list.lines)})\n")
+                    for note in self.note_sequence_list.lines:
                         file.write(note + "\n")
                 
                 messagebox.showinfo("Success", "Translation saved successfully!")
@@ -281,106 +385,143 @@ class MachineLanguageTranslator:
                 messagebox.showerror("Error", f"Failed to save file: {str(e)}")
     
     def on_reset_dictionary_clicked(self):
-        self.mesin_penerjemah = Penerjemah("kamus.txt")
+        # Muat ulang tanpa membuang rangkaian nada yang sedang diterjemahkan
+        self.mesin_penerjemah.muat_ulang_kamus()
         messagebox.showinfo("Dictionary Reset", "Dictionary has been reloaded from kamus.txt")
     
     def handle_note_detected(self, note):
         self.note_count += 1
-        self.current_note_label.configure(text=f"Current Note: {note}")
+        self.pending_note_text = f"Current Note: {note}"
         
         # Add to note sequence display
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        note_label = ctk.CTkLabel(
-            self.note_sequence_list,
-            text=f"{timestamp} - Note: {note}",
-            font=("Courier New", 12)
-        )
-        note_label.pack(anchor="w", padx=5, pady=2)
+        self.pending_note_lines.append((f"{timestamp} - Note: {note}", None))
         
         # Update audio level bar
-        self.audio_level_bar.set(min(self.current_amplitude * 100, 1.0))
+        self.pending_level = min(self.current_amplitude * 100, 1.0)
         
-        # Process through translator
+        # Process through translator; the preview is rebuilt once per frame
         self.mesin_penerjemah.proses_input(note)
-        hasil_pratinjau = self.mesin_penerjemah.get_kalimat_sementara()
-        
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", "end")
-        self.preview_text.insert("1.0", hasil_pratinjau)
-        self.preview_text.configure(state="disabled")
-        
-        self.update_stats()
+        self.preview_dirty = True
+        self.stats_dirty = True
     
     def handle_end_of_transmission(self):
         hasil_final = self.mesin_penerjemah.get_kalimat()
         
-        self.result_text.configure(state="normal")
-        self.result_text.delete("1.0", "end")
-        self.result_text.insert("1.0", hasil_final)
-        self.result_text.configure(state="disabled")
+        self.pending_result = hasil_final
+        self.word_count = len(hasil_final.split())
+        self.stats_dirty = True
         
         if hasil_final:
             self.add_to_history(hasil_final)
         
+        # Keep showing the last preview of this transmission, as before
+        if self.preview_dirty:
+            self.pending_preview = self.build_preview()
+            self.preview_dirty = False
+        
         self.mesin_penerjemah.reset()
         
         # Add end marker to note sequence
-        end_label = ctk.CTkLabel(
-            self.note_sequence_list,
-            text="--- End of Transmission ---",
-            font=("Courier New", 12, "italic"),
-            text_color="gray"
-        )
-        end_label.pack(anchor="w", padx=5, pady=2)
+        self.pending_note_lines.append(("--- End of Transmission ---", "end_marker"))
         
-        self.current_note_label.configure(text="Current Note: -")
-        self.audio_level_bar.set(0)
+        self.pending_note_text = "Current Note: -"
+        self.pending_level = 0
     
     def handle_frequency_detected(self, frequency, amplitude):
         self.current_frequency = frequency
         self.current_amplitude = amplitude
-        self.frequency_label.configure(text=f"Frequency: {frequency:.2f} Hz")
+        self.pending_frequency = "Frequency: -" if frequency is None else f"Frequency: {frequency:.2f} Hz"
         
         if self.is_listening:
             # Update audio level based on amplitude
             level = min(amplitude * 200, 100)
-            self.audio_level_bar.set(level / 100)
+            self.pending_level = level / 100
     
     def update_stats(self):
-        # Count words in result
-        text = self.result_text.get("1.0", "end-1c")
-        self.word_count = len(text.split())
-        
         self.stats_label.configure(text=f"Words: {self.word_count} | Notes: {self.note_count}")
     
     def add_to_history(self, text):
         timestamp = datetime.now().strftime("%H:%M:%S")
-        history_item = ctk.CTkLabel(
-            self.history_list,
-            text=f"{timestamp} - {text}",
-            font=("Arial", 11),
-            wraplength=230
-        )
-        history_item.pack(anchor="w", padx=5, pady=2)
+        self.pending_history.append((f"{timestamp} - {text}", None))
+    
+    def build_preview(self):
+        hasil_pratinjau = self.mesin_penerjemah.get_kalimat_sementara()
         
-        # Limit history to 50 items
-        children = self.history_list.winfo_children()
-        if len(children) > 50:
-            children[0].destroy()
+        saran = self.mesin_penerjemah.get_saran(JUMLAH_SARAN)
+        if saran:
+            hasil_pratinjau += "   →  " + ", ".join(f"{kata} ({kode})" for kode, kata in saran)
+        return hasil_pratinjau
+    
+    def apply_pending_updates(self):
+        """Apply all widget updates collected during this frame at once"""
+        if self.pending_note_lines:
+            self.note_sequence_list.extend(self.pending_note_lines)
+            self.pending_note_lines.clear()
+        
+        if self.pending_history:
+            self.history_list.extend(self.pending_history)
+            self.pending_history.clear()
+        
+        if self.pending_result is not None:
+            self.result_text.configure(state="normal")
+            self.result_text.delete("1.0", "end")
+            self.result_text.insert("1.0", self.pending_result)
+            self.result_text.configure(state="disabled")
+            self.pending_result = None
+        
+        if self.preview_dirty:
+            self.pending_preview = self.build_preview()
+            self.preview_dirty = False
+        
+        if self.pending_preview is not None:
+            self.preview_text.configure(state="normal")
+            self.preview_text.delete("1.0", "end")
+            self.preview_text.insert("1.0", self.pending_preview)
+            self.preview_text.configure(state="disabled")
+            self.pending_preview = None
+        
+        if self.pending_note_text is not None:
+            self.current_note_label.configure(text=self.pending_note_text)
+            self.pending_note_text = None
+        
+        if self.pending_frequency is not None:
+            self.frequency_label.configure(text=self.pending_frequency)
+            self.pending_frequency = None
+        
+        if self.pending_level is not None:
+            self.audio_level_bar.set(self.pending_level)
+            self.pending_level = None
+        
+        if self.stats_dirty:
+            self.update_stats()
+            self.stats_dirty = False
     
     def poll_message_queue(self):
-        """Check for messages from audio thread"""
+        """Drain messages from the audio thread in one batch per frame.
+        
+        Draining stops when FRAME_BUDGET is spent; the rest is picked up on
+        the next frame, which is scheduled right away. Frequency and amplitude
+        are read from the telemetry slot rather than the queue, and widgets
+        are updated once per frame.
+        """
+        deadline = time.perf_counter() + FRAME_BUDGET
+        processed = 0
+        backlog = False
+        
         try:
             while True:
-                message = self.message_queue.get_nowait()
-                msg_type, data = message
+                if processed and time.perf_counter() >= deadline:
+                    backlog = True
+                    break
+                
+                msg_type, data = self.message_queue.get_nowait()
+                processed += 1
                 
                 if msg_type == "note_detected":
                     self.handle_note_detected(data)
                 elif msg_type == "end_of_transmission":
                     self.handle_end_of_transmission()
-                elif msg_type == "frequency_detected":
-                    self.handle_frequency_detected(data[0], data[1])
                 elif msg_type == "error":
                     messagebox.showerror("Audio Error", data)
                     self.status_label.configure(
@@ -391,11 +532,30 @@ class MachineLanguageTranslator:
         except queue.Empty:
             pass
         
+        # Latest meter value only; intermediate values are never displayed
+        sample = self.audio_processor.telemetry.latest(since=self.telemetry_seq)
+        if sample is not None:
+            self.telemetry_seq = sample.seq
+            self.handle_frequency_detected(sample.frequency, sample.amplitude)
+        self.apply_pending_updates()
+        
+        # Adapt the poll interval to traffic
+        if backlog:
+            self.poll_interval = 1
+        elif processed:
+            self.poll_interval = POLL_MIN_MS
+        else:
+            self.poll_interval = min(self.poll_interval * 2, POLL_MAX_MS)
+        
         # Schedule next poll
-        self.root.after(100, self.poll_message_queue)
+        self.root.after(self.poll_interval, self.poll_message_queue)
     
     def run(self):
         self.root.mainloop()
+        try:
+            self.mesin_penerjemah.kalimat_final.tutup()
+        except OSError as e:
+            print(e)
 
 if __name__ == "__main__":
     app = MachineLanguageTranslator()
@@ -0,0 +1,254 @@
+import argparse
+import queue
+import time
+
+import numpy as np
+
+from analysis_worker import AnalysisWorker, BlockQueue
+from audio_processor import (
+    ANALYSIS_QUEUE_SIZE, DETECTOR_ENGINE, FRAMES_PER_BUFFER, NOTE_ALPHABET, NOTE_FREQUENCIES,
+    OVERFLOW_POLICY, SAMPLE_RATE, TOLERANCE, NoteTracker
+)
+from audio_source import PortAudioSource
+from penerjemah import Kamus
+from tone_detector import create_detector
+from wav_file import WavFile
+
+
+class StreamSession:
+    """State satu stream: tracker nada, sesi penerjemah sendiri, dan statistik"""
+
+    def __init__(self, stream_id, sample_rate, kamus):
+        self.stream_id = stream_id
+        self.tracker = NoteTracker(sample_rate=sample_rate)
+        self.penerjemah = kamus.sesi_baru()
+        self.sample_rate = sample_rate
+        self.samples = 0
+        self.notes = 0
+        self.transmissions = 0
+
+    def handle(self, detection, n_samples):
+        """Memproses hasil deteksi satu blok; mengembalikan event untuk stream ini"""
+        self.samples += n_samples
+        events = []
+        for msg_type, data, position in self.tracker.update(detection, n_samples):
+            events.extend(self._translate(msg_type, data))
+        return events
+
+    def flush(self):
+        """Menutup transmisi yang masih terbuka"""
+        events = []
+        for msg_type, data, position in self.tracker.flush():
+            events.extend(self._translate(msg_type, data))
+        return events
+
+    def _translate(self, msg_type, data):
+        if msg_type == "note_detected":
+            self.notes += 1
+            self.penerjemah.proses_input(data)
+            return [("note_detected", data)]
+
+        kalimat = self.penerjemah.get_kalimat()
+        self.penerjemah.reset()
+        self.transmissions += 1
+        return [("end_of_transmission", kalimat)]
+
+
+class MultiStreamDecoder:
+    """Mendekode banyak stream sekaligus dengan satu operasi DSP 2-D per blok.
+
+    Setiap stream punya sesi penerjemah sendiri di atas satu Kamus bersama.
+    Event dikirim ke message_queue sebagai (tipe, (stream_id, data)).
+    Sumber berupa daftar (WavFile, kanal) untuk decode_files (lihat
+    from_files) atau kanal-kanal satu perangkat input (listen_device).
+    """
+
+    def __init__(self, n_streams, message_queue=None, sample_rate=SAMPLE_RATE,
+                 engine=DETECTOR_ENGINE, kamus_file="kamus.txt", files=None):
+        if files is not None and len(files) != n_streams:
+            raise ValueError(f"{len(files)} file sumber untuk {n_streams} stream")
+        self.n_streams = n_streams
+        self.files = files
+        self.message_queue = message_queue
+        self.sample_rate = sample_rate
+        self.detector = create_detector(engine, NOTE_FREQUENCIES, sample_rate, TOLERANCE)
+        self.kamus = Kamus(kamus_file, alfabet=NOTE_ALPHABET)
+        self.sessions = [StreamSession(i, sample_rate, self.kamus) for i in range(n_streams)]
+        self.processing_time = 0.0
+        self.blocks = 0
+
+        self.source = None
+        self.worker = None
+
+    def process_block(self, blocks):
+        """Memproses satu blok (stream, sampel) untuk semua stream"""
+        mulai = time.perf_counter()
+        detections = self.detector.detect_batch(blocks)
+
+        results = []
+        n_samples = blocks.shape[1]
+        for session, detection in zip(self.sessions, detections):
+            for event in session.handle(detection, n_samples):
+                results.append((session.stream_id, event))
+
+        self.processing_time += time.perf_counter() - mulai
+        self.blocks += 1
+        self._publish(results)
+        return results
+
+    def flush(self):
+        """Menutup transmisi terbuka di semua stream"""
+        results = []
+        for session in self.sessions:
+            for event in session.flush():
+                results.append((session.stream_id, event))
+        self._publish(results)
+        return results
+
+    def _publish(self, results):
+        if self.message_queue is None:
+            return
+        for stream_id, (msg_type, data) in results:
+            self.message_queue.put((msg_type, (stream_id, data)))
+
+    def get_stats(self):
+        """Throughput per stream dan faktor real-time keseluruhan"""
+        streams = []
+        for session in self.sessions:
+            audio_seconds = session.samples / session.sample_rate
+            streams.append({
+                "stream": session.stream_id,
+                "audio_seconds": audio_seconds,
+                "notes": session.notes,
+                "transmissions": session.transmissions,
+                "samples_per_second": session.samples / self.processing_time if self.processing_time else 0.0,
+            })
+
+        audio_seconds = max((s["audio_seconds"] for s in streams), default=0.0)
+        stats = {
+            "streams": streams,
+            "blocks": self.blocks,
+            "processing_seconds": self.processing_time,
+            "realtime_factor": audio_seconds / self.processing_time if self.processing_time else 0.0,
+        }
+        if self.worker:
+            stats["pipeline"] = self.worker.get_stats()
+        return stats
+
+    def listen_device(self, device_index=None, queue_size=ANALYSIS_QUEUE_SIZE,
+                      overflow_policy=OVERFLOW_POLICY):
+        """Mendengarkan semua kanal satu perangkat multi-kanal (satu stream per kanal).
+
+        Hanya satu perangkat: kanal dari perangkat berbeda berjalan dengan
+        clock sendiri-sendiri sehingga bloknya tidak bisa digabung begitu
+        saja menjadi satu blok (stream, sampel).
+        """
+        self.worker = AnalysisWorker(
+            BlockQueue(queue_size, overflow_policy),
+            lambda data: self.process_block(data.reshape(-1, self.n_streams).T),
+            on_error=self._worker_error
+        )
+        self.worker.start()
+
+        # Blok multi-kanal datang interleaved: (frame x kanal) diratakan
+        self.source = PortAudioSource(self.sample_rate, self.n_streams, device_index)
+        self.source.start(self.worker.block_queue.put, FRAMES_PER_BUFFER)
+
+    def _worker_error(self, error):
+        if self.message_queue is not None:
+            self.message_queue.put(("error", (None, f"Analysis error: {error}")))
+        else:
+            print(f"Analysis error: {error}")
+
+    def stop(self):
+        """Menghentikan perangkat dan worker analisis"""
+        if self.source:
+            self.source.stop()
+            self.source = None
+        if self.worker and not self.worker.stop():
+            # Worker masih berjalan (dipanggil dari thread worker): flush akan balapan
+            return
+        self.flush()
+
+    @classmethod
+    def from_files(cls, sources, **kwargs):
+        """Membuat decoder untuk daftar sumber file: path atau (path, kanal)"""
+        if not sources:
+            raise ValueError("Tidak ada file sumber")
+        wavs = []
+        for source in sources:
+            path, channel = source if isinstance(source, tuple) else (source, 0)
+            wavs.append((WavFile(path), channel))
+
+        rates = {wav.sample_rate for wav, _ in wavs}
+        if len(rates) != 1:
+            raise ValueError("Semua file harus memiliki sample rate yang sama")
+
+        return cls(len(wavs), sample_rate=rates.pop(), files=wavs, **kwargs)
+
+    def decode_files(self):
+        """Mendekode semua sumber file secepat mungkin; stream yang lebih pendek diisi nol"""
+        if not self.files:
+            raise ValueError("Decoder tidak punya file sumber (lihat from_files)")
+        frames = max(wav.frames for wav, _ in self.files)
+        blocks = np.zeros((self.n_streams, FRAMES_PER_BUFFER), dtype=np.float32)
+
+        results = []
+        for start in range(0, frames, FRAMES_PER_BUFFER):
+            blocks.fill(0.0)
+            for i, (wav, channel) in enumerate(self.files):
+                data = wav.read(start, min(start + FRAMES_PER_BUFFER, wav.frames), channel)
+                blocks[i, :len(data)] = data
+            results.extend(self.process_block(blocks))
+
+        results.extend(self.flush())
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dekode banyak stream audio sekaligus")
+    parser.add_argument("files", nargs="*", help="File WAV (satu stream per file)")
+    parser.add_argument("--kanal", type=int, default=None,
+                        help="Dengarkan N kanal dari satu perangkat input (alih-alih file)")
+    parser.add_argument("--device", type=int, default=None,
+                        help="Indeks perangkat input (satu perangkat; gunakan perangkat multi-kanal "
+                             "atau perangkat agregat OS untuk banyak mikrofon)")
+    parser.add_argument("--kamus", default="kamus.txt", help="File kamus")
+    parser.add_argument("--engine", default=DETECTOR_ENGINE, help="Engine detektor nada")
+    args = parser.parse_args()
+
+    if args.kanal:
+        message_queue = queue.Queue()
+        decoder = MultiStreamDecoder(
+            args.kanal, message_queue, engine=args.engine, kamus_file=args.kamus
+        )
+        decoder.listen_device(args.device)
+        try:
+            while True:
+                msg_type, (stream_id, data) = message_queue.get()
+                if msg_type == "end_of_transmission" and data:
+                    print(f"[{stream_id}] {data}")
+                elif msg_type == "error":
+                    print(f"[{stream_id}] error: {data}")
+                    break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            decoder.stop()
+    else:
+        if not args.files:
+            parser.error("berikan file WAV atau --kanal N")
+        decoder = MultiStreamDecoder.from_files(args.files, engine=args.engine, kamus_file=args.kamus)
+        for stream_id, (msg_type, data) in decoder.decode_files():
+            if msg_type == "end_of_transmission" and data:
+                print(f"[{stream_id}] {data}")
+
+    stats = decoder.get_stats()
+    for stream in stats["streams"]:
+        print(f"  stream {stream['stream']}: {stream['notes']} nada, "
+              f"{stream['transmissions']} transmisi, {stream['samples_per_second'] / 1e6:.2f} Msampel/s")
+    print(f"Faktor real-time: {stats['realtime_factor']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,141 @@
-from trie import Trie
+from trie import buat_trie
+from segmentasi import segmentasi, segmentasi_beam
+from pengawas_kamus import hitung_perubahan, rentang_berubah
+from tone_plan import configured_alphabet
+import kamus_biner
 import os
+import threading
+from collections import Counter
 
-class Penerjemah:
-    def __init__(self, kamus_file="kamus.txt"):
-        self.trie = Trie()
-        self.kalimat_sementara = []
-        self.kalimat_final = []
+# Jumlah hasil segmentasi yang diingat per versi Kamus
+UKURAN_CACHE_SEGMENTASI = 256
+
+class Kamus:
+    """Kamus bersama yang read-only bagi pembaca.
+    
+    Trie tidak pernah diubah di tempat setelah dipublikasikan: setiap
+    perubahan membuat versi baru lalu menukar referensi self.trie secara
+    atomik. Karena itu banyak Sesi di banyak thread bisa membaca kamus yang
+    sama tanpa lock; hanya penulis (reload, tambah_kata) yang saling mengunci.
+    """
+    
+    def __init__(self, kamus_file="kamus.txt", mode_segmentasi="greedy", trie_backend="dict",
+                 ukuran_cache=UKURAN_CACHE_SEGMENTASI, alfabet=None):
+        self.kamus_file = kamus_file
+        self.trie_backend = trie_backend
+        # Alfabet kode = simbol rencana nada (lihat tone_plan.py); kode kamus
+        # dengan simbol lain dilewati saat dimuat
+        self.alfabet = alfabet or configured_alphabet()
+        self.trie = buat_trie("array" if trie_backend == "mmap" else trie_backend, self.alfabet)
+        self.mode_segmentasi = mode_segmentasi
+        self._kunci_muat_ulang = threading.Lock()
+        # Isi file kamus yang terakhir dimuat (bytes): reload hanya mengurai
+        # baris yang berubah. _ganda = kode yang muncul lebih dari sekali di
+        # file (None: belum dihitung); _tambahan = kode dari tambah_kata ->
+        # kata di file (None: tidak ada di file), dipulihkan saat reload
+        self._teks = None
+        self._ganda = None
+        self._tambahan = {}
+        
+        # Versi naik setiap kali trie ditukar; hasil segmentasi di-cache per versi
+        self.versi = 0
+        self.ukuran_cache = ukuran_cache
+        # Hanya penyimpanan ke cache yang dikunci; pembacaan tanpa lock
+        self._kunci_cache = threading.Lock()
+        # Penghitung tanpa lock (perkiraan jika banyak thread membaca sekaligus)
+        self.cache_hit = 0
+        self.cache_miss = 0
+        self.cache_eviction = 0
+        
         self.load_kamus(kamus_file)
+        # (trie, cache) dibaca dan ditukar sebagai satu referensi: cache
+        # {(mode, rangkaian): hasil} milik satu versi trie yang immutable
+        self._aktif = (self.trie, {})
+    
+    def sesi_baru(self, transkrip=None):
+        """Membuat sesi penerjemahan baru yang berbagi kamus ini (O(1))"""
+        return Sesi(self, transkrip)
+    
+    def segmentasi(self, rangkaian, mode=None):
+        """Segmentasi rangkaian kode dengan versi kamus saat ini (di-cache per versi)"""
+        mode = mode or self.mode_segmentasi
+        if mode == "beam":
+            # Lewat dekode_beam: satu entri cache HasilBeam, hasil terpotong tidak disimpan
+            return list(self.dekode_beam(rangkaian).kata)
+        
+        # Trie dan cache diambil bersama: hasil selalu disimpan ke cache versinya sendiri
+        trie, cache = self._aktif
+        kunci = (mode, rangkaian)
+        hasil = self._ambil_cache(cache, kunci)
+        if hasil is None:
+            hasil = segmentasi(trie, rangkaian, mode)
+            self._simpan_cache(cache, kunci, hasil)
+        return list(hasil)
+    
+    def dekode_beam(self, rangkaian, **opsi):
+        """Segmentasi toleran-kesalahan: HasilBeam (kata, keyakinan, ...), lihat segmentasi_beam"""
+        trie, cache = self._aktif
+        # Hanya dekode dengan opsi default yang di-cache
+        kunci = ("beam-hasil", rangkaian) if not opsi else None
+        hasil = self._ambil_cache(cache, kunci) if kunci else None
+        if hasil is None:
+            hasil = segmentasi_beam(trie, rangkaian, **opsi)
+            # Hasil yang terpotong anggaran waktu bisa berbeda di panggilan berikutnya
+            if kunci and not hasil.terpotong:
+                self._simpan_cache(cache, kunci, hasil)
+        return hasil
+    
+    def _ambil_cache(self, cache, kunci):
+        """Baca cache tanpa lock: dict hanya bertambah/berkurang di bawah _kunci_cache"""
+        hasil = cache.get(kunci)
+        if hasil is None:
+            self.cache_miss += 1
+        else:
+            self.cache_hit += 1
+        return hasil
+    
+    def _simpan_cache(self, cache, kunci, hasil):
+        """Simpan hasil; jika penuh, entri yang paling lama disimpan dibuang (bukan LRU)"""
+        if not self.ukuran_cache:
+            return
+        with self._kunci_cache:
+            cache[kunci] = tuple(hasil) if isinstance(hasil, list) else hasil
+            while len(cache) > self.ukuran_cache:
+                del cache[next(iter(cache))]
+                self.cache_eviction += 1
+    
+    def _ganti_trie(self, baru):
+        """Menukar trie beserta cache kosong miliknya secara atomik dan menaikkan versi"""
+        self._aktif = (baru, {})
+        self.trie = baru
+        self.versi += 1
+    
+    def statistik_cache(self):
+        """Penghitung cache segmentasi: hit, miss, eviction, dan ukuran saat ini"""
+        return {
+            "hit": self.cache_hit,
+            "miss": self.cache_miss,
+            "eviction": self.cache_eviction,
+            "ukuran": len(self._aktif[1]),
+            "versi": self.versi,
+        }
+    
     
     def load_kamus(self, filename):
         """Memuat kamus dari file"""
         try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line = line.strip()
-                    if line and '=' in line:
-                        kode, kata = line.split('=', 1)
-                        self.trie.tambah(kode.strip(), kata.strip())
-            print(f"Kamus berhasil dimuat: {len(self.trie.daftar_kata)} entri")
+            if self.trie_backend == "mmap":
+                # Image biner dipetakan langsung; dikompilasi ulang jika teks lebih baru
+                self.trie = kamus_biner.muat_atau_kompilasi(filename, alfabet=self.alfabet)
+                self._teks = self._baca_teks(filename)
+            else:
+                self._teks = self._baca_teks(filename)
+                entri = list(kamus_biner.urai_kamus(
+                    self._teks.decode("utf-8").splitlines(), self.alfabet, filename))
+                for kode, kata in entri:
+                    self.trie.tambah(kode, kata)
+                self._ganda = self._hitung_ganda(entri) if len(entri) != len(self.trie) else set()
+            print(f"Kamus berhasil dimuat: {len(self.trie)} entri")
         except FileNotFoundError:
             print(f"File {filename} tidak ditemukan. Membuat kamus default.")
             self.create_default_kamus()
@@ -42,14 +160,149 @@ class Penerjemah:
             "7": "."
         }
         
+        simbol = set(self.alfabet)
         for kode, kata in default_kamus.items():
-            self.trie.tambah(kode, kata)
+            if simbol.issuperset(kode):
+                self.trie.tambah(kode, kata)
     
     def save_kamus(self, filename):
         """Menyimpan kamus ke file"""
+        teks = "".join(f"{kode}={kata}\n" for kode, kata in self.trie.items())
         with open(filename, 'w', encoding='utf-8') as file:
-            for kode, kata in self.trie.daftar_kata.items():
-                file.write(f"{kode}={kata}\n")
+            file.write(teks)
+        if filename == self.kamus_file:
+            self._teks = teks.encode("utf-8")
+            self._ganda = set()
+            self._tambahan = {}
+    
+    @staticmethod
+    def _baca_teks(filename):
+        with open(filename, 'rb') as file:
+            return file.read()
+    
+    @staticmethod
+    def _hitung_ganda(entri):
+        return {kode for kode, jumlah in Counter(kode for kode, _ in entri).items() if jumlah > 1}
+    
+    def _urai(self, teks, sumber, mulai=1, peringatan=True):
+        """Entri (kode, kata) valid dari potongan teks kamus (bytes)"""
+        baris = teks.decode("utf-8").splitlines()
+        if peringatan:
+            return list(kamus_biner.urai_kamus(baris, self.alfabet, sumber, mulai))
+        # Teks lama sudah diperingatkan saat dimuat; kode invalid dilewati diam-diam
+        simbol = set(self.alfabet)
+        return [(kode, kata) for kode, kata in kamus_biner.urai_kamus(baris)
+                if kode and simbol.issuperset(kode)]
+    
+    def _di_file(self, kode):
+        """Apakah kode ada di file kamus yang terakhir dimuat"""
+        if kode in self._tambahan:
+            return self._tambahan[kode] is not None
+        return self.trie.cari(kode) is not None
+    
+    def _selisih_bertahap(self, teks_baru, filename):
+        """Selisih (ditambah, dihapus) dari baris yang berubah saja; None jika perlu urai penuh.
+        
+        Urai penuh dibutuhkan jika baris yang berubah menyentuh kode yang
+        juga muncul di bagian file yang tidak berubah (kode ganda: kata
+        terakhir yang menang bergantung pada urutan baris).
+        """
+        if self._teks is None:
+            return None
+        awal, akhir_lama, akhir_baru = rentang_berubah(self._teks, teks_baru)
+        mulai = self._teks.count(b"\n", 0, awal) + 1
+        if self._ganda is None:
+            self._ganda = self._hitung_ganda(self._urai(self._teks, filename, peringatan=False))
+        
+        lama = dict(self._urai(self._teks[awal:akhir_lama], filename, peringatan=False))
+        entri_baru = self._urai(teks_baru[awal:akhir_baru], filename, mulai)
+        baru = dict(entri_baru)
+        if not self._ganda.isdisjoint(lama) or not self._ganda.isdisjoint(baru):
+            return None
+        if any(kode not in lama and self._di_file(kode) for kode in baru):
+            return None
+        
+        ditambah = {kode: kata for kode, kata in baru.items() if self.trie.cari(kode) != kata}
+        dihapus = [kode for kode in lama if kode not in baru]
+        # Kata dari tambah_kata di luar baris yang berubah kembali ke isi file
+        for kode, kata in self._tambahan.items():
+            if kode in lama or kode in baru:
+                continue
+            if kata is None:
+                dihapus.append(kode)
+            elif self.trie.cari(kode) != kata:
+                ditambah[kode] = kata
+        
+        self._ganda |= self._hitung_ganda(entri_baru)
+        return ditambah, dihapus
+    
+    def muat_ulang_kamus(self, filename=None):
+        """Memuat ulang kamus lalu menukar trie secara atomik.
+        
+        Hanya entri yang ditambah, diubah, atau dihapus yang diterapkan ke
+        versi baru; decoding yang sedang berjalan tetap memakai versi lama
+        sampai referensi self.trie ditukar. Backend mmap juga diperbarui
+        dengan selisih saja; image biner dikompilasi ulang saat dimuat
+        berikutnya karena file teksnya lebih baru. Hanya baris di antara
+        awalan dan akhiran file yang sama dengan muatan sebelumnya yang
+        diurai; file diurai penuh hanya jika perubahan menyentuh kode ganda.
+        """
+        filename = filename or self.kamus_file
+        with self._kunci_muat_ulang:
+            teks_baru = self._baca_teks(filename)
+            selisih = self._selisih_bertahap(teks_baru, filename)
+            if selisih is None:
+                entri = self._urai(teks_baru, filename)
+                ditambah, dihapus = hitung_perubahan(dict(self.trie.items()), dict(entri))
+                self._ganda = self._hitung_ganda(entri)
+            else:
+                ditambah, dihapus = selisih
+            self._teks = teks_baru
+            self._tambahan = {}
+            self.kamus_file = filename
+            if not ditambah and not dihapus:
+                return False
+            baru = self.trie.versi_baru(ditambah, dihapus)
+            print(f"Kamus dimuat ulang: {len(ditambah)} ditambah/diubah, {len(dihapus)} dihapus")
+            
+            # Pertukaran referensi atomik
+            self._ganti_trie(baru)
+        return True
+    
+    def tambah_kata(self, kode, kata):
+        """Menambah kata baru ke kamus (sebagai versi baru, bukan di tempat)"""
+        self.tambah_kata_banyak({kode: kata})
+    
+    def tambah_kata_banyak(self, entri):
+        """Menambah banyak kata {kode: kata} sekaligus dalam satu versi baru.
+        
+        Kata yang ditambahkan hanya hidup di memori: reload berikutnya
+        mengembalikan kodenya ke isi file kamus.
+        """
+        entri = dict(entri)
+        if not entri:
+            return
+        with self._kunci_muat_ulang:
+            for kode in entri:
+                if kode not in self._tambahan:
+                    self._tambahan[kode] = self.trie.cari(kode)
+            self._ganti_trie(self.trie.versi_baru(entri))
+
+
+class Sesi:
+    """State per transmisi (rangkaian nada dan cursor trie) di atas Kamus bersama"""
+    
+    __slots__ = ("kamus", "kalimat_sementara", "kalimat_final", "keyakinan",
+                 "_trie_cursor", "_node", "_terjemahan")
+    
+    def __init__(self, kamus, transkrip=None):
+        self.kamus = kamus
+        self.kalimat_sementara = []
+        # Keyakinan kalimat final terakhir (hanya mode "beam"; None untuk mode lain)
+        self.keyakinan = None
+        # Transkrip bergulir (opsional); None berarti kalimat final tidak disimpan
+        self.kalimat_final = transkrip
+        self._reset_cursor()
     
     def proses_input(self, input_nada):
         """Memproses input nada"""
@@ -59,26 +312,63 @@ class Penerjemah:
         # Tambahkan ke kalimat sementara
         self.kalimat_sementara.append(input_nada)
         
-        # Coba terjemahkan rangkaian nada
-        rangkaian = ''.join(self.kalimat_sementara)
-        terjemahan = self.trie.cari_terpanjang(rangkaian)
+        # Lanjutkan cursor dari posisi terakhir, tanpa menelusuri ulang dari root
+        self._maju(input_nada)
         
-        return terjemahan
+        return self._terjemahan
+    
+    def _reset_cursor(self, trie=None):
+        """Kembalikan cursor trie ke root"""
+        self._trie_cursor = trie if trie is not None else self.kamus.trie
+        self._node = self._trie_cursor.akar()
+        self._terjemahan = None
+    
+    def _maju(self, nada):
+        """Majukan cursor; sama dengan cari_terpanjang atas seluruh kalimat sementara"""
+        trie = self.kamus.trie
+        if trie is not self._trie_cursor:
+            # Kamus baru saja ditukar: telusuri ulang sekali pada versi baru
+            self._reset_cursor(trie)
+            nada = ''.join(self.kalimat_sementara)
+        
+        for char in nada:
+            if self._node is None:
+                return
+            self._node = trie.langkah(self._node, char)
+            if self._node is not None:
+                kata = trie.kata_node(self._node)
+                if kata is not None:
+                    self._terjemahan = kata
     
     def get_kalimat_sementara(self):
         """Mendapatkan kalimat sementara untuk preview"""
         if not self.kalimat_sementara:
             return ""
         
-        rangkaian = ''.join(self.kalimat_sementara)
-        terjemahan = self.trie.cari_terpanjang(rangkaian)
+        if self.kamus.trie is not self._trie_cursor:
+            self._maju("")
         
-        if terjemahan:
-            return terjemahan
+        if self._terjemahan:
+            return self._terjemahan
         else:
             # Tampilkan rangkaian kode jika belum ada terjemahan
             return ' '.join(self.kalimat_sementara)
     
+    def get_saran(self, limit=3):
+        """Kata yang paling mungkin dituju rangkaian nada saat ini: daftar (kode, kata)"""
+        if not self.kalimat_sementara:
+            return []
+        
+        trie = self.kamus.trie
+        if trie is not self._trie_cursor:
+            self._maju("")
+        if self._node is None:
+            return []
+        
+        # Cursor masih berada di jalur trie, jadi rangkaian <= panjang kode maksimum
+        prefix = ''.join(self.kalimat_sementara)
+        return list(trie.lengkapi_dari(self._node, prefix, limit))
+    
     def get_kalimat(self):
         """Mendapatkan kalimat final"""
         if not self.kalimat_sementara:
@@ -86,28 +376,68 @@ class Penerjemah:
         
         # Coba terjemahkan semua
         rangkaian = ''.join(self.kalimat_sementara)
-        hasil = []
-        i = 0
-        
-        while i < len(rangkaian):
-            terjemahan = self.trie.cari_prefix(rangkaian[i:])
-            if terjemahan:
-                # Gunakan terjemahan terpanjang yang ditemukan
-                terpanjang = max(terjemahan.keys(), key=len)
-                hasil.append(self.trie.daftar_kata[terpanjang])
-                i += len(terpanjang)
-            else:
-                # Jika tidak ditemukan, gunakan kode asli
-                hasil.append(rangkaian[i])
-                i += 1
+        if self.kamus.mode_segmentasi == "beam":
+            dekode = self.kamus.dekode_beam(rangkaian)
+            hasil = dekode.kata
+            self.keyakinan = dekode.keyakinan
+        else:
+            hasil = self.kamus.segmentasi(rangkaian)
+            self.keyakinan = None
         
-        self.kalimat_final.extend(hasil)
-        return ' '.join(hasil)
+        kalimat = ' '.join(hasil)
+        if self.kalimat_final is not None:
+            self.kalimat_final.tambah(kalimat)
+        return kalimat
     
     def reset(self):
         """Reset state penerjemah"""
         self.kalimat_sementara = []
+        self._reset_cursor()
+
+
+class Penerjemah(Sesi):
+    """Satu Kamus dengan satu Sesi (antarmuka lama untuk GUI dan alat lain)"""
+    
+    def __init__(self, kamus_file="kamus.txt", mode_segmentasi="greedy", trie_backend="dict",
+                 transkrip=None, alfabet=None):
+        super().__init__(Kamus(kamus_file, mode_segmentasi, trie_backend, alfabet=alfabet), transkrip)
+    
+    @property
+    def trie(self):
+        return self.kamus.trie
+    
+    @property
+    def mode_segmentasi(self):
+        return self.kamus.mode_segmentasi
+    
+    @property
+    def alfabet(self):
+        return self.kamus.alfabet
+    
+    @property
+    def kamus_file(self):
+        return self.kamus.kamus_file
+    
+    def sesi_baru(self, transkrip=None):
+        """Sesi baru yang berbagi kamus penerjemah ini"""
+        return self.kamus.sesi_baru(transkrip)
+    
+    def save_kamus(self, filename):
+        """Menyimpan kamus ke file"""
+        self.kamus.save_kamus(filename)
     
     def tambah_kata(self, kode, kata):
         """Menambah kata baru ke kamus"""
-        self.trie.tambah(kode, kata)
\ No newline at end of file
+        self.kamus.tambah_kata(kode, kata)
+    
+    def tambah_kata_banyak(self, entri):
+        """Menambah banyak kata {kode: kata} sekaligus"""
+        self.kamus.tambah_kata_banyak(entri)
+    
+    def muat_ulang_kamus(self, filename=None):
+        """Memuat ulang kamus lalu menukar trie secara atomik"""
+        return self.kamus.muat_ulang_kamus(filename)
+    
+    def statistik_cache(self):
+        """Penghitung cache segmentasi kamus"""
+        return self.kamus.statistik_cache()
\ No newline at end of file
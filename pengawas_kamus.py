@@ -0,0 +1,94 @@
+import os
+import threading
+
+
+def hitung_perubahan(lama, baru):
+    """Selisih dua kamus {kode: kata}: (ditambah/diubah, dihapus)"""
+    ditambah = {kode: kata for kode, kata in baru.items() if lama.get(kode) != kata}
+    dihapus = [kode for kode in lama if kode not in baru]
+    return ditambah, dihapus
+
+
+def _panjang_awalan_sama(a, b):
+    """Panjang awalan bersama dua bytes (pencarian biner atas perbandingan potongan)"""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        tengah = (lo + hi + 1) // 2
+        if a[lo:tengah] == b[lo:tengah]:
+            lo = tengah
+        else:
+            hi = tengah - 1
+    return lo
+
+
+def rentang_berubah(lama, baru):
+    """Bagian isi file yang berubah: (awal, akhir_lama, akhir_baru).
+    
+    lama[:awal] == baru[:awal] dan lama[akhir_lama:] == baru[akhir_baru:];
+    ketiga batas jatuh di awal baris, jadi hanya baris di tengah yang
+    perlu diurai ulang saat kamus dimuat ulang.
+    """
+    awal = _panjang_awalan_sama(lama, baru)
+    awal = lama.rfind(b"\n", 0, awal) + 1
+    
+    akhiran = _panjang_awalan_sama(lama[awal:][::-1], baru[awal:][::-1])
+    akhir_lama, akhir_baru = len(lama) - akhiran, len(baru) - akhiran
+    
+    def awal_baris(teks, posisi):
+        return posisi == awal or teks[posisi - 1:posisi] == b"\n"
+    
+    if not (awal_baris(lama, akhir_lama) and awal_baris(baru, akhir_baru)):
+        # Akhiran dimulai setelah baris pertamanya yang (mungkin) terpotong
+        akhir = lama.find(b"\n", akhir_lama)
+        geser = (akhir + 1 if akhir >= 0 else len(lama)) - akhir_lama
+        akhir_lama += geser
+        akhir_baru += geser
+    return awal, akhir_lama, akhir_baru
+
+
+class PengawasKamus:
+    """Thread yang memantau file kamus dan memuat ulang penerjemah saat file berubah"""
+    
+    def __init__(self, penerjemah, interval=1.0):
+        self.penerjemah = penerjemah
+        self.interval = interval
+        self._berhenti = threading.Event()
+        self._thread = None
+        self._tanda_dimuat = self._tanda_file()
+        self._tanda_terakhir = self._tanda_dimuat
+    
+    def _tanda_file(self):
+        try:
+            stat = os.stat(self.penerjemah.kamus_file)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    
+    def start(self):
+        """Mulai memantau file kamus"""
+        self._thread = threading.Thread(target=self._run, name="pengawas-kamus", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Berhenti memantau file kamus"""
+        self._berhenti.set()
+        if self._thread:
+            self._thread.join()
+    
+    def _run(self):
+        while not self._berhenti.wait(self.interval):
+            tanda = self._tanda_file()
+            
+            # Tunggu sampai file stabil satu interval, agar file yang sedang
+            # ditulis editor tidak terbaca setengah jadi
+            if tanda != self._tanda_terakhir:
+                self._tanda_terakhir = tanda
+                continue
+            if tanda is None or tanda == self._tanda_dimuat:
+                continue
+            
+            self._tanda_dimuat = tanda
+            try:
+                self.penerjemah.muat_ulang_kamus()
+            except Exception as e:
+                print(f"Gagal memuat ulang kamus: {e}")
@@ -0,0 +1,56 @@
+import numpy as np
+
+
+class RingBuffer:
+    """Ring buffer float32 berukuran tetap yang memberikan jendela kontigu sebagai view.
+
+    Setiap sampel ditulis dua kali (di posisi i dan i + capacity), sehingga
+    jendela terakhir sepanjang apa pun (<= capacity) selalu kontigu di memori
+    dan bisa dikembalikan tanpa salinan maupun alokasi.
+    """
+
+    def __init__(self, capacity, dtype=np.float32):
+        self.capacity = int(capacity)
+        self._data = np.zeros(2 * self.capacity, dtype=dtype)
+        self._write_pos = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def write(self, block):
+        """Menulis blok sampel (mis. hasil np.frombuffer) ke buffer"""
+        block = np.asarray(block, dtype=self._data.dtype)
+        n = len(block)
+        if n >= self.capacity:
+            # Hanya sampel terakhir yang muat di buffer
+            block = block[-self.capacity:]
+            n = self.capacity
+
+        capacity = self.capacity
+        pos = self._write_pos
+        first = min(n, capacity - pos)
+
+        self._data[pos:pos + first] = block[:first]
+        self._data[pos + capacity:pos + capacity + first] = block[:first]
+        if first < n:
+            rest = n - first
+            self._data[:rest] = block[first:]
+            self._data[capacity:capacity + rest] = block[first:]
+
+        self._write_pos = (pos + n) % capacity
+        self.count = min(self.count + n, capacity)
+
+    def latest(self, n):
+        """View read-only ke n sampel terakhir (kontigu, tanpa salinan)"""
+        if n > self.count:
+            raise ValueError(f"Buffer hanya berisi {self.count} sampel, diminta {n}")
+        end = self._write_pos + self.capacity
+        window = self._data[end - n:end]
+        window.flags.writeable = False
+        return window
+
+    def clear(self):
+        """Mengosongkan buffer"""
+        self._write_pos = 0
+        self.count = 0
@@ -0,0 +1,210 @@
+import heapq
+import math
+import time
+from collections import namedtuple
+
+# Mode segmentasi yang didukung Penerjemah.get_kalimat
+MODE_SEGMENTASI = ("greedy", "optimal", "beam")
+
+# Biaya edit untuk segmentasi beam: sisip = nada palsu (noise) di input,
+# hapus = nada yang hilang, ganti = nada yang terbaca sebagai nada lain
+BiayaEdit = namedtuple("BiayaEdit", ["sisip", "hapus", "ganti"])
+BIAYA_EDIT = BiayaEdit(sisip=1.0, hapus=1.0, ganti=1.0)
+
+LEBAR_BEAM = 8
+# Anggaran waktu per nada (detik); setelah habis, hipotesis yang lebih mahal
+# tidak diperluas lagi untuk nada itu (yang termurah selalu diperluas)
+ANGGARAN_PER_NADA = 0.002
+# Jumlah nada hilang berturut-turut yang boleh disisipkan di satu posisi
+MAKS_HAPUS_BERUNTUN = 1
+
+# kata: daftar kata, keyakinan: 0..1 (1 = cocok tanpa edit), biaya: total
+# biaya edit, edit: jumlah edit, terpotong: posisi nada (indeks) yang
+# ekspansinya dipotong anggaran waktu, tuple kosong jika tidak ada
+HasilBeam = namedtuple("HasilBeam", ["kata", "keyakinan", "biaya", "edit", "terpotong"])
+
+
+def segmentasi_greedy(trie, rangkaian):
+    """Segmentasi kecocokan terpanjang dari kiri ke kanan.
+
+    Trie ditelusuri satu kali per posisi, jadi waktunya O(n x panjang kode
+    maksimum). Kode yang tidak dikenal dikeluarkan apa adanya, satu digit.
+    """
+    hasil = []
+    i = 0
+    
+    while i < len(rangkaian):
+        panjang, kata = trie.cocok_terpanjang(rangkaian, i)
+        if panjang:
+            hasil.append(kata)
+            i += panjang
+        else:
+            # Jika tidak ditemukan, gunakan kode asli
+            hasil.append(rangkaian[i])
+            i += 1
+    
+    return hasil
+
+
+def segmentasi_optimal(trie, rangkaian):
+    """Segmentasi optimal dengan dynamic programming.
+
+    Meminimalkan jumlah kode yang tidak dikenal, lalu jumlah token. Setiap
+    posisi menelusuri trie satu kali, jadi waktunya O(n x panjang kode maksimum).
+    """
+    n = len(rangkaian)
+    
+    # biaya[i] = (kode tidak dikenal, jumlah token) untuk rangkaian[i:]
+    biaya = [None] * (n + 1)
+    pilihan = [None] * (n + 1)
+    biaya[n] = (0, 0)
+    
+    for i in range(n - 1, -1, -1):
+        tidak_dikenal, token = biaya[i + 1]
+        terbaik = (tidak_dikenal + 1, token + 1)
+        pilih = (1, None)
+        
+        for panjang, kata in trie.cocok_semua(rangkaian, i):
+            tidak_dikenal, token = biaya[i + panjang]
+            kandidat = (tidak_dikenal, token + 1)
+            # Pada biaya sama, pilih kata yang lebih panjang
+            if kandidat <= terbaik:
+                terbaik = kandidat
+                pilih = (panjang, kata)
+        
+        biaya[i] = terbaik
+        pilihan[i] = pilih
+    
+    hasil = []
+    i = 0
+    while i < n:
+        panjang, kata = pilihan[i]
+        hasil.append(kata if kata is not None else rangkaian[i])
+        i += panjang
+    
+    return hasil
+
+
+def _simpan(beam, node, hipotesis):
+    """Rekombinasi: simpan hipotesis jika lebih murah dari yang ada di node yang sama"""
+    lama = beam.get(node)
+    if lama is None or hipotesis[:2] < lama[:2]:
+        beam[node] = hipotesis
+        return True
+    return False
+
+
+def _pangkas_beam(beam, lebar):
+    if len(beam) <= lebar:
+        return beam
+    return dict(heapq.nsmallest(lebar, beam.items(), key=lambda item: item[1][:2]))
+
+
+def _tutup(trie, beam, biaya, akar, maks_hapus):
+    """Transisi tanpa mengonsumsi nada: keluarkan kata (kembali ke root) atau nada hilang"""
+    hasil = dict(beam)
+    antrian = [(node, hipotesis, 0) for node, hipotesis in beam.items()]
+    while antrian:
+        node, (total, token, edit, keluaran), hapus = antrian.pop()
+        cabang = trie.cabang(node)
+        kata = trie.kata_node(node)
+        if kata is not None:
+            hipotesis = (total, token + 1, edit, (kata, keluaran))
+            if _simpan(hasil, akar, hipotesis):
+                antrian.append((akar, hipotesis, hapus))
+            if not cabang:
+                # Daun tidak bisa melanjutkan; hipotesis di root selalu lebih baik
+                hasil.pop(node, None)
+        if hapus < maks_hapus:
+            hipotesis = (total + biaya.hapus, token, edit + 1, keluaran)
+            for _, anak in cabang:
+                if _simpan(hasil, anak, hipotesis):
+                    antrian.append((anak, hipotesis, hapus + 1))
+    return hasil
+
+
+def segmentasi_beam(trie, rangkaian, lebar_beam=LEBAR_BEAM, biaya=BIAYA_EDIT,
+                    anggaran_per_nada=ANGGARAN_PER_NADA, maks_hapus=MAKS_HAPUS_BERUNTUN):
+    """Segmentasi toleran-kesalahan dengan beam search di atas trie.
+
+    Setiap hipotesis adalah posisi di trie plus kata yang sudah dikeluarkan.
+    Per nada input, hipotesis boleh mencocokkan nada, menggantinya dengan
+    cabang lain, melewatinya sebagai noise, atau menyisipkan nada yang hilang,
+    masing-masing dengan biaya di `biaya`. Hipotesis di node yang sama
+    digabung (yang termurah menang) dan hanya `lebar_beam` terbaik yang
+    dipertahankan, jadi waktunya O(n x lebar_beam x ukuran alfabet).
+    Nada yang tidak bisa memulai kata mana pun tetap dikeluarkan sebagai
+    token tidak dikenal saat dilewati di batas kata, seperti mode greedy
+    dan optimal.
+
+    Setiap nada punya anggaran waktu sendiri (anggaran_per_nada). Hipotesis
+    diperluas dari yang termurah; begitu anggaran nada habis, sisanya tidak
+    diperluas, dan posisi nada itu dicatat di HasilBeam.terpotong.
+    """
+    n = len(rangkaian)
+    if not n:
+        return HasilBeam([], 1.0, 0.0, 0, ())
+    
+    akar = trie.akar()
+    terpotong = []
+    
+    # node -> (biaya, jumlah token, jumlah edit, kata keluaran sebagai linked list)
+    beam = {akar: (0.0, 0, 0, None)}
+    for posisi, nada in enumerate(rangkaian):
+        batas_waktu = time.perf_counter() + anggaran_per_nada if anggaran_per_nada else None
+        tidak_dikenal = trie.langkah(akar, nada) is None
+        
+        beam = _pangkas_beam(_tutup(trie, beam, biaya, akar, maks_hapus), lebar_beam)
+        berikut = {}
+        # Dengan anggaran, yang termurah diperluas lebih dulu
+        urutan = beam.items() if batas_waktu is None else sorted(beam.items(), key=lambda item: item[1][:2])
+        for i, (node, (total, token, edit, keluaran)) in enumerate(urutan):
+            if i and batas_waktu is not None and time.perf_counter() > batas_waktu:
+                terpotong.append(posisi)
+                break
+            
+            if node == akar and tidak_dikenal:
+                # Di batas kata, nada yang tidak dikenal menjadi token apa adanya
+                _simpan(berikut, node, (total + biaya.sisip, token + 1, edit + 1, (nada, keluaran)))
+            else:
+                # Nada ini noise: lewati tanpa pindah node
+                _simpan(berikut, node, (total + biaya.sisip, token, edit + 1, keluaran))
+            for char, anak in trie.cabang(node):
+                if char == nada:
+                    _simpan(berikut, anak, (total, token, edit, keluaran))
+                else:
+                    _simpan(berikut, anak, (total + biaya.ganti, token, edit + 1, keluaran))
+        beam = _pangkas_beam(berikut, lebar_beam)
+    
+    # Nada terakhir boleh hilang; hipotesis final harus berakhir di batas kata.
+    # Kata yang belum selesai dilengkapi dengan kode terpendek di bawah node.
+    akhir = _tutup(trie, beam, biaya, akar, maks_hapus)
+    for node, (total, token, edit, keluaran) in list(akhir.items()):
+        if node == akar:
+            continue
+        for kode, kata in trie.lengkapi_dari(node, "", 1):
+            _simpan(akhir, akar, (total + biaya.hapus * len(kode), token + 1,
+                                  edit + len(kode), (kata, keluaran)))
+    if akar not in akhir:
+        # Hanya mungkin pada trie dengan cabang mati (mis. TrieArray setelah hapus)
+        return HasilBeam(segmentasi_greedy(trie, rangkaian), 0.0, math.inf, n, tuple(terpotong))
+    total, token, edit, keluaran = akhir[akar]
+    
+    hasil = []
+    while keluaran is not None:
+        kata, keluaran = keluaran
+        hasil.append(kata)
+    hasil.reverse()
+    
+    return HasilBeam(hasil, math.exp(-total / n), total, edit, tuple(terpotong))
+
+
+def segmentasi(trie, rangkaian, mode="greedy"):
+    """Segmentasi rangkaian kode menjadi daftar kata/kode"""
+    if mode == "greedy":
+        return segmentasi_greedy(trie, rangkaian)
+    if mode == "optimal":
+        return segmentasi_optimal(trie, rangkaian)
+    if mode == "beam":
+        return segmentasi_beam(trie, rangkaian).kata
+    raise ValueError(f"Mode segmentasi tidak dikenal: {mode}")
@@ -0,0 +1,196 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ring_buffer import RingBuffer
+from tone_detector import MIN_TONE_RATIO, GoertzelDetector, make_window
+
+# Parameter default analisis short-time
+WINDOW_LENGTH = 256  # sampel per frame (~5.8 ms pada 44.1 kHz)
+HOP_LENGTH = 32  # pergeseran antar frame (~0.7 ms)
+WINDOW_FUNCTION = "hann"
+
+# Frame berturut-turut yang dibutuhkan untuk offset dan pergantian nada
+OFFSET_FRAMES = 2
+CHANGE_FRAMES = 4
+
+# Segmen lebih pendek dari ini dianggap glitch; segmen lebih panjang
+# diklasifikasikan dari MAX_NOTE_SECONDS terakhirnya saja
+MIN_NOTE_SECONDS = 0.006
+MAX_NOTE_SECONDS = 0.5
+
+# Blok besar dipecah agar riwayat sampel cukup untuk klasifikasi segmen
+MAX_CHUNK = 4096
+
+
+class ShortTimeTracker:
+    """Segmentasi nada dengan analisis short-time (frame overlap) dan onset/offset.
+
+    Setiap frame (window_length sampel, bergeser hop sampel) diperiksa apakah
+    berisi nada. Segmen dimulai pada onset (frame aktif pertama) dan ditutup
+    pada offset (OFFSET_FRAMES frame tidak aktif) atau saat nada pemenang
+    berganti selama CHANGE_FRAMES frame. Nada satu segmen lalu ditentukan
+    dari Goertzel koheren atas seluruh sampel segmen, sehingga resolusi
+    frekuensi mengikuti panjang simbol, bukan panjang frame.
+
+    Karena setiap offset menutup segmen, nada yang sama berturut-turut
+    (mis. "11") didekode sebagai dua nada asal dipisahkan jeda singkat.
+    Antarmuka update/flush/reset dan event-nya sama dengan NoteTracker.
+    """
+
+    def __init__(self, note_frequencies, sample_rate, amplitude_threshold, silence_timeout,
+                 window_length=WINDOW_LENGTH, hop=HOP_LENGTH, window=WINDOW_FUNCTION,
+                 min_ratio=MIN_TONE_RATIO):
+        if not 0 < hop <= window_length:
+            raise ValueError("hop harus di antara 1 dan window_length")
+        self.notes = list(note_frequencies.keys())
+        self.sample_rate = sample_rate
+        self.amplitude_threshold = amplitude_threshold
+        self.silence_samples = int(round(silence_timeout * sample_rate))
+        self.window_length = window_length
+        self.hop = hop
+        self.window = window
+
+        self.frame_detector = GoertzelDetector(note_frequencies, sample_rate, min_ratio, window)
+        self.min_note_samples = int(MIN_NOTE_SECONDS * sample_rate)
+        self.max_note_samples = int(MAX_NOTE_SECONDS * sample_rate)
+
+        # Basis Goertzel panjang; segmen sepanjang n memakai prefix [:, :n]
+        tone_frequencies = np.array(list(note_frequencies.values()), dtype=np.float64)
+        phase = np.outer(2.0 * np.pi * tone_frequencies / sample_rate, np.arange(self.max_note_samples))
+        self._segment_basis = np.vstack((np.cos(phase), np.sin(phase))).astype(np.float32)
+
+        self._history = RingBuffer(self.max_note_samples + 2 * window_length + MAX_CHUNK)
+        self.reset()
+
+    def reset(self):
+        """Reset state tracker"""
+        self.position = 0
+        self.last_signal_position = 0
+        self.pending_notes = False
+        self.silence_detected = False
+        self.last_frequency = None
+        self.last_amplitude = 0.0
+        self._history.clear()
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._onset = None
+        self._note = None
+        self._changed = 0
+        self._inactive = 0
+
+    def update(self, block):
+        """Memproses satu blok sampel; mengembalikan daftar (tipe, data, posisi_sampel)"""
+        block = np.asarray(block, dtype=np.float32)
+        events = []
+        for start in range(0, len(block), MAX_CHUNK):
+            events.extend(self._update_chunk(block[start:start + MAX_CHUNK]))
+        return events
+
+    def _update_chunk(self, chunk):
+        self._history.write(chunk)
+        buffer_start = self.position - len(self._pending)
+        self.position += len(chunk)
+        samples = np.concatenate((self._pending, chunk)) if len(self._pending) else chunk
+
+        if len(samples) < self.window_length:
+            self._pending = np.array(samples)
+            return []
+
+        frames = sliding_window_view(samples, self.window_length)[::self.hop]
+        energies, winners, ratios, amplitudes = self.frame_detector.analyze(frames)
+        active = (amplitudes > self.amplitude_threshold) & (ratios >= self.frame_detector.min_ratio)
+
+        events = []
+        for i in range(len(frames)):
+            frame_start = buffer_start + i * self.hop
+            events.extend(self._step(frame_start, bool(active[i]), int(winners[i])))
+
+        # Sisakan sampel yang masih dibutuhkan frame berikutnya
+        self._pending = np.array(samples[len(frames) * self.hop:])
+        # Frekuensi nominal nada pada frame terakhir, None jika frame itu tidak bernada
+        tonal = ratios[-1] >= self.frame_detector.min_ratio
+        self.last_frequency = float(self.frame_detector.tone_frequencies[winners[-1]]) if tonal else None
+        self.last_amplitude = float(amplitudes[-1])
+        return events
+
+    def _step(self, frame_start, active, winner):
+        """Mesin state onset/offset untuk satu frame"""
+        center = frame_start + self.window_length // 2
+        frame_end = frame_start + self.window_length
+        events = []
+
+        if active:
+            self.last_signal_position = frame_end
+            self.silence_detected = False
+            self._inactive = 0
+            if self._onset is None:
+                self._onset, self._note, self._changed = center, winner, 0
+            elif winner != self._note:
+                self._changed += 1
+                if self._changed >= CHANGE_FRAMES:
+                    # Nada berganti tanpa jeda: tutup segmen di frame pertama nada baru
+                    change = center - (self._changed - 1) * self.hop
+                    events.extend(self._close(change))
+                    self._onset, self._note, self._changed = change, winner, 0
+            else:
+                self._changed = 0
+            return events
+
+        if self._onset is not None:
+            self._inactive += 1
+            if self._inactive >= OFFSET_FRAMES:
+                events.extend(self._close(center - (self._inactive - 1) * self.hop))
+
+        if (self.pending_notes and not self.silence_detected and self._onset is None and
+                frame_end - self.last_signal_position > self.silence_samples):
+            self.silence_detected = True
+            self.pending_notes = False
+            events.append(("end_of_transmission", None, frame_end))
+        return events
+
+    def _close(self, offset):
+        """Menutup segmen [onset, offset) dan mengklasifikasikannya"""
+        onset, self._onset = self._onset, None
+        self._changed = 0
+        self._inactive = 0
+        if offset - onset < self.min_note_samples:
+            return []
+
+        note = self._classify(onset, offset)
+        if note is None:
+            return []
+        self.pending_notes = True
+        return [("note_detected", note, offset)]
+
+    def _classify(self, onset, offset):
+        """Goertzel koheren (berwindow) atas sampel segmen"""
+        onset = max(onset, offset - self.max_note_samples, self.position - len(self._history))
+        length = offset - onset
+        if length <= 0:
+            return self.notes[self._note] if self._note is not None else None
+
+        # offset <= position; ambil sampel [onset, offset) dari riwayat
+        recent = self._history.latest(self.position - onset)
+        segment = recent[:length] * make_window(self.window, length).astype(np.float32)
+        projection = self._segment_basis[:, :length] @ segment
+        count = len(self.notes)
+        energies = projection[:count] ** 2 + projection[count:] ** 2
+        return self.notes[int(np.argmax(energies))]
+
+    def advance(self, n_samples):
+        """Memajukan waktu melewati sampel yang hilang; segmen yang terpotong dibuang"""
+        self.position += n_samples
+        self._history.clear()
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._onset = None
+        self._changed = 0
+        self._inactive = 0
+
+    def flush(self):
+        """Menutup segmen dan transmisi yang masih terbuka (misalnya di akhir rekaman)"""
+        events = []
+        if self._onset is not None:
+            events.extend(self._close(self.position))
+        if self.pending_notes:
+            self.pending_notes = False
+            events.append(("end_of_transmission", None, self.position))
+        return events
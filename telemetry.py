@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import deque, namedtuple
+
+# Satu sampel telemetri; seq naik setiap kali nilai baru dipublikasikan
+Sample = namedtuple("Sample", ["seq", "timestamp", "frequency", "amplitude"])
+
+
+class TelemetryChannel:
+    """Slot nilai terakhir (plus ring nilai terbaru) untuk frekuensi dan amplitudo.
+
+    Berbeda dengan antrian event, nilai yang belum dibaca ditimpa nilai
+    baru, jadi memori tetap terbatas walaupun konsumen (GUI) berhenti
+    membaca. Publikasi dibatasi ke publish_rate per detik; pembaruan di
+    antaranya dilewati tanpa alokasi.
+    """
+
+    def __init__(self, publish_rate=20.0, history=64):
+        self.min_interval = 1.0 / publish_rate if publish_rate else 0.0
+        self._recent = deque(maxlen=history)
+        self._latest = None
+        self._next_publish = 0.0
+        self._seq = 0
+        self._lock = threading.Lock()
+
+        # Counter
+        self.published = 0
+        self.skipped = 0
+
+    def publish(self, frequency, amplitude, timestamp=None):
+        """Mempublikasikan nilai jika batas laju mengizinkan; mengembalikan True jika dipublikasikan"""
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        if timestamp < self._next_publish:
+            self.skipped += 1
+            return False
+
+        with self._lock:
+            self._seq += 1
+            sample = Sample(self._seq, timestamp, frequency, amplitude)
+            self._latest = sample
+            self._recent.append(sample)
+        self._next_publish = timestamp + self.min_interval
+        self.published += 1
+        return True
+
+    def latest(self, since=None):
+        """Sampel terakhir, atau None jika belum ada yang lebih baru dari seq since"""
+        sample = self._latest
+        if sample is None or (since is not None and sample.seq <= since):
+            return None
+        return sample
+
+    def recent(self, n=None):
+        """Daftar sampel terbaru, dari yang terlama"""
+        with self._lock:
+            samples = list(self._recent)
+        return samples if n is None else samples[-n:]
+
+    def clear(self):
+        """Mengosongkan slot dan ring (seq tetap naik)"""
+        with self._lock:
+            self._latest = None
+            self._recent.clear()
+        self._next_publish = 0.0
@@ -0,0 +1,126 @@
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from penerjemah import Penerjemah
+from tone_plan import TONE_PLAN_FILE, configured_alphabet
+
+# Jumlah baris per tugas saat dibagi ke process pool
+UKURAN_CHUNK = 2000
+
+# Penerjemah milik proses worker (dimuat sekali lewat initializer)
+_penerjemah_worker = None
+
+
+def normalisasi_kode(baris):
+    """Menghapus spasi/koma di antara nada, mis. '1 2 3' menjadi '123'"""
+    return ''.join(baris.replace(',', ' ').split())
+
+
+def terjemahkan_batch(daftar_kode, penerjemah=None, kamus_file="kamus.txt", mode_segmentasi=None):
+    """Generator terjemahan untuk iterable rangkaian kode.
+
+    Setiap elemen diterjemahkan secara independen (seperti satu transmisi
+    utuh) dan hasilnya di-yield satu per satu, sehingga memori tetap datar
+    berapa pun banyaknya input. State sesi penerjemah tidak disentuh.
+    """
+    if penerjemah is None:
+        penerjemah = Penerjemah(kamus_file, trie_backend="mmap", alfabet=configured_alphabet())
+    mode = mode_segmentasi or penerjemah.mode_segmentasi
+
+    for kode in daftar_kode:
+        # Lewat Kamus agar baris yang berulang diambil dari cache LRU
+        yield ' '.join(penerjemah.kamus.segmentasi(normalisasi_kode(kode), mode))
+
+
+def _inisialisasi_worker(kamus_file, mode_segmentasi, trie_backend, alfabet):
+    global _penerjemah_worker
+    # Pesan pemuatan kamus jangan sampai tercampur dengan output di stdout
+    with redirect_stdout(sys.stderr):
+        _penerjemah_worker = Penerjemah(kamus_file, mode_segmentasi, trie_backend, alfabet=alfabet)
+
+
+def _terjemahkan_chunk(chunk):
+    return list(terjemahkan_batch(chunk, _penerjemah_worker))
+
+
+def _chunk(iterable, ukuran):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, ukuran))
+        if not chunk:
+            return
+        yield chunk
+
+
+def terjemahkan_paralel(daftar_kode, proses, kamus_file="kamus.txt", mode_segmentasi="greedy",
+                        trie_backend="mmap", ukuran_chunk=UKURAN_CHUNK, alfabet=None):
+    """Seperti terjemahkan_batch, tetapi dibagi ke process pool dengan urutan tetap.
+
+    Jumlah chunk yang sedang diproses dibatasi, sehingga input tidak dibaca
+    seluruhnya ke memori.
+    """
+    with ProcessPoolExecutor(
+        max_workers=proses,
+        initializer=_inisialisasi_worker,
+        initargs=(kamus_file, mode_segmentasi, trie_backend, alfabet or configured_alphabet())
+    ) as executor:
+        maks_antrian = 2 * (proses or os.cpu_count() or 1)
+        antrian = deque()
+        for chunk in _chunk(daftar_kode, ukuran_chunk):
+            antrian.append(executor.submit(_terjemahkan_chunk, chunk))
+            if len(antrian) >= maks_antrian:
+                yield from antrian.popleft().result()
+        while antrian:
+            yield from antrian.popleft().result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Terjemahkan file rangkaian kode nada (satu per baris)")
+    parser.add_argument("input", help="File input ('-' untuk stdin)")
+    parser.add_argument("output", help="File output ('-' untuk stdout)")
+    parser.add_argument("--kamus", default="kamus.txt", help="File kamus")
+    parser.add_argument("--mode", default="greedy", help="Mode segmentasi: greedy, optimal atau beam")
+    parser.add_argument("--backend", default="mmap", help="Backend trie: dict, array atau mmap")
+    parser.add_argument("--nada", default=TONE_PLAN_FILE, help="File rencana nada (menentukan alfabet kode)")
+    parser.add_argument("-j", "--proses", type=int, default=1, help="Jumlah proses (1 = tanpa pool)")
+    parser.add_argument("--chunk", type=int, default=UKURAN_CHUNK, help="Baris per tugas pool")
+    args = parser.parse_args()
+    alfabet = configured_alphabet(args.nada)
+
+    masukan = sys.stdin if args.input == "-" else open(args.input, 'r', encoding='utf-8')
+    keluaran = sys.stdout if args.output == "-" else open(args.output, 'w', encoding='utf-8')
+
+    mulai = time.perf_counter()
+    jumlah = 0
+    try:
+        baris = (line.rstrip('\n') for line in masukan)
+        if args.proses == 1:
+            with redirect_stdout(sys.stderr):
+                penerjemah = Penerjemah(args.kamus, args.mode, args.backend, alfabet=alfabet)
+            hasil = terjemahkan_batch(baris, penerjemah)
+        else:
+            hasil = terjemahkan_paralel(
+                baris, args.proses, args.kamus, args.mode, args.backend, args.chunk, alfabet
+            )
+
+        for terjemahan in hasil:
+            keluaran.write(terjemahan + "\n")
+            jumlah += 1
+    finally:
+        if masukan is not sys.stdin:
+            masukan.close()
+        if keluaran is not sys.stdout:
+            keluaran.close()
+
+    durasi = time.perf_counter() - mulai
+    print(f"{jumlah} baris diterjemahkan dalam {durasi:.1f} detik", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from segmentasi import segmentasi
+from trie import buat_trie
+
+ALFABET = "1234567"
+PANJANG_MAKS = 6
+
+
+def kamus_acak(rng, jumlah, panjang_maks=PANJANG_MAKS):
+    """Kamus {kode: kata} acak; kata unik sehingga bisa dipetakan balik ke kode"""
+    kamus = {}
+    while len(kamus) < jumlah:
+        kode = ''.join(rng.choice(ALFABET) for _ in range(rng.randint(1, panjang_maks)))
+        kamus.setdefault(kode, f"w{len(kamus)}")
+    return kamus
+
+
+def rangkaian_acak(rng, panjang):
+    return ''.join(rng.choice(ALFABET) for _ in range(panjang))
+
+
+def greedy_naif(kamus, rangkaian):
+    """Kecocokan terpanjang dari kiri dengan slicing, sebagai referensi"""
+    hasil = []
+    i = 0
+    while i < len(rangkaian):
+        for panjang in range(min(PANJANG_MAKS, len(rangkaian) - i), 0, -1):
+            if rangkaian[i:i + panjang] in kamus:
+                hasil.append(kamus[rangkaian[i:i + panjang]])
+                i += panjang
+                break
+        else:
+            hasil.append(rangkaian[i])
+            i += 1
+    return hasil
+
+
+def tidak_dikenal_minimum(kamus, rangkaian):
+    """Jumlah minimum kode tidak dikenal atas semua segmentasi (DP naif)"""
+    n = len(rangkaian)
+    terbaik = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        terbaik[i] = terbaik[i + 1] + 1
+        for panjang in range(1, min(PANJANG_MAKS, n - i) + 1):
+            if rangkaian[i:i + panjang] in kamus:
+                terbaik[i] = min(terbaik[i], terbaik[i + panjang])
+    return terbaik[0]
+
+
+def buat(backend, kamus):
+    trie = buat_trie(backend, ALFABET)
+    for kode, kata in kamus.items():
+        trie.tambah(kode, kata)
+    return trie
+
+
+@pytest.fixture(params=["dict", "array"])
+def backend(request):
+    return request.param
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_greedy_sama_dengan_referensi_naif(backend, seed):
+    rng = random.Random(seed)
+    kamus = kamus_acak(rng, rng.randint(1, 200))
+    trie = buat(backend, kamus)
+    for _ in range(10):
+        rangkaian = rangkaian_acak(rng, rng.randint(0, 60))
+        assert segmentasi(trie, rangkaian, "greedy") == greedy_naif(kamus, rangkaian)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_optimal_mencapai_tidak_dikenal_minimum(backend, seed):
+    rng = random.Random(seed)
+    kamus = kamus_acak(rng, rng.randint(1, 200))
+    kode_kata = {kata: kode for kode, kata in kamus.items()}
+    trie = buat(backend, kamus)
+    for _ in range(10):
+        rangkaian = rangkaian_acak(rng, rng.randint(0, 60))
+        hasil = segmentasi(trie, rangkaian, "optimal")
+
+        # Hasil harus menutup seluruh rangkaian, kata dikenal atau satu kode
+        assert ''.join(kode_kata.get(token, token) for token in hasil) == rangkaian
+        tidak_dikenal = [token for token in hasil if token not in kode_kata]
+        assert all(len(token) == 1 for token in tidak_dikenal)
+        assert len(tidak_dikenal) == tidak_dikenal_minimum(kamus, rangkaian)
+
+
+def test_optimal_tidak_lebih_buruk_dari_greedy(backend):
+    # "12" serakah memakan awal "234"; optimal memilih 1 + 234
+    kamus = {"12": "a", "234": "b"}
+    trie = buat(backend, kamus)
+    assert segmentasi(trie, "1234", "greedy") == ["a", "3", "4"]
+    assert segmentasi(trie, "1234", "optimal") == ["1", "b"]
@@ -0,0 +1,291 @@
+import numpy as np
+from collections import namedtuple
+
+# Hasil deteksi satu blok audio
+Detection = namedtuple("Detection", ["frequency", "amplitude", "note", "energies"])
+
+# Rasio energi minimum nada pemenang terhadap energi total blok (engine Goertzel)
+MIN_TONE_RATIO = 0.3
+
+# Rasio energi minimum lobus puncak (puncak +-PEAK_LOBE_BINS bin) terhadap
+# energi spektrum total (engine FFT); blok campuran tepi nada/noise ditolak
+MIN_PEAK_RATIO = 0.7
+PEAK_LOBE_BINS = 2
+
+DETECTOR_ENGINES = ("goertzel", "fft")
+
+# Interpolasi puncak sub-bin untuk engine FFT
+PEAK_INTERPOLATIONS = ("none", "quadratic", "gaussian")
+
+# Fungsi window untuk analisis short-time (engine Goertzel)
+WINDOW_FUNCTIONS = {
+    "rect": np.ones,
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+}
+
+
+def make_window(name, n):
+    """Window sepanjang n sampel sesuai nama di WINDOW_FUNCTIONS"""
+    try:
+        return WINDOW_FUNCTIONS[name](n)
+    except KeyError:
+        raise ValueError(f"Fungsi window tidak dikenal: {name}") from None
+
+
+class ToneTable:
+    """Pencarian nada terdekat tervektorisasi, dibangun sekali per rencana nada.
+
+    Frekuensi nada diurutkan sekali; frekuensi puncak lalu dipetakan ke nada
+    terdekat dengan np.searchsorted terhadap titik tengah antar nada
+    (O(log jumlah nada) per blok, tanpa loop Python). Untuk puncak yang
+    terkunci ke bin rfft, tabel bin -> nada di-cache per panjang blok.
+    """
+
+    def __init__(self, tone_frequencies, tolerance):
+        tone_frequencies = np.asarray(tone_frequencies, dtype=np.float64)
+        self.order = np.argsort(tone_frequencies)
+        self.sorted_frequencies = tone_frequencies[self.order]
+        self.midpoints = (self.sorted_frequencies[1:] + self.sorted_frequencies[:-1]) / 2.0
+        self.tolerance = tolerance
+        self._bin_tables = {}
+
+    def classify(self, frequencies):
+        """Indeks nada terdekat dalam toleransi untuk tiap frekuensi, -1 jika tidak ada"""
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        nearest = np.searchsorted(self.midpoints, frequencies)
+        within = np.abs(frequencies - self.sorted_frequencies[nearest]) <= self.tolerance
+        return np.where(within, self.order[nearest], -1)
+
+    def bin_table(self, n, sample_rate):
+        """Tabel indeks nada per bin rfft untuk blok sepanjang n sampel"""
+        key = (n, sample_rate)
+        table = self._bin_tables.get(key)
+        if table is None:
+            table = self.classify(np.fft.rfftfreq(n, 1.0 / sample_rate))
+            self._bin_tables[key] = table
+        return table
+
+
+class FFTDetector:
+    """Detektor berbasis FFT penuh (jalur lama, dipertahankan sebagai fallback).
+
+    Tanpa interpolasi, frekuensi puncak terkunci ke pusat bin rfft
+    (sample_rate / n, ~43 Hz untuk 1024 sampel). Interpolasi "quadratic"
+    (parabola pada magnitudo) atau "gaussian" (parabola pada log magnitudo,
+    paling tepat dengan window hann) menggeser puncak ke posisi sub-bin,
+    sehingga nada berjarak 50 Hz tetap terpisah dengan window 256-512 sampel.
+
+    Puncak hanya diklasifikasikan jika spektrumnya murni: energi lobus
+    puncak minimal min_ratio dari energi total. Blok yang memotong tepi nada
+    (sisa nada kecil di antara noise) memberi puncak yang bisa jatuh ke nada
+    mana pun setelah interpolasi, jadi blok seperti itu dilaporkan tanpa nada.
+    """
+
+    def __init__(self, note_frequencies, sample_rate, tolerance, interpolation="none", window="rect",
+                 min_ratio=MIN_PEAK_RATIO):
+        if interpolation not in PEAK_INTERPOLATIONS:
+            raise ValueError(f"Interpolasi puncak tidak dikenal: {interpolation}")
+        self.notes = list(note_frequencies.keys())
+        self.tone_frequencies = np.array(list(note_frequencies.values()), dtype=np.float64)
+        self.sample_rate = sample_rate
+        self.tolerance = tolerance
+        self.interpolation = interpolation
+        self.window = window
+        self.min_ratio = min_ratio
+        make_window(window, 1)  # validasi nama window
+        self.table = ToneTable(self.tone_frequencies, tolerance)
+        self._frequencies = {}
+        self._windows = {}
+
+    def _rfftfreq(self, n):
+        """Vektor frekuensi rfft di-cache per panjang blok"""
+        frequencies = self._frequencies.get(n)
+        if frequencies is None:
+            frequencies = np.fft.rfftfreq(n, 1.0 / self.sample_rate)
+            self._frequencies[n] = frequencies
+        return frequencies
+
+    def _spectrum(self, blocks):
+        """Magnitudo rfft sepanjang sumbu terakhir, dengan window jika dikonfigurasi"""
+        if self.window == "rect":
+            return np.abs(np.fft.rfft(blocks, axis=-1))
+        n = blocks.shape[-1]
+        window = self._windows.get(n)
+        if window is None:
+            window = make_window(self.window, n).astype(np.float32)
+            self._windows[n] = window
+        return np.abs(np.fft.rfft(blocks * window, axis=-1))
+
+    def _refine(self, magnitudes, peak_indices):
+        """Pergeseran sub-bin (-0.5..0.5) dari puncak parabola melalui tiga bin di sekitarnya"""
+        if self.interpolation == "none":
+            return np.zeros(len(peak_indices))
+        rows = np.arange(len(peak_indices))
+        indices = np.clip(peak_indices, 1, magnitudes.shape[1] - 2)
+        left = magnitudes[rows, indices - 1]
+        center = magnitudes[rows, indices]
+        right = magnitudes[rows, indices + 1]
+        if self.interpolation == "gaussian":
+            left, center, right = (np.log(np.maximum(m, 1e-12)) for m in (left, center, right))
+
+        denominator = left - 2.0 * center + right
+        delta = np.divide(
+            0.5 * (left - right), denominator,
+            out=np.zeros(len(peak_indices)), where=denominator < 0
+        )
+        return np.clip(delta, -0.5, 0.5) + (indices - peak_indices)
+
+    @staticmethod
+    def _purity(power, peak_indices):
+        """Rasio energi lobus puncak terhadap energi total (tanpa DC) per blok"""
+        cumulative = np.cumsum(power[:, 1:], axis=1)
+        rows = np.arange(len(peak_indices))
+        low = np.maximum(peak_indices - PEAK_LOBE_BINS, 1) - 1
+        high = np.minimum(peak_indices + PEAK_LOBE_BINS, power.shape[1] - 1) - 1
+        lobe = cumulative[rows, high] - np.where(low > 0, cumulative[rows, low - 1], 0.0)
+        total = cumulative[:, -1]
+        return np.divide(lobe, total, out=np.zeros(len(peak_indices)), where=total > 0)
+
+    def detect(self, audio_data):
+        """Deteksi frekuensi puncak dan nada yang cocok"""
+        return self.detect_batch(np.asarray(audio_data)[None, :])[0]
+
+    def detect_batch(self, blocks):
+        """Deteksi untuk banyak stream sekaligus; blocks berbentuk (stream, sampel)"""
+        amplitudes = np.max(np.abs(blocks), axis=1)
+
+        magnitudes = self._spectrum(blocks)
+        frequencies = self._rfftfreq(blocks.shape[1])
+        bin_width = frequencies[1]
+
+        # Skip DC component
+        peak_indices = np.argmax(magnitudes[:, 1:], axis=1) + 1
+        peak_frequencies = (peak_indices + self._refine(magnitudes, peak_indices)) * bin_width
+
+        # Energi pada bin terdekat tiap nada
+        tone_bins = np.rint(self.tone_frequencies / bin_width).astype(np.intp)
+        energies = magnitudes[:, np.clip(tone_bins, 0, magnitudes.shape[1] - 1)] ** 2
+
+        # Nada terdekat dalam toleransi; tanpa interpolasi cukup lihat tabel bin
+        if self.interpolation == "none":
+            matches = self.table.bin_table(blocks.shape[1], self.sample_rate)[peak_indices]
+        else:
+            matches = self.table.classify(peak_frequencies)
+        matches = np.where(self._purity(magnitudes ** 2, peak_indices) >= self.min_ratio, matches, -1)
+
+        return [
+            Detection(
+                float(peak_frequencies[i]), float(amplitudes[i]),
+                self.notes[matches[i]] if matches[i] >= 0 else None, energies[i]
+            )
+            for i in range(len(blocks))
+        ]
+
+
+class GoertzelDetector:
+    """Bank Goertzel tervektorisasi yang hanya menghitung energi pada nada yang dikonfigurasi.
+
+    Koefisien cos/sin tiap nada dihitung sekali per panjang blok, lalu energi
+    seluruh nada didapat dari satu perkalian matriks. Hasilnya sama dengan
+    keluaran akhir algoritma Goertzel tanpa loop per sampel di Python.
+    Window (selain "rect") dileburkan ke dalam basis, jadi tanpa biaya tambahan.
+
+    Energi hanya diukur tepat di frekuensi nada, jadi tidak ada toleransi
+    frekuensi seperti engine FFT: nada yang meleset lebih dari sekitar satu
+    bin (sample_rate / panjang blok) kehilangan energi dan ditolak oleh
+    min_ratio. Frekuensi Detection adalah frekuensi nominal nada yang
+    terdeteksi, atau None jika tidak ada nada.
+    """
+
+    def __init__(self, note_frequencies, sample_rate, min_ratio=MIN_TONE_RATIO, window="rect"):
+        self.notes = list(note_frequencies.keys())
+        self.tone_frequencies = np.array(list(note_frequencies.values()), dtype=np.float64)
+        self.sample_rate = sample_rate
+        self.min_ratio = min_ratio
+        self.window = window
+        make_window(window, 1)  # validasi nama window
+        self._basis = {}
+        self._scale = {}
+
+    def _coefficients(self, n):
+        """Basis cos/sin berwindow (2 x jumlah nada, n) di-cache per panjang blok"""
+        basis = self._basis.get(n)
+        if basis is None:
+            omega = 2.0 * np.pi * self.tone_frequencies / self.sample_rate
+            phase = np.outer(omega, np.arange(n))
+            window = make_window(self.window, n)
+            basis = (np.vstack((np.cos(phase), np.sin(phase))) * window).astype(np.float32)
+            self._basis[n] = basis
+            # Nada murni tepat di frekuensi nada: |X|^2 = energi sinyal x (jumlah window)^2 / 2n
+            self._scale[n] = float(np.sum(window)) ** 2 / (2.0 * n)
+        return basis
+
+    def tone_energies(self, audio_data):
+        """Energi |X(f)|^2 pada tiap frekuensi nada"""
+        basis = self._coefficients(len(audio_data))
+        projection = basis @ np.asarray(audio_data, dtype=np.float32)
+        count = len(self.notes)
+        return projection[:count] ** 2 + projection[count:] ** 2
+
+    def detect(self, audio_data):
+        """Deteksi nada pemenang dari energi bank Goertzel"""
+        amplitude = float(np.max(np.abs(audio_data)))
+        energies = self.tone_energies(audio_data)
+
+        winner = int(np.argmax(energies))
+
+        # Normalisasi: nada murni tepat di frekuensi nada memberi rasio ~1
+        total_energy = float(np.dot(audio_data, audio_data)) * self._scale[len(audio_data)]
+        ratio = float(energies[winner]) / total_energy if total_energy > 0 else 0.0
+
+        if ratio < self.min_ratio:
+            return Detection(None, amplitude, None, energies)
+        return Detection(float(self.tone_frequencies[winner]), amplitude, self.notes[winner], energies)
+
+    def analyze(self, blocks):
+        """Array (energi, indeks nada pemenang, rasio, amplitudo) untuk blocks (blok, sampel)"""
+        blocks = np.asarray(blocks, dtype=np.float32)
+        amplitudes = np.max(np.abs(blocks), axis=1)
+
+        # Satu perkalian matriks untuk semua blok dan semua nada
+        projection = blocks @ self._coefficients(blocks.shape[1]).T
+        count = len(self.notes)
+        energies = projection[:, :count] ** 2 + projection[:, count:] ** 2
+
+        winners = np.argmax(energies, axis=1)
+        total_energy = np.einsum("ij,ij->i", blocks, blocks) * self._scale[blocks.shape[1]]
+        winner_energy = energies[np.arange(len(blocks)), winners]
+        ratios = np.divide(
+            winner_energy, total_energy,
+            out=np.zeros_like(winner_energy), where=total_energy > 0
+        )
+        return energies, winners, ratios, amplitudes
+
+    def detect_batch(self, blocks):
+        """Deteksi untuk banyak stream sekaligus; blocks berbentuk (stream, sampel)"""
+        energies, winners, ratios, amplitudes = self.analyze(blocks)
+
+        detected = ratios >= self.min_ratio
+        return [
+            Detection(
+                float(self.tone_frequencies[winners[i]]) if detected[i] else None, float(amplitudes[i]),
+                self.notes[winners[i]] if detected[i] else None, energies[i]
+            )
+            for i in range(len(blocks))
+        ]
+
+
+def create_detector(engine, note_frequencies, sample_rate, tolerance, window="rect",
+                    interpolation="none"):
+    """Membuat detektor sesuai nama engine.
+
+    tolerance dan interpolation hanya untuk engine FFT; engine Goertzel
+    menolak nada yang meleset lewat min_ratio (lihat GoertzelDetector).
+    """
+    if engine == "goertzel":
+        return GoertzelDetector(note_frequencies, sample_rate, window=window)
+    if engine == "fft":
+        return FFTDetector(note_frequencies, sample_rate, tolerance, interpolation, window)
+    raise ValueError(f"Engine detektor tidak dikenal: {engine}")
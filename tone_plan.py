@@ -0,0 +1,119 @@
+import argparse
+
+# Rencana nada bawaan (disesuaikan dengan kode C++ asli)
+DEFAULT_TONE_PLAN = {
+    "1": 2000.00,
+    "2": 2050.00,
+    "3": 2100.00,
+    "4": 2150.01,
+    "5": 2200.00,
+    "6": 2250.00,
+    "7": 2300.00
+}
+
+# File rencana nada default (dibaca relatif terhadap direktori kerja, seperti kamus.txt)
+TONE_PLAN_FILE = "nada.txt"
+
+# Simbol untuk rencana yang dibangkitkan; tujuh pertama sama dengan rencana bawaan
+TONE_SYMBOLS = "1234567890ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz+/"
+MAX_TONES = len(TONE_SYMBOLS)
+
+# Karakter yang punya arti lain di file kamus/rencana atau dibuang normalisasi_kode
+RESERVED_SYMBOLS = set("=#, \t\r\n")
+
+
+def generate_tone_plan(count, base_frequency=2000.0, spacing=50.0, symbols=TONE_SYMBOLS):
+    """Rencana count nada berjarak sama mulai dari base_frequency"""
+    if not 1 <= count <= len(symbols):
+        raise ValueError(f"Jumlah nada harus di antara 1 dan {len(symbols)}")
+    return {symbols[i]: base_frequency + i * spacing for i in range(count)}
+
+
+def validate_tone_plan(plan):
+    """Memeriksa rencana nada; mengembalikan dict {simbol: frekuensi} yang sudah dinormalisasi"""
+    if not plan:
+        raise ValueError("Rencana nada kosong")
+    if len(plan) > MAX_TONES:
+        raise ValueError(f"Rencana nada maksimal {MAX_TONES} nada, didapat {len(plan)}")
+
+    normalized = {}
+    for symbol, frequency in plan.items():
+        if len(symbol) != 1 or symbol in RESERVED_SYMBOLS:
+            raise ValueError(f"Simbol nada harus satu karakter biasa: {symbol!r}")
+        frequency = float(frequency)
+        if frequency <= 0:
+            raise ValueError(f"Frekuensi nada {symbol!r} harus positif: {frequency}")
+        normalized[symbol] = frequency
+
+    frequencies = sorted(normalized.values())
+    if any(b == a for a, b in zip(frequencies, frequencies[1:])):
+        raise ValueError("Dua nada memakai frekuensi yang sama")
+    return normalized
+
+
+def load_tone_plan(filename, default=None):
+    """Memuat rencana nada dari file teks baris "simbol=frekuensi".
+
+    Baris kosong dan baris yang diawali '#' diabaikan. Jika file tidak ada
+    dan default diberikan, salinan default dikembalikan.
+    """
+    plan = {}
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            for nomor, line in enumerate(file, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                symbol, separator, frequency = line.partition('=')
+                if not separator:
+                    raise ValueError(f"{filename}:{nomor}: format harus simbol=frekuensi")
+                symbol = symbol.strip()
+                if symbol in plan:
+                    raise ValueError(f"{filename}:{nomor}: simbol {symbol!r} ganda")
+                plan[symbol] = frequency.strip()
+    except FileNotFoundError:
+        if default is None:
+            raise
+        return dict(default)
+    return validate_tone_plan(plan)
+
+
+def save_tone_plan(plan, filename):
+    """Menyimpan rencana nada ke file teks"""
+    with open(filename, 'w', encoding='utf-8') as file:
+        for symbol, frequency in validate_tone_plan(plan).items():
+            file.write(f"{symbol}={frequency:.2f}\n")
+
+
+def tone_alphabet(plan):
+    """Alfabet kode (urutan simbol) untuk Trie/Penerjemah"""
+    return ''.join(plan)
+
+
+def configured_alphabet(filename=TONE_PLAN_FILE):
+    """Alfabet rencana nada yang dikonfigurasi, tanpa perlu mengimpor modul audio"""
+    return tone_alphabet(load_tone_plan(filename, DEFAULT_TONE_PLAN))
+
+
+def min_spacing(plan):
+    """Jarak terkecil antar frekuensi nada (Hz); inf untuk satu nada"""
+    frequencies = sorted(plan.values())
+    return min((b - a for a, b in zip(frequencies, frequencies[1:])), default=float("inf"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Membangkitkan file rencana nada")
+    parser.add_argument("output", help="File rencana nada (mis. nada.txt)")
+    parser.add_argument("--jumlah", type=int, default=16, help=f"Jumlah nada (1-{MAX_TONES})")
+    parser.add_argument("--dasar", type=float, default=2000.0, help="Frekuensi nada pertama (Hz)")
+    parser.add_argument("--jarak", type=float, default=50.0, help="Jarak antar nada (Hz)")
+    args = parser.parse_args()
+
+    plan = generate_tone_plan(args.jumlah, args.dasar, args.jarak)
+    save_tone_plan(plan, args.output)
+    print(f"{len(plan)} nada ({min(plan.values()):.0f}-{max(plan.values()):.0f} Hz) "
+          f"ditulis ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+# Batas default jendela transkrip di memori
+MAKS_ENTRI = 1000
+
+
+class Transkrip:
+    """Transkrip bergulir berukuran terbatas dengan jurnal append-only di disk.
+
+    Hanya entri terbaru (dibatasi jumlah dan/atau umur) yang disimpan di
+    memori. Entri yang lebih lama dipindahkan ke jurnal JSON Lines oleh
+    thread penulis di latar belakang, sehingga pemanggil tidak pernah
+    menunggu I/O disk. Tanpa file jurnal, entri lama langsung dibuang.
+    """
+
+    def __init__(self, maks_entri=MAKS_ENTRI, maks_umur=None, jurnal=None):
+        self.maks_entri = maks_entri
+        self.maks_umur = maks_umur
+        self.jurnal = jurnal
+        self._entri = deque()
+        self._kunci = threading.Lock()
+        self._antrian_tulis = None
+        self._penulis = None
+        # Kesalahan I/O terakhir dari thread penulis, dilaporkan oleh flush/tutup
+        self._galat = None
+
+    def tambah(self, teks, waktu=None):
+        """Menambah satu entri transkrip"""
+        waktu = time.time() if waktu is None else waktu
+        with self._kunci:
+            self._entri.append((waktu, teks))
+            self._tumpahkan(self._pangkas(waktu))
+
+    def _pangkas(self, sekarang):
+        """Mengeluarkan entri yang melewati batas jumlah atau umur"""
+        lama = []
+        while len(self._entri) > self.maks_entri:
+            lama.append(self._entri.popleft())
+        if self.maks_umur is not None:
+            while self._entri and sekarang - self._entri[0][0] > self.maks_umur:
+                lama.append(self._entri.popleft())
+        return lama
+
+    def _tumpahkan(self, entri):
+        """Menyerahkan entri lama ke thread penulis jurnal (dipanggil dengan _kunci dipegang).
+
+        Antrian dan thread penulis dibuat di bawah kunci yang sama dengan
+        pengeluaran entri, jadi hanya ada satu penulis dan urutan entri di
+        jurnal sama dengan urutan entri keluar dari memori.
+        """
+        if not entri or self.jurnal is None:
+            return
+        if self._penulis is None:
+            self._antrian_tulis = queue.Queue()
+            self._penulis = threading.Thread(target=self._tulis_jurnal, args=(self._antrian_tulis,),
+                                             name="jurnal-transkrip", daemon=True)
+            self._penulis.start()
+        self._antrian_tulis.put(entri)
+
+    def _tulis_jurnal(self, antrian):
+        """Loop thread penulis: menulis batch entri ke jurnal sampai menerima None.
+
+        Kesalahan open/write tidak menghentikan thread: kesalahan dicatat
+        (batch tersebut hilang), antrian tetap dikuras dengan task_done
+        sehingga flush tidak menggantung, dan file dibuka ulang untuk
+        batch berikutnya.
+        """
+        file = None
+        try:
+            while True:
+                batch = [antrian.get()]
+                # Gabungkan semua yang sudah menunggu menjadi satu tulisan
+                while True:
+                    try:
+                        batch.append(antrian.get_nowait())
+                    except queue.Empty:
+                        break
+
+                try:
+                    if file is None:
+                        file = open(self.jurnal, 'a', encoding='utf-8')
+                    for entri in batch:
+                        for waktu, teks in entri or ():
+                            file.write(json.dumps({"waktu": waktu, "teks": teks}, ensure_ascii=False) + "\n")
+                    file.flush()
+                except Exception as e:
+                    self._galat = e
+                    if file is not None:
+                        self._tutup_file(file)
+                        file = None
+                finally:
+                    for _ in batch:
+                        antrian.task_done()
+
+                if None in batch:
+                    return
+        finally:
+            if file is not None:
+                self._tutup_file(file)
+
+    def _tutup_file(self, file):
+        try:
+            file.close()
+        except Exception as e:
+            self._galat = e
+
+    def _laporkan_galat(self):
+        """Melempar ulang kesalahan penulis jurnal (sekali) jika ada"""
+        galat, self._galat = self._galat, None
+        if galat is not None:
+            raise OSError(f"Gagal menulis jurnal transkrip {self.jurnal}: {galat}") from galat
+
+    def __len__(self):
+        with self._kunci:
+            return len(self._entri)
+
+    def __iter__(self):
+        return iter(self.terbaru())
+
+    def terbaru(self, jumlah=None):
+        """Daftar (waktu, teks) di memori, dari yang terlama; jumlah membatasi ke n terakhir"""
+        with self._kunci:
+            self._tumpahkan(self._pangkas(time.time()))
+            entri = list(self._entri)
+        return entri if jumlah is None else entri[-jumlah:]
+
+    def flush(self):
+        """Menunggu sampai semua entri yang ditumpahkan tertulis di jurnal.
+
+        OSError jika penulis gagal menulis sejak laporan terakhir; entri
+        batch yang gagal tidak ada di jurnal.
+        """
+        antrian = self._antrian_tulis
+        if antrian is not None:
+            antrian.join()
+        self._laporkan_galat()
+
+    def tutup(self):
+        """Menulis seluruh entri di memori ke jurnal lalu menghentikan thread penulis.
+
+        OSError (setelah thread berhenti) jika ada entri yang gagal ditulis.
+        """
+        if self.jurnal is None:
+            return
+        with self._kunci:
+            self._tumpahkan(list(self._entri))
+            self._entri.clear()
+            penulis, antrian = self._penulis, self._antrian_tulis
+            self._penulis = self._antrian_tulis = None
+            if antrian is not None:
+                antrian.put(None)
+        if penulis is not None:
+            penulis.join()
+        self._laporkan_galat()
+
+    def ukuran_jurnal(self):
+        """Ukuran jurnal (byte) saat ini; offset awal untuk entri yang ditulis setelahnya"""
+        if self.jurnal is None:
+            return 0
+        try:
+            return os.path.getsize(self.jurnal)
+        except FileNotFoundError:
+            return 0
+
+    def semua(self, offset=0):
+        """Seluruh transkrip sebagai daftar (waktu, teks): jurnal mulai offset lalu entri di memori.
+
+        Penulis jurnal ditunggu selagi memori dikunci, jadi setiap entri
+        muncul tepat sekali meski entri terus ditambahkan. OSError jika
+        penulis gagal menulis (lihat flush).
+        """
+        with self._kunci:
+            entri = list(self._entri)
+            if self._antrian_tulis is not None:
+                self._antrian_tulis.join()
+            akhir = self.ukuran_jurnal()
+        self._laporkan_galat()
+
+        lama = []
+        if akhir > offset:
+            with open(self.jurnal, 'rb') as file:
+                file.seek(offset)
+                while file.tell() < akhir:
+                    data = json.loads(file.readline())
+                    lama.append((data["waktu"], data["teks"]))
+        return lama + entri
+
+    def baca_jurnal(self, offset=0, batas=100):
+        """Membaca satu halaman jurnal mulai dari offset byte.
+
+        Mengembalikan (entri, offset_berikutnya); offset_berikutnya dipakai
+        untuk halaman selanjutnya dan bernilai None jika jurnal sudah habis.
+        """
+        entri = []
+        if self.jurnal is None:
+            return entri, None
+        try:
+            with open(self.jurnal, 'rb') as file:
+                file.seek(offset)
+                while len(entri) < batas:
+                    line = file.readline()
+                    if not line.endswith(b"\n"):
+                        # Akhir file (atau baris yang masih ditulis)
+                        return entri, None
+                    data = json.loads(line)
+                    entri.append((data["waktu"], data["teks"]))
+                return entri, file.tell()
+        except FileNotFoundError:
+            return entri, None
+
+    def iter_jurnal(self, offset=0, ukuran_halaman=1000):
+        """Streaming seluruh entri jurnal sebagai (waktu, teks)"""
+        while offset is not None:
+            entri, offset = self.baca_jurnal(offset, ukuran_halaman)
+            yield from entri
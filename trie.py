@@ -1,25 +1,150 @@
+import sys
+from collections import deque
+from itertools import islice
+
+import numpy as np
+
+# Alfabet kode nada default ("1".."7")
+ALFABET_DEFAULT = "1234567"
+
+BACKEND_TRIE = ("dict", "array")
+
+# Jumlah saran teratas yang di-cache per node
+K_CACHE_SARAN = 10
+
+def periksa_kode(kode, alfabet):
+    """ValueError jika kode kosong atau memuat simbol di luar alfabet (None = bebas)"""
+    if alfabet is not None and (not kode or not set(alfabet).issuperset(kode)):
+        raise ValueError(f"Kode {kode!r} di luar alfabet {alfabet!r}")
+
+
 class TrieNode:
+    __slots__ = ("children", "is_end_of_word", "kata", "saran")
+    
     def __init__(self):
         self.children = {}
         self.is_end_of_word = False
         self.kata = None
+        self.saran = None  # cache top-k lengkapi(), None = belum/invalid
 
 class Trie:
-    def __init__(self):
+    def __init__(self, alfabet=None):
+        # Alfabet kode opsional; jika diberikan, tambah() menolak simbol lain
+        self.alfabet = alfabet
         self.root = TrieNode()
-        self.daftar_kata = {}  # Untuk akses cepat
+        # Hanya jumlah kode; salinan daftar kode membuat versi_baru O(ukuran kamus)
+        self._jumlah_kode = 0
+    
+    def __len__(self):
+        return self._jumlah_kode
+    
+    def items(self):
+        """Semua pasangan (kode, kata) di kamus"""
+        return self.cari_prefix("").items()
     
     def tambah(self, kode, kata):
-        """Menambahkan kode dan kata ke Trie"""
+        """Menambahkan kode dan kata ke Trie; ValueError jika kode di luar alfabet"""
+        periksa_kode(kode, self.alfabet)
         node = self.root
+        node.saran = None
         for char in kode:
             if char not in node.children:
                 node.children[char] = TrieNode()
             node = node.children[char]
+            node.saran = None
         
+        if not node.is_end_of_word:
+            self._jumlah_kode += 1
         node.is_end_of_word = True
         node.kata = kata
-        self.daftar_kata[kode] = kata
+    
+    def hapus(self, kode):
+        """Menghapus kode dari Trie; mengembalikan False jika kode tidak ada"""
+        jalur = [self.root]
+        for char in kode:
+            node = jalur[-1].children.get(char)
+            if node is None:
+                return False
+            jalur.append(node)
+        
+        node = jalur[-1]
+        if not node.is_end_of_word:
+            return False
+        
+        node.is_end_of_word = False
+        node.kata = None
+        self._jumlah_kode -= 1
+        for node in jalur:
+            node.saran = None
+        self._pangkas(jalur, kode)
+        return True
+    
+    def _pangkas(self, jalur, kode):
+        """Membuang node daun yang tidak lagi menjadi akhir kata"""
+        for i in range(len(kode), 0, -1):
+            node = jalur[i]
+            if node.children or node.is_end_of_word:
+                break
+            del jalur[i - 1].children[kode[i - 1]]
+    
+    def versi_baru(self, ditambah=None, dihapus=()):
+        """Membuat Trie baru dengan perubahan diterapkan, tanpa mengubah Trie ini.
+        
+        Hanya node di sepanjang jalur kode yang berubah yang disalin (path
+        copying); node lain dibagi bersama dengan versi lama. Pembaca yang
+        masih memakai versi lama tidak pernah melihat trie setengah jadi.
+        """
+        baru = Trie(self.alfabet)
+        baru.root = self._salin_node(self.root)
+        baru._jumlah_kode = self._jumlah_kode
+        disalin = {id(baru.root)}
+        
+        for kode in dihapus:
+            jalur = baru._jalur_salinan(kode, disalin, buat=False)
+            if jalur and jalur[-1].is_end_of_word:
+                jalur[-1].is_end_of_word = False
+                jalur[-1].kata = None
+                baru._jumlah_kode -= 1
+                baru._pangkas(jalur, kode)
+        
+        for kode, kata in (ditambah or {}).items():
+            periksa_kode(kode, self.alfabet)
+            node = baru._jalur_salinan(kode, disalin, buat=True)[-1]
+            if not node.is_end_of_word:
+                baru._jumlah_kode += 1
+            node.is_end_of_word = True
+            node.kata = kata
+        
+        return baru
+    
+    @staticmethod
+    def _salin_node(node):
+        salinan = TrieNode()
+        salinan.children = dict(node.children)
+        salinan.is_end_of_word = node.is_end_of_word
+        salinan.kata = node.kata
+        return salinan
+    
+    def _jalur_salinan(self, kode, disalin, buat):
+        """Jalur node untuk kode, menyalin node bersama yang belum disalin"""
+        jalur = [self.root]
+        for char in kode:
+            induk = jalur[-1]
+            node = induk.children.get(char)
+            if node is None:
+                if not buat:
+                    return None
+                node = TrieNode()
+            elif id(node) not in disalin:
+                node = self._salin_node(node)
+            else:
+                jalur.append(node)
+                continue
+            
+            induk.children[char] = node
+            disalin.add(id(node))
+            jalur.append(node)
+        return jalur
     
     def cari(self, kode):
         """Mencari kata berdasarkan kode lengkap"""
@@ -54,6 +179,88 @@ class Trie:
         for char, child_node in node.children.items():
             self._collect_words(child_node, current_prefix + char, result)
     
+    def lengkapi(self, prefix, limit=None):
+        """Iterator lazy (kode, kata) berawalan prefix, kode terpendek lebih dulu.
+        
+        Kode yang lebih pendek butuh lebih sedikit nada tambahan, sehingga
+        dianggap kelanjutan yang paling mungkin.
+        """
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return iter(())
+        return self.lengkapi_dari(node, prefix, limit)
+    
+    def lengkapi_dari(self, node, prefix, limit=None):
+        """Seperti lengkapi, mulai dari node (mis. cursor) yang mewakili prefix"""
+        if limit is not None and limit <= K_CACHE_SARAN:
+            # Top-k di-cache di node sebagai akhiran kode (prefix pemanggil bisa
+            # berbeda); di-invalidasi oleh tambah/hapus di jalurnya
+            if node.saran is None:
+                node.saran = list(islice(self._telusuri_lebar(node, ""), K_CACHE_SARAN))
+            return ((prefix + akhiran, kata) for akhiran, kata in node.saran[:limit])
+        
+        hasil = self._telusuri_lebar(node, prefix)
+        return hasil if limit is None else islice(hasil, limit)
+    
+    @staticmethod
+    def _telusuri_lebar(node, prefix):
+        """Breadth-first: urut panjang kode, lalu leksikografis"""
+        antrian = deque([(node, prefix)])
+        while antrian:
+            node, kode = antrian.popleft()
+            if node.is_end_of_word:
+                yield kode, node.kata
+            for char in sorted(node.children):
+                antrian.append((node.children[char], kode + char))
+    
+    def cocok_terpanjang(self, rangkaian, mulai=0):
+        """Kata terpanjang yang cocok mulai dari posisi mulai: (panjang, kata) atau (0, None)"""
+        node = self.root
+        panjang = 0
+        kata = None
+        
+        for i in range(mulai, len(rangkaian)):
+            node = node.children.get(rangkaian[i])
+            if node is None:
+                break
+            if node.is_end_of_word:
+                panjang = i - mulai + 1
+                kata = node.kata
+        
+        return panjang, kata
+    
+    def cocok_semua(self, rangkaian, mulai=0):
+        """Semua kata yang cocok mulai dari posisi mulai: daftar (panjang, kata)"""
+        node = self.root
+        hasil = []
+        
+        for i in range(mulai, len(rangkaian)):
+            node = node.children.get(rangkaian[i])
+            if node is None:
+                break
+            if node.is_end_of_word:
+                hasil.append((i - mulai + 1, node.kata))
+        
+        return hasil
+    
+    def akar(self):
+        """Node awal untuk penelusuran bertahap (cursor)"""
+        return self.root
+    
+    def langkah(self, node, char):
+        """Satu langkah penelusuran dari node; None jika tidak ada cabang"""
+        return node.children.get(char)
+    
+    def cabang(self, node):
+        """Semua cabang dari node sebagai daftar (char, anak)"""
+        return list(node.children.items())
+    
+    def kata_node(self, node):
+        """Kata pada node jika node adalah akhir kata"""
+        return node.kata if node.is_end_of_word else None
+    
     def cari_terpanjang(self, rangkaian):
         """Mencari terjemahan terpanjang yang cocok"""
         node = self.root
@@ -70,4 +277,479 @@ class Trie:
             if node.is_end_of_word:
                 last_found = node.kata
         
-        return last_found
\ No newline at end of file
+        return last_found
+    
+    def ukuran_memori(self):
+        """Perkiraan memori (byte) node, dict anak, dan kata"""
+        total = 0
+        stack = [self.root]
+        kata_dihitung = set()
+        while stack:
+            node = stack.pop()
+            total += sys.getsizeof(node) + sys.getsizeof(node.children)
+            if node.kata is not None and id(node.kata) not in kata_dihitung:
+                kata_dihitung.add(id(node.kata))
+                total += sys.getsizeof(node.kata)
+            stack.extend(node.children.values())
+        return total
+
+
+class TabelIntern:
+    """Tabel kata append-only yang dibagi bersama oleh semua versi TrieArray.
+    
+    Indeks yang sudah diberikan tidak pernah berubah, jadi versi baru cukup
+    menambah kata di ujung tabel: versi lama tidak pernah membaca melewati
+    indeks miliknya sendiri. dasar (mis. TabelKata hasil mmap) dipakai apa
+    adanya tanpa di-intern ulang, sehingga membuat tabel ini O(1).
+    """
+    
+    def __init__(self, dasar=()):
+        self.dasar = dasar
+        self._awal = len(dasar)
+        self._kata = []
+        self._indeks = {}
+    
+    def __len__(self):
+        return self._awal + len(self._kata)
+    
+    def __getitem__(self, indeks):
+        if indeks < self._awal:
+            return self.dasar[indeks]
+        return self._kata[indeks - self._awal]
+    
+    def __iter__(self):
+        yield from self.dasar
+        yield from self._kata[:]
+    
+    def intern(self, kata):
+        """Indeks kata, menambahkannya di ujung tabel jika belum ada"""
+        indeks = self._indeks.get(kata)
+        if indeks is None:
+            indeks = len(self)
+            self._kata.append(kata)
+            self._indeks[kata] = indeks
+        return indeks
+    
+    def ukuran_memori(self):
+        if hasattr(self.dasar, "ukuran_memori"):
+            total = self.dasar.ukuran_memori()
+        else:
+            total = sys.getsizeof(self.dasar) + sum(sys.getsizeof(kata) for kata in self.dasar)
+        total += sys.getsizeof(self._kata) + sys.getsizeof(self._indeks)
+        return total + sum(sys.getsizeof(kata) for kata in self._kata)
+
+
+# Tabel node/kata dipadatkan ulang jika sampahnya melebihi isi hidup + batas ini
+BATAS_SAMPAH = 1024
+
+
+class TabelNode:
+    """Tabel node (anak per kolom dan indeks kata) append-only milik bersama versi TrieArray.
+    
+    Node yang sudah dipublikasikan tidak pernah ditulis ulang: versi_baru
+    menyalin node di jalur perubahan ke ujung tabel (path copying), jadi
+    versi lama tetap sah dan biaya versi baru sebanding dengan perubahan.
+    Tabel dari array read-only (mmap) disalin sekali sebelum ditulis.
+    """
+    
+    def __init__(self, lebar, anak, kata_node, jumlah, dapat_ditulis=True):
+        self.lebar = lebar
+        self.anak = anak
+        self.kata_node = kata_node
+        self.jumlah = jumlah
+        self.dapat_ditulis = dapat_ditulis
+        self._segarkan_view()
+    
+    @classmethod
+    def kosong(cls, lebar, kapasitas=64):
+        """Tabel berisi root saja"""
+        kapasitas = max(kapasitas, 1)
+        anak = np.zeros(kapasitas * lebar, dtype=np.int32)
+        return cls(lebar, anak, np.full(kapasitas, -1, dtype=np.int32), 1)
+    
+    def _segarkan_view(self):
+        """memoryview untuk indexing cepat dari Python (tanpa objek skalar NumPy)"""
+        self.anak_mv = memoryview(self.anak)
+        self.kata_mv = memoryview(self.kata_node)
+    
+    def salinan_dapat_ditulis(self):
+        """Salinan tabel ke memori sendiri (satu memcpy) dengan ruang untuk node baru"""
+        return self._pindah(max(2 * self.jumlah, 64))
+    
+    def _pindah(self, kapasitas):
+        lebar = self.lebar
+        anak = np.zeros(kapasitas * lebar, dtype=np.int32)
+        anak[:self.jumlah * lebar] = self.anak[:self.jumlah * lebar]
+        kata_node = np.full(kapasitas, -1, dtype=np.int32)
+        kata_node[:self.jumlah] = self.kata_node[:self.jumlah]
+        return TabelNode(lebar, anak, kata_node, self.jumlah)
+    
+    def node_baru(self, sumber=None):
+        """Menambah node di ujung tabel (salinan node sumber atau kosong); mengembalikan indeksnya"""
+        if self.jumlah == len(self.kata_node):
+            # Kapasitas digandakan; array lama tetap utuh bagi versi yang masih memakainya
+            besar = self._pindah(2 * len(self.kata_node))
+            self.anak, self.kata_node = besar.anak, besar.kata_node
+            self._segarkan_view()
+        
+        indeks = self.jumlah
+        if sumber is not None:
+            lebar = self.lebar
+            self.anak_mv[indeks * lebar:(indeks + 1) * lebar] = self.anak_mv[sumber * lebar:(sumber + 1) * lebar]
+            self.kata_mv[indeks] = self.kata_mv[sumber]
+        self.jumlah += 1
+        return indeks
+
+
+class TrieArray:
+    """Trie kompak berbasis array datar dengan API yang sama seperti Trie.
+
+    Anak setiap node disimpan dalam tabel padat (node x ukuran alfabet)
+    bertipe int32, dan kata disimpan sekali di tabel kata yang di-intern.
+    Node direpresentasikan sebagai indeks integer; root trie baru adalah
+    node 0, yang tidak pernah menjadi anak, sehingga nilai 0 di tabel anak
+    berarti "tidak ada anak". Kode dengan simbol di luar alfabet ditolak
+    (ValueError) agar salah ketik di kamus tidak menambah kolom ke setiap node.
+    
+    tambah/hapus mengubah trie di tempat (untuk membangun trie); trie yang
+    sudah dibagi ke pembaca diubah lewat versi_baru.
+    """
+    
+    def __init__(self, alfabet=ALFABET_DEFAULT, kapasitas=64):
+        self.alfabet = alfabet
+        self._kolom = {char: i for i, char in enumerate(alfabet)}
+        self._lebar = len(alfabet)
+        
+        self._tabel = TabelNode.kosong(self._lebar, kapasitas)
+        self._akar = 0
+        self._node_hidup = 1
+        self._jumlah_kode = 0
+        
+        # Tabel kata yang di-intern
+        self._kata = TabelIntern()
+        self._saran = {}  # cache top-k lengkapi() per node
+        self._segarkan_view()
+    
+    @classmethod
+    def dari_array(cls, alfabet, anak, kata_node, tabel_kata, jumlah_kode):
+        """Membuat trie dari array yang sudah jadi tanpa menyalin (mis. view read-only hasil mmap)"""
+        trie = cls.__new__(cls)
+        trie.alfabet = alfabet
+        trie._kolom = {char: i for i, char in enumerate(alfabet)}
+        trie._lebar = len(alfabet)
+        
+        # Array disalin saat modifikasi pertama
+        trie._tabel = TabelNode(trie._lebar, anak, kata_node, len(kata_node), dapat_ditulis=False)
+        trie._akar = 0
+        trie._node_hidup = len(kata_node)
+        trie._jumlah_kode = jumlah_kode
+        trie._kata = tabel_kata
+        trie._saran = {}
+        trie._segarkan_view()
+        return trie
+    
+    def ekspor(self):
+        """Tabel anak, kata per node, dan tabel kata yang terpakai (untuk serialisasi).
+        
+        Versi hasil versi_baru (root bukan node 0, ada node sampah) dipadatkan dulu.
+        """
+        if self._akar or self._tabel.jumlah != self._node_hidup:
+            return self.dipadatkan().ekspor()
+        jumlah_node = self._tabel.jumlah
+        return (
+            self._tabel.anak[:jumlah_node * self._lebar],
+            self._tabel.kata_node[:jumlah_node],
+            self._kata,
+        )
+    
+    def _pastikan_dapat_ditulis(self):
+        """Menyalin tabel read-only (mmap) ke memori sendiri sebelum modifikasi pertama.
+        
+        Tabel kata tidak disalin: TabelIntern dibagi bersama (append-only),
+        dan tabel read-only lain (mmap) dibungkus sebagai dasarnya.
+        """
+        if not self._tabel.dapat_ditulis:
+            self._tabel = self._tabel.salinan_dapat_ditulis()
+            self._segarkan_view()
+        if not isinstance(self._kata, TabelIntern):
+            self._kata = TabelIntern(self._kata)
+    
+    def _segarkan_view(self):
+        """Mengambil array dan memoryview tabel node (berubah saat tabel tumbuh)"""
+        self._anak_mv = self._tabel.anak_mv
+        self._kata_mv = self._tabel.kata_mv
+    
+    def _node_baru(self, sumber=None):
+        indeks = self._tabel.node_baru(sumber)
+        self._segarkan_view()
+        return indeks
+    
+    def __len__(self):
+        return self._jumlah_kode
+    
+    def tambah(self, kode, kata):
+        """Menambahkan kode dan kata ke Trie; ValueError jika kode di luar alfabet"""
+        periksa_kode(kode, self.alfabet)
+        self._pastikan_dapat_ditulis()
+        
+        saran = self._saran
+        node = self._akar
+        for char in kode:
+            if saran:
+                saran.pop(node, None)
+            slot = node * self._lebar + self._kolom[char]
+            anak = self._anak_mv[slot]
+            if not anak:
+                anak = self._node_baru()
+                self._node_hidup += 1
+                self._anak_mv[slot] = anak
+            node = anak
+        
+        indeks = self._kata.intern(kata)
+        
+        if saran:
+            saran.pop(node, None)
+        if self._kata_mv[node] < 0:
+            self._jumlah_kode += 1
+        self._kata_mv[node] = indeks
+    
+    def hapus(self, kode):
+        """Menghapus kode dari Trie; mengembalikan False jika kode tidak ada.
+        
+        Node tidak dipangkas; node tanpa kata hanya menjadi cabang kosong.
+        """
+        jalur = [self.akar()]
+        for char in kode:
+            node = self.langkah(jalur[-1], char)
+            if node is None:
+                return False
+            jalur.append(node)
+        
+        node = jalur[-1]
+        if self._kata_mv[node] < 0:
+            return False
+        self._pastikan_dapat_ditulis()
+        for node_jalur in jalur:
+            self._saran.pop(node_jalur, None)
+        self._kata_mv[node] = -1
+        self._jumlah_kode -= 1
+        return True
+    
+    def versi_baru(self, ditambah=None, dihapus=()):
+        """Membuat versi baru dengan perubahan diterapkan, tanpa mengubah trie ini.
+        
+        Tabel node dan tabel kata dibagi bersama; hanya node di sepanjang
+        jalur kode yang berubah yang disalin ke ujung tabel (path copying),
+        jadi biayanya sebanding dengan perubahan, bukan ukuran kamus. Jika
+        node/kata sampah dari versi-versi lama melebihi isi yang hidup,
+        versi baru dipadatkan ulang.
+        """
+        baru = TrieArray.__new__(TrieArray)
+        baru.alfabet = self.alfabet
+        baru._kolom = self._kolom
+        baru._lebar = self._lebar
+        baru._tabel = self._tabel
+        baru._akar = self._akar
+        baru._node_hidup = self._node_hidup
+        baru._jumlah_kode = self._jumlah_kode
+        baru._kata = self._kata
+        baru._saran = {}
+        baru._segarkan_view()
+        baru._pastikan_dapat_ditulis()
+        
+        disalin = set()
+        for kode in dihapus:
+            if baru.cari(kode) is None:
+                continue
+            node = baru._jalur_salinan(kode, disalin)
+            baru._kata_mv[node] = -1
+            baru._jumlah_kode -= 1
+        
+        for kode, kata in (ditambah or {}).items():
+            periksa_kode(kode, self.alfabet)
+            if baru.cari(kode) == kata:
+                continue
+            indeks = baru._kata.intern(kata)
+            node = baru._jalur_salinan(kode, disalin)
+            if baru._kata_mv[node] < 0:
+                baru._jumlah_kode += 1
+            baru._kata_mv[node] = indeks
+        
+        if (baru._tabel.jumlah > 2 * baru._node_hidup + BATAS_SAMPAH or
+                len(baru._kata) > 2 * baru._jumlah_kode + BATAS_SAMPAH):
+            return baru.dipadatkan()
+        return baru
+    
+    def _jalur_salinan(self, kode, disalin):
+        """Node akhir kode setelah setiap node di jalurnya disalin (sekali per versi) atau dibuat"""
+        if self._akar not in disalin:
+            self._akar = self._node_baru(self._akar)
+            disalin.add(self._akar)
+        
+        node = self._akar
+        for char in kode:
+            slot = node * self._lebar + self._kolom[char]
+            anak = self._anak_mv[slot]
+            if anak not in disalin:
+                if not anak:
+                    self._node_hidup += 1
+                anak = self._node_baru(anak or None)
+                disalin.add(anak)
+                self._anak_mv[slot] = anak
+            node = anak
+        return node
+    
+    def dipadatkan(self):
+        """Trie baru berisi kode yang sama tanpa node dan kata sampah"""
+        padat = TrieArray(self.alfabet, self._node_hidup + 1)
+        for kode, kata in self.items():
+            padat.tambah(kode, kata)
+        return padat
+    
+    def akar(self):
+        """Node awal untuk penelusuran bertahap (cursor)"""
+        return self._akar
+    
+    def langkah(self, node, char):
+        """Satu langkah penelusuran dari node; None jika tidak ada cabang"""
+        kolom = self._kolom.get(char)
+        if kolom is None:
+            return None
+        anak = self._anak_mv[node * self._lebar + kolom]
+        return anak or None
+    
+    def cabang(self, node):
+        """Semua cabang dari node sebagai daftar (char, anak)"""
+        dasar = node * self._lebar
+        return [(self.alfabet[kolom], anak)
+                for kolom, anak in enumerate(self._anak_mv[dasar:dasar + self._lebar]) if anak]
+    
+    def kata_node(self, node):
+        """Kata pada node jika node adalah akhir kata"""
+        indeks = self._kata_mv[node]
+        return self._kata[indeks] if indeks >= 0 else None
+    
+    def cari(self, kode):
+        """Mencari kata berdasarkan kode lengkap"""
+        node = self._akar
+        for char in kode:
+            node = self.langkah(node, char)
+            if node is None:
+                return None
+        return self.kata_node(node)
+    
+    def cari_prefix(self, prefix):
+        """Mencari semua kata dengan prefix tertentu"""
+        node = self._akar
+        for char in prefix:
+            node = self.langkah(node, char)
+            if node is None:
+                return {}
+        
+        result = {}
+        stack = [(node, prefix)]
+        while stack:
+            node, kode = stack.pop()
+            kata = self.kata_node(node)
+            if kata is not None:
+                result[kode] = kata
+            dasar = node * self._lebar
+            for kolom in range(self._lebar - 1, -1, -1):
+                anak = self._anak_mv[dasar + kolom]
+                if anak:
+                    stack.append((anak, kode + self.alfabet[kolom]))
+        return result
+    
+    def items(self):
+        """Semua pasangan (kode, kata) di kamus"""
+        return self.cari_prefix("").items()
+    
+    def lengkapi(self, prefix, limit=None):
+        """Iterator lazy (kode, kata) berawalan prefix, kode terpendek lebih dulu"""
+        node = self._akar
+        for char in prefix:
+            node = self.langkah(node, char)
+            if node is None:
+                return iter(())
+        return self.lengkapi_dari(node, prefix, limit)
+    
+    def lengkapi_dari(self, node, prefix, limit=None):
+        """Seperti lengkapi, mulai dari node (mis. cursor) yang mewakili prefix"""
+        if limit is not None and limit <= K_CACHE_SARAN:
+            # Akhiran kode di-cache per node; prefix pemanggil ditambahkan saat dibaca
+            saran = self._saran.get(node)
+            if saran is None:
+                saran = list(islice(self._telusuri_lebar(node, ""), K_CACHE_SARAN))
+                self._saran[node] = saran
+            return ((prefix + akhiran, kata) for akhiran, kata in saran[:limit])
+        
+        hasil = self._telusuri_lebar(node, prefix)
+        return hasil if limit is None else islice(hasil, limit)
+    
+    def _telusuri_lebar(self, node, prefix):
+        """Breadth-first: urut panjang kode, lalu urutan alfabet"""
+        antrian = deque([(node, prefix)])
+        while antrian:
+            node, kode = antrian.popleft()
+            kata = self.kata_node(node)
+            if kata is not None:
+                yield kode, kata
+            dasar = node * self._lebar
+            for kolom in range(self._lebar):
+                anak = self._anak_mv[dasar + kolom]
+                if anak:
+                    antrian.append((anak, kode + self.alfabet[kolom]))
+    
+    def cari_terpanjang(self, rangkaian):
+        """Mencari terjemahan terpanjang yang cocok"""
+        return self.cocok_terpanjang(rangkaian)[1]
+    
+    def cocok_terpanjang(self, rangkaian, mulai=0):
+        """Kata terpanjang yang cocok mulai dari posisi mulai: (panjang, kata) atau (0, None)"""
+        anak_mv = self._anak_mv
+        kata_mv = self._kata_mv
+        kolom_dari = self._kolom
+        lebar = self._lebar
+        
+        node = self._akar
+        panjang = 0
+        indeks = -1
+        for i in range(mulai, len(rangkaian)):
+            kolom = kolom_dari.get(rangkaian[i])
+            if kolom is None:
+                break
+            node = anak_mv[node * lebar + kolom]
+            if not node:
+                break
+            if kata_mv[node] >= 0:
+                panjang = i - mulai + 1
+                indeks = kata_mv[node]
+        
+        return (panjang, self._kata[indeks]) if panjang else (0, None)
+    
+    def cocok_semua(self, rangkaian, mulai=0):
+        """Semua kata yang cocok mulai dari posisi mulai: daftar (panjang, kata)"""
+        node = self._akar
+        hasil = []
+        for i in range(mulai, len(rangkaian)):
+            node = self.langkah(node, rangkaian[i])
+            if node is None:
+                break
+            kata = self.kata_node(node)
+            if kata is not None:
+                hasil.append((i - mulai + 1, kata))
+        return hasil
+    
+    def ukuran_memori(self):
+        """Memori (byte) node yang terjangkau dari versi ini ditambah tabel kata"""
+        total = self._node_hidup * (self._lebar + 1) * self._tabel.anak.itemsize
+        return total + self._kata.ukuran_memori()
+
+
+def buat_trie(backend="dict", alfabet=ALFABET_DEFAULT):
+    """Membuat trie sesuai backend: "dict" (Trie) atau "array" (TrieArray)"""
+    if backend == "dict":
+        return Trie(alfabet)
+    if backend == "array":
+        return TrieArray(alfabet)
+    raise ValueError(f"Backend trie tidak dikenal: {backend}")
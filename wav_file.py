@@ -0,0 +1,90 @@
+import os
+import struct
+
+import numpy as np
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_IEEE_FLOAT = 3
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class WavFile:
+    """File WAV yang datanya dipetakan ke memori (np.memmap), tanpa membaca seluruh isi"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            header = file.read(12)
+            if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+                raise ValueError(f"{path} bukan file WAV")
+
+            fmt = None
+            while True:
+                chunk = file.read(8)
+                if len(chunk) < 8:
+                    raise ValueError(f"{path}: chunk data tidak ditemukan")
+                chunk_id, size = struct.unpack('<4sI', chunk)
+
+                if chunk_id == b'fmt ':
+                    fmt = file.read(size)
+                elif chunk_id == b'data':
+                    data_offset = file.tell()
+                    break
+                else:
+                    file.seek(size, os.SEEK_CUR)
+
+                # Chunk RIFF selalu rata ke 2 byte
+                if size % 2:
+                    file.seek(1, os.SEEK_CUR)
+
+        if fmt is None:
+            raise ValueError(f"{path}: chunk fmt tidak ditemukan")
+
+        format_tag, channels, sample_rate, _, block_align, bits = struct.unpack('<HHIIHH', fmt[:16])
+        if format_tag == WAVE_FORMAT_EXTENSIBLE:
+            format_tag = struct.unpack('<H', fmt[24:26])[0]
+
+        dtype, scale, bias = self._sample_format(format_tag, bits)
+
+        # Ukuran data pada header bisa salah untuk rekaman yang terpotong
+        data_size = min(size, os.path.getsize(path) - data_offset)
+        frames = data_size // block_align
+
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.frames = frames
+        self._scale = scale
+        self._bias = bias
+        self._data = np.memmap(
+            path, dtype=dtype, mode='r', offset=data_offset, shape=(frames, channels)
+        ) if frames else np.zeros((0, channels), dtype=dtype)
+
+    @staticmethod
+    def _sample_format(format_tag, bits):
+        """dtype, skala dan bias untuk konversi sampel ke float32 [-1, 1]"""
+        if format_tag == WAVE_FORMAT_PCM:
+            if bits == 8:
+                return np.uint8, 1.0 / 128, -128.0
+            if bits == 16:
+                return np.dtype('<i2'), 1.0 / 32768, 0.0
+            if bits == 32:
+                return np.dtype('<i4'), 1.0 / 2147483648, 0.0
+        elif format_tag == WAVE_FORMAT_IEEE_FLOAT:
+            if bits == 32:
+                return np.dtype('<f4'), 1.0, 0.0
+            if bits == 64:
+                return np.dtype('<f8'), 1.0, 0.0
+        raise ValueError(f"Format WAV tidak didukung (format={format_tag}, bits={bits})")
+
+    @property
+    def duration(self):
+        return self.frames / self.sample_rate
+
+    def read(self, start, stop, channel=0):
+        """Membaca sampel [start, stop) satu kanal sebagai float32"""
+        block = self._data[start:stop, channel].astype(np.float32)
+        if self._bias:
+            block += self._bias
+        if self._scale != 1.0:
+            block *= self._scale
+        return block